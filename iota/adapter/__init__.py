@@ -1,17 +1,22 @@
 
-import json
+import gzip
 from abc import ABCMeta, abstractmethod as abstract_method
 from asyncio import Future
 from collections import deque
 from inspect import isabstract as is_abstract
 from logging import DEBUG, Logger
 from socket import getdefaulttimeout as get_default_timeout
-from typing import Container, List, Optional, Tuple, Union, Any, Dict
-from httpx import AsyncClient, Response, codes, BasicAuth
+from typing import AsyncIterator, Container, List, Optional, Tuple, Union, \
+    Any, Dict, TYPE_CHECKING
+from httpx import AsyncClient, Limits, Response, codes, BasicAuth
 import asyncio
 
 from iota.exceptions import with_context
-from iota.json import JsonEncoder
+from iota.json import JsonArrayStreamDecoder, dumps as json_dumps, \
+    loads as json_loads
+
+if TYPE_CHECKING:
+    from iota.crypto.pearl_diver import PearlDiver
 
 __all__ = [
     'API_VERSION',
@@ -154,7 +159,14 @@ class BaseAdapter(object, metaclass=AdapterMeta):
         super(BaseAdapter, self).__init__()
 
         self._logger: Optional[Logger] = None
-        self.local_pow: bool = False
+        self.local_pow: Union[bool, str] = False
+        self.scan_window: Optional[int] = None
+        self.trusted: bool = False
+        self._pearl_diver: Optional['PearlDiver'] = None
+
+        # Node API limits, populated by
+        # :py:class:`iota.commands.ChunkedFilterCommand`.
+        self.api_limits: Optional[Dict[str, int]] = None
 
     @abstract_method
     def get_uri(self) -> str:
@@ -187,6 +199,58 @@ class BaseAdapter(object, metaclass=AdapterMeta):
             'Not implemented in {cls}.'.format(cls=type(self).__name__),
         )
 
+    async def stream_request(
+            self,
+            payload: dict,
+            key: str,
+            **kwargs: Any
+    ) -> AsyncIterator[list]:
+        """
+        Sends an API request to the node, and yields the members of one
+        of the response's array values as they arrive.
+
+        The default implementation waits for the entire response, and
+        yields all of the members at once.  Adapters that can decode the
+        response incrementally override this method to keep memory usage
+        bounded for very large responses.
+
+        :param payload:
+            JSON payload.
+
+        :param key:
+            Key of the array value to stream (e.g., ``'hashes'``).
+
+        :param kwargs:
+            Additional keyword arguments for the adapter.
+
+        :return:
+            Async iterator of lists of array members.
+
+        :raise:
+            - :py:class:`BadApiResponse` if a non-success response was
+              received.
+        """
+        response = await self.send_request(payload, **kwargs)
+
+        values = response.get(key) or []
+        if values:
+            yield values
+
+    async def aclose(self) -> None:
+        """
+        Releases any resources (e.g., network connections) held by the
+        adapter.
+
+        The adapter should not be used after it is closed.
+        """
+        pass
+
+    async def __aenter__(self) -> 'BaseAdapter':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def set_logger(self, logger: Logger) -> 'BaseAdapter':
         """
         Attaches a logger instance to the adapter.
@@ -208,15 +272,100 @@ class BaseAdapter(object, metaclass=AdapterMeta):
         if self._logger:
             self._logger.log(level, message, extra={'context': context or {}})
 
-    def set_local_pow(self, local_pow: bool) -> None:
+    def set_local_pow(self, local_pow: Union[bool, str]) -> None:
         """
         Sets the local_pow attribute of the adapter. If it is true,
         attach_to_tangle command calls external interface to perform
         pow, instead of sending the request to a node.
+        If the external interface is not installed, or if local_pow is
+        ``'builtin'``, the built-in :py:class:`iota.crypto.pearl_diver.PearlDiver`
+        is used instead.
         By default, it is set to false.
         """
+        if not local_pow:
+            # Any falsy value (e.g. ``None``) disables local PoW.
+            local_pow = False
+        elif local_pow not in (True, 'builtin'):
+            raise with_context(
+                exc=ValueError(
+                    '``local_pow`` must be ``True``, ``False`` or ``\'builtin\'``.',
+                ),
+
+                context={
+                    'local_pow': local_pow,
+                },
+            )
+
         self.local_pow = local_pow
 
+    def set_scan_window(self, scan_window: Optional[int]) -> None:
+        """
+        Sets the scan_window attribute of the adapter.  If it is set,
+        commands that scan the Tangle for used addresses check
+        ``scan_window`` addresses concurrently, instead of one at a time.
+        The window grows or shrinks depending on the
+        observed latency.
+        By default, it is set to ``None`` (one address at a time).
+        """
+        if scan_window is not None and (
+                not isinstance(scan_window, int) or scan_window < 1
+        ):
+            raise with_context(
+                exc=ValueError(
+                    '``scan_window`` must be ``None`` or a positive integer.',
+                ),
+
+                context={
+                    'scan_window': scan_window,
+                },
+            )
+
+        self.scan_window = scan_window
+
+    def set_trusted(self, trusted: bool) -> None:
+        """
+        Sets the trusted attribute of the adapter.  If it is true,
+        commands accept request values that already have the expected
+        type (e.g., :py:class:`iota.TransactionHash` objects) without
+        validating them again.  Values of any other type are still
+        validated.
+        By default, it is set to false.
+        """
+        if not isinstance(trusted, bool):
+            raise with_context(
+                exc=ValueError('``trusted`` must be ``True`` or ``False``.'),
+
+                context={
+                    'trusted': trusted,
+                },
+            )
+
+        self.trusted = trusted
+
+    def get_pearl_diver(self, create: bool = True) -> Optional['PearlDiver']:
+        """
+        Returns the :py:class:`iota.crypto.pearl_diver.PearlDiver` that
+        performs proof-of-work for this adapter, creating one with the
+        default settings if necessary.
+
+        :param bool create:
+            If ``False``, returns ``None`` instead of creating a new
+            instance.
+        """
+        if self._pearl_diver is None and create:
+            from iota.crypto.pearl_diver import PearlDiver
+            self._pearl_diver = PearlDiver()
+
+        return self._pearl_diver
+
+    def set_pearl_diver(self, pearl_diver: 'PearlDiver') -> None:
+        """
+        Sets the :py:class:`iota.crypto.pearl_diver.PearlDiver` that
+        performs proof-of-work for this adapter (e.g., to change the
+        number of worker processes).
+        """
+        self._pearl_diver = pearl_diver
+
 
 class HttpAdapter(BaseAdapter):
     """
@@ -234,6 +383,35 @@ class HttpAdapter(BaseAdapter):
     :param Optional[Tuple(str,str)] authentication:
         Credetentials for basic authentication with the node.
 
+    :param Optional[int] max_connections:
+        Max number of connections to the node.  Options that are
+        ``None`` default to :py:attr:`DEFAULT_LIMITS`.
+
+    :param Optional[int] max_keepalive_connections:
+        Max number of idle connections to keep open.
+
+    :param Optional[float] keepalive_expiry:
+        Number of seconds to keep idle connections open.
+
+    :param bool http2:
+        Whether to use HTTP/2, if the node supports it.  Requires the
+        ``http2`` extra (``pip install pyota[http2]``).
+
+    :param bool compression:
+        Whether to gzip-compress large request bodies.  Only enable this
+        if the node (or the proxy in front of it) accepts compressed
+        requests.
+
+    :param bool shared:
+        Whether to use a connection pool that is shared with every other
+        ``HttpAdapter`` for the same node (and the same connection
+        options), instead of creating a new one.  Shared pools stay open
+        until :py:meth:`aclose_shared_clients` is called.
+
+    :param Optional[AsyncClient] client:
+        ``httpx`` client to send requests with.  The adapter will not
+        close clients that are passed in.
+
     :return:
         :py:class:`HttpAdapter` object.
 
@@ -259,17 +437,41 @@ class HttpAdapter(BaseAdapter):
     in the ``headers`` kwarg.
     """
 
+    DEFAULT_LIMITS = {
+        'max_connections': 100,
+        'max_keepalive_connections': 20,
+        'keepalive_expiry': 5.0,
+    }
+    """
+    Connection pool limits used for options that aren't specified (same
+    as the ``httpx`` defaults).
+    """
+
+    COMPRESSION_THRESHOLD = 1024
+    """
+    Request bodies smaller than this (in bytes) are never compressed.
+    """
+
+    _shared_clients: Dict[tuple, AsyncClient] = {}
+
     def __init__(
             self,
             uri: Union[str, SplitResult],
             timeout: Optional[int] = None,
-            authentication: Optional[Tuple[str, str]] = None
+            authentication: Optional[Tuple[str, str]] = None,
+            max_connections: Optional[int] = None,
+            max_keepalive_connections: Optional[int] = None,
+            keepalive_expiry: Optional[float] = None,
+            http2: bool = False,
+            compression: bool = False,
+            shared: bool = False,
+            client: Optional[AsyncClient] = None,
     ) -> None:
         super(HttpAdapter, self).__init__()
 
-        self.client = AsyncClient()
         self.timeout = timeout
         self.authentication = authentication
+        self.compression = compression
 
         if isinstance(uri, str):
             uri: SplitResult = urlsplit(uri)
@@ -315,6 +517,89 @@ class HttpAdapter(BaseAdapter):
 
         self.uri = uri
 
+        # Only close clients that the adapter created.
+        self._owns_client = client is None and not shared
+
+        if client is None:
+            limits = dict(
+                self.DEFAULT_LIMITS,
+                **{
+                    name: value
+                    for name, value in (
+                        ('max_connections', max_connections),
+                        ('max_keepalive_connections', max_keepalive_connections),
+                        ('keepalive_expiry', keepalive_expiry),
+                    )
+                    if value is not None
+                }
+            )
+
+            options = {
+                'http2': http2,
+                'limits': Limits(**limits),
+            }
+
+            if shared:
+                client = self.get_shared_client(uri, **options)
+            else:
+                client = AsyncClient(**options)
+
+        self.client = client
+
+    @classmethod
+    def get_shared_client(
+            cls,
+            uri: Union[str, SplitResult],
+            http2: bool = False,
+            limits: Optional[Limits] = None,
+    ) -> AsyncClient:
+        """
+        Returns the shared ``httpx`` client for a node, creating it if
+        necessary.
+
+        Clients are shared between adapters that connect to the same
+        origin (scheme, host and port) with the same options.
+        """
+        if isinstance(uri, str):
+            uri = urlsplit(uri)
+
+        if limits is None:
+            limits = Limits(**cls.DEFAULT_LIMITS)
+
+        key = (
+            uri.scheme,
+            uri.hostname,
+            uri.port,
+            http2,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        )
+
+        client = cls._shared_clients.get(key)
+        if client is None or client.is_closed:
+            client = cls._shared_clients[key] = AsyncClient(
+                http2=http2,
+                limits=limits,
+            )
+
+        return client
+
+    @classmethod
+    async def aclose_shared_clients(cls) -> None:
+        """
+        Closes every shared ``httpx`` client.
+        """
+        clients = list(cls._shared_clients.values())
+        cls._shared_clients.clear()
+
+        for client in clients:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
     @property
     def node_url(self) -> str:
         """
@@ -326,33 +611,105 @@ class HttpAdapter(BaseAdapter):
         return self.uri.geturl()
 
     async def send_request(self, payload: dict, **kwargs: Any) -> dict:
-        kwargs.setdefault('headers', {})
-        for key, value in self.DEFAULT_HEADERS.items():
-            kwargs['headers'].setdefault(key, value)
+        body = self._encode_payload(payload, kwargs)
 
         response = await self._send_http_request(
-            # Use a custom JSON encoder that knows how to convert Tryte
-            # values.
-            payload=JsonEncoder().encode(payload),
-
+            payload=body,
             url=self.node_url,
             **kwargs
         )
 
         return self._interpret_response(response, payload, {codes['OK']})
 
-    async def _send_http_request(
+    async def stream_request(
             self,
-            url: str,
-            payload: Optional[str],
-            method: str = 'post',
+            payload: dict,
+            key: str,
             **kwargs: Any
-    ) -> Response:
+    ) -> AsyncIterator[list]:
         """
-        Sends the actual HTTP request.
+        Sends an API request to the node, and yields the members of one
+        of the response's array values as they arrive.
 
-        Split into its own method so that it can be mocked during unit
-        tests.
+        The response body is decoded incrementally, so only the members
+        that have not been consumed yet are held in memory.
+        """
+        body = self._encode_payload(payload, kwargs)
+        self._set_request_defaults(kwargs)
+
+        self._log(
+            level=DEBUG,
+
+            message='Streaming post to {url}: {payload!r}'.format(
+                payload=body,
+                url=self.node_url,
+            ),
+
+            context={
+                'request_method': 'post',
+                'request_kwargs': kwargs,
+                'request_payload': body,
+                'request_url': self.node_url,
+            },
+        )
+
+        async with self.client.stream(
+                method='post',
+                url=self.node_url,
+                content=body,
+                **kwargs
+        ) as response:
+            if response.status_code != codes['OK']:
+                await response.aread()
+
+                # Raises an exception describing the error response.
+                self._interpret_response(response, payload, {codes['OK']})
+
+            decoder = JsonArrayStreamDecoder(key)
+
+            try:
+                async for chunk in response.aiter_bytes():
+                    values = decoder.feed(chunk)
+                    if values:
+                        yield values
+
+                decoder.close()
+            except ValueError as e:
+                raise with_context(
+                    exc=BadApiResponse(
+                        'Malformed {status} response from node: {error}'.format(
+                            error=e,
+                            status=response.status_code,
+                        ),
+                    ),
+
+                    context={
+                        'request': payload,
+                    },
+                )
+
+    def _encode_payload(self, payload: dict, kwargs: dict) -> bytes:
+        """
+        Encodes the request payload, and adds the corresponding headers
+        to ``kwargs``.
+        """
+        kwargs.setdefault('headers', {})
+        for key, value in self.DEFAULT_HEADERS.items():
+            kwargs['headers'].setdefault(key, value)
+
+        # Use a JSON encoder that knows how to convert Tryte values.
+        body: bytes = json_dumps(payload)
+
+        if self.compression and len(body) >= self.COMPRESSION_THRESHOLD:
+            body = gzip.compress(body)
+            kwargs['headers'].setdefault('Content-Encoding', 'gzip')
+
+        return body
+
+    def _set_request_defaults(self, kwargs: dict) -> None:
+        """
+        Adds the adapter's timeout and authentication settings to the
+        keyword arguments for an HTTP request.
         """
         kwargs.setdefault(
             'timeout',
@@ -362,6 +719,21 @@ class HttpAdapter(BaseAdapter):
         if self.authentication:
             kwargs.setdefault('auth', BasicAuth(*self.authentication))
 
+    async def _send_http_request(
+            self,
+            url: str,
+            payload: Optional[Union[str, bytes]],
+            method: str = 'post',
+            **kwargs: Any
+    ) -> Response:
+        """
+        Sends the actual HTTP request.
+
+        Split into its own method so that it can be mocked during unit
+        tests.
+        """
+        self._set_request_defaults(kwargs)
+
         self._log(
             level=DEBUG,
 
@@ -422,7 +794,9 @@ class HttpAdapter(BaseAdapter):
             The response should match one of these status codes to be
             considered valid.
         """
-        raw_content = response.text
+        # Decode straight from the raw bytes; the JSON backend handles
+        # UTF-8 faster than ``response.text`` would.
+        raw_content = response.content
         if not raw_content:
             raise with_context(
                 exc=BadApiResponse(
@@ -437,21 +811,20 @@ class HttpAdapter(BaseAdapter):
             )
 
         try:
-            decoded: dict = json.loads(raw_content)
-        # :bc: py2k doesn't have JSONDecodeError
+            decoded: dict = json_loads(raw_content)
         except ValueError:
             raise with_context(
                 exc=BadApiResponse(
                     'Non-JSON {status} response from node: '
                     '{raw_content}'.format(
                         status=response.status_code,
-                        raw_content=raw_content,
+                        raw_content=response.text,
                     )
                 ),
 
                 context={
                     'request': payload,
-                    'raw_response': raw_content,
+                    'raw_response': response.text,
                 },
             )
 
@@ -1,9 +1,23 @@
+import asyncio
+import json
+import sqlite3
 from abc import ABCMeta, abstractmethod as abstract_method
-from typing import Dict, Any
-
-from iota.adapter import AdapterSpec, BaseAdapter, resolve_adapter
+from collections import OrderedDict, deque
+from copy import deepcopy
+from logging import WARNING
+from threading import RLock
+from time import monotonic
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from iota.adapter import AdapterSpec, BadApiResponse, BaseAdapter, \
+    resolve_adapter
+from iota.exceptions import with_context
+from iota.json import JsonEncoder
 
 __all__ = [
+    'BatchingWrapper',
+    'CachingWrapper',
+    'PoolWrapper',
     'RoutingWrapper',
 ]
 
@@ -25,6 +39,9 @@ class BaseWrapper(BaseAdapter, metaclass=ABCMeta):
     def get_uri(self) -> str:
         return self.adapter.get_uri()
 
+    async def aclose(self) -> None:
+        await self.adapter.aclose()
+
     @abstract_method
     def send_request(self, payload: dict, **kwargs: Any) -> dict:
         raise NotImplementedError(
@@ -131,7 +148,852 @@ class RoutingWrapper(BaseWrapper):
         """
         return self.routes.get(command, self.adapter)
 
+    async def aclose(self) -> None:
+        adapters = [self.adapter]
+        for adapter in self.routes.values():
+            if all(adapter is not a for a in adapters):
+                adapters.append(adapter)
+
+        for adapter in adapters:
+            await adapter.aclose()
+
     async def send_request(self, payload: dict, **kwargs: Any) -> dict:
         command = payload.get('command')
 
         return await self.get_adapter(command).send_request(payload, **kwargs)
+
+
+class CachingWrapper(BaseWrapper):
+    """
+    Caches responses from the node, so that repeated requests for the
+    same data don't have to go over the network.
+
+    - ``getTrytes`` results are cached per transaction hash (transaction
+      trytes never change), in a memory LRU cache and, optionally, on
+      disk.  Only the hashes that are not cached are requested from the
+      node.
+    - Responses to the commands in ``ttls`` (by default
+      ``getNodeInfo``, ``getNodeAPIConfiguration`` and ``getBalances``)
+      are reused for a short time.
+
+    Other commands are passed through to the wrapped adapter.
+
+    :param AdapterSpec adapter:
+        The adapter to send requests to.
+
+    :param int max_size:
+        Max number of transactions to keep in memory.
+
+    :param Optional[str] path:
+        Path to an SQLite database used to persist transaction trytes
+        between runs (created if necessary).  If ``None``, transactions
+        are only cached in memory.
+
+    :param Optional[Dict[str, float]] ttls:
+        Number of seconds to cache responses for, by command name.
+        Defaults to :py:attr:`DEFAULT_TTLS`.
+
+    :return:
+        :py:class:`CachingWrapper` object.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from iota import Iota
+        from iota.adapter.wrappers import CachingWrapper
+
+        api = Iota(
+          CachingWrapper(
+            'https://nodes.thetangle.org:443',
+            path = 'transactions.db',
+          ),
+        )
+
+        # Responses cached for ``getBalances`` are out of date once you
+        # know that the balances changed:
+        api.adapter.invalidate('getBalances')
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        'getBalances': 5.0,
+        'getNodeAPIConfiguration': 60.0,
+        'getNodeInfo': 5.0,
+    }
+    """
+    Default number of seconds to cache responses for, by command name.
+    """
+
+    INVALIDATED_BY: Dict[str, Tuple[str, ...]] = {
+        'broadcastTransactions': ('getBalances',),
+        'storeTransactions': ('getBalances',),
+    }
+    """
+    Cached responses that are discarded when the node accepts a command.
+    """
+
+    def __init__(
+            self,
+            adapter: AdapterSpec,
+            max_size: int = 10000,
+            path: Optional[str] = None,
+            ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        super(CachingWrapper, self).__init__(adapter)
+
+        self.max_size = max_size
+        self.path = path
+        self.ttls = self.DEFAULT_TTLS if ttls is None else ttls
+
+        self.hits = 0
+        """
+        Number of transactions served from the cache.
+        """
+
+        self.misses = 0
+        """
+        Number of transactions requested from the node.
+        """
+
+        self._trytes: 'OrderedDict[str, str]' = OrderedDict()
+        self._responses: Dict[str, Tuple[float, dict]] = {}
+
+        # The synchronous API runs requests on a separate thread, so
+        # access to the cache is serialized by ``_lock``.
+        self._lock = RLock()
+
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+
+            with self._lock, self._connection:
+                self._connection.execute(
+                    'CREATE TABLE IF NOT EXISTS transactions ('
+                    '  hash TEXT PRIMARY KEY,'
+                    '  trytes TEXT NOT NULL'
+                    ')'
+                )
+
+    async def send_request(self, payload: dict, **kwargs: Any) -> dict:
+        command = payload.get('command')
+
+        if command == 'getTrytes':
+            return await self._get_trytes(payload, **kwargs)
+
+        if command in self.ttls:
+            return await self._get_cached_response(payload, **kwargs)
+
+        response = await self.adapter.send_request(payload, **kwargs)
+
+        for invalidated in self.INVALIDATED_BY.get(command, ()):
+            self.invalidate(invalidated)
+
+        return response
+
+    def invalidate(self, command: Optional[str] = None) -> None:
+        """
+        Discards cached responses.
+
+        :param Optional[str] command:
+            Only discard cached responses to this command (e.g.
+            ``getBalances``).  If ``None``, every cached response is
+            discarded.
+
+            Cached transaction trytes are not affected; use
+            :py:meth:`invalidate_trytes` instead.
+        """
+        with self._lock:
+            if command is None:
+                self._responses.clear()
+            else:
+                self._responses = {
+                    key: value
+                    for key, value in self._responses.items()
+                    if not key.startswith(command + ':')
+                }
+
+    def invalidate_trytes(self, hashes: Optional[Iterable[str]] = None) -> None:
+        """
+        Discards cached transaction trytes (in memory and on disk).
+
+        :param Optional[Iterable[str]] hashes:
+            Transaction hashes to discard.  If ``None``, every cached
+            transaction is discarded.
+        """
+        with self._lock:
+            if hashes is None:
+                self._trytes.clear()
+
+                if self._connection:
+                    with self._connection:
+                        self._connection.execute('DELETE FROM transactions')
+            else:
+                hashes = [str(hash_) for hash_ in hashes]
+
+                for hash_ in hashes:
+                    self._trytes.pop(hash_, None)
+
+                if self._connection:
+                    with self._connection:
+                        self._connection.executemany(
+                            'DELETE FROM transactions WHERE hash = ?',
+                            [(hash_,) for hash_ in hashes],
+                        )
+
+    def close(self) -> None:
+        """
+        Closes the on-disk cache, if any.
+        """
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    async def aclose(self) -> None:
+        self.close()
+        await super(CachingWrapper, self).aclose()
+
+    async def _get_trytes(self, payload: dict, **kwargs: Any) -> dict:
+        """
+        Handles ``getTrytes`` requests, only fetching the transactions
+        that aren't cached.
+        """
+        hashes: List[str] = [str(hash_) for hash_ in payload['hashes']]
+
+        found: Dict[str, str] = {}
+        for hash_ in hashes:
+            trytes = self._get_cached_trytes(hash_)
+            if trytes is not None:
+                found[hash_] = trytes
+
+        missing = list(OrderedDict.fromkeys(
+            hash_ for hash_ in hashes if hash_ not in found
+        ))
+
+        self.hits += len(hashes) - len(missing)
+        self.misses += len(missing)
+
+        response: dict = {'duration': 0}
+        if missing:
+            response = await self.adapter.send_request(
+                dict(payload, hashes=missing),
+                **kwargs
+            )
+
+            fetched = dict(zip(missing, response['trytes']))
+            found.update(fetched)
+            self._set_cached_trytes(fetched)
+
+        return dict(response, trytes=[found[hash_] for hash_ in hashes])
+
+    def _get_cached_trytes(self, hash_: str) -> Optional[str]:
+        """
+        Returns the cached trytes for a transaction, or ``None`` if the
+        transaction isn't cached.
+        """
+        with self._lock:
+            trytes = self._trytes.get(hash_)
+
+            if trytes is not None:
+                self._trytes.move_to_end(hash_)
+                return trytes
+
+            if self._connection:
+                row = self._connection.execute(
+                    'SELECT trytes FROM transactions WHERE hash = ?',
+                    (hash_,),
+                ).fetchone()
+
+                if row is not None:
+                    self._set_cached_trytes({hash_: row[0]}, persist=False)
+                    return row[0]
+
+        return None
+
+    def _set_cached_trytes(
+            self,
+            trytes: Dict[str, str],
+            persist: bool = True,
+    ) -> None:
+        """
+        Adds transaction trytes to the cache.
+        """
+        # If the node doesn't know a transaction, it returns 9s; don't
+        # cache these, in case the transaction shows up later.
+        trytes = {
+            hash_: str(txn_trytes)
+            for hash_, txn_trytes in trytes.items()
+            if str(txn_trytes).strip('9')
+        }
+
+        with self._lock:
+            for hash_, txn_trytes in trytes.items():
+                self._trytes[hash_] = txn_trytes
+                self._trytes.move_to_end(hash_)
+
+            while len(self._trytes) > self.max_size:
+                self._trytes.popitem(last=False)
+
+            if persist and self._connection and trytes:
+                with self._connection:
+                    self._connection.executemany(
+                        'INSERT OR REPLACE INTO transactions (hash, trytes) '
+                        'VALUES (?, ?)',
+                        trytes.items(),
+                    )
+
+    async def _get_cached_response(self, payload: dict, **kwargs: Any) -> dict:
+        """
+        Handles requests for commands with a TTL.
+        """
+        command = payload['command']
+        key = '{command}:{payload}'.format(
+            command=command,
+            payload=json.dumps(payload, cls=JsonEncoder, sort_keys=True),
+        )
+
+        with self._lock:
+            cached = self._responses.get(key)
+
+        if cached is not None and cached[0] > monotonic():
+            return deepcopy(cached[1])
+
+        response = await self.adapter.send_request(payload, **kwargs)
+
+        now = monotonic()
+
+        with self._lock:
+            # Discard expired responses, so that they don't pile up
+            # (e.g., ``getBalances`` for many different addresses).
+            self._responses = {
+                key_: value
+                for key_, value in self._responses.items()
+                if value[0] > now
+            }
+
+            self._responses[key] = (now + self.ttls[command], response)
+
+        return deepcopy(response)
+
+
+class NodeStats(object):
+    """
+    Health statistics for a node in a :py:class:`PoolWrapper`.
+    """
+
+    def __init__(self, adapter: BaseAdapter, window: int) -> None:
+        super(NodeStats, self).__init__()
+
+        self.adapter = adapter
+
+        self.latency: Optional[float] = None
+        """
+        Moving average of the response time (seconds).
+        """
+
+        self.error_rate = 0.0
+        """
+        Moving average of the fraction of requests that failed.
+        """
+
+        self.failures = 0
+        """
+        Number of consecutive failed requests.
+        """
+
+        self.ejected_until: Optional[float] = None
+        """
+        When the node may be probed again, if it has been ejected.
+        """
+
+        self.samples: deque = deque(maxlen=window)
+        """
+        Most recent response times, used to compute hedging deadlines.
+        """
+
+    def get_score(self) -> float:
+        """
+        Returns the score used to rank nodes (lower is better).
+        """
+        # Nodes without samples go first, so that every node gets a
+        # chance to prove itself.
+        if self.latency is None:
+            return 0.0
+
+        return self.latency * (1.0 + 10.0 * self.error_rate)
+
+    def get_deadline(self, percentile: float) -> Optional[float]:
+        """
+        Returns the response time that ``percentile`` of requests to the
+        node complete within, or ``None`` if there isn't enough data.
+        """
+        if len(self.samples) < 10:
+            return None
+
+        samples = sorted(self.samples)
+        return samples[min(int(len(samples) * percentile), len(samples) - 1)]
+
+
+class PoolWrapper(BaseWrapper):
+    """
+    Spreads requests across a pool of nodes, sending each request to the
+    node that currently responds fastest.
+
+    - The wrapper tracks each node's average latency and error rate.
+    - If a read-only request takes longer than usual for the selected
+      node (see ``hedge_percentile``), a duplicate request is sent to the
+      next-best node, and whichever response arrives first is used.
+    - If a node fails to respond (e.g., connection errors), read-only
+      requests are retried on the next node.  After ``max_failures``
+      consecutive failures, the node is ejected from the pool for
+      ``eject_time`` seconds.  After that, the node is probed: if the
+      next request to it succeeds, it rejoins the pool; if it fails, the
+      node is ejected again.
+
+    Error responses from a node (:py:class:`iota.adapter.BadApiResponse`)
+    are returned to the caller as usual; they do not count as failures.
+
+    :param Iterable[AdapterSpec] adapters:
+        URIs or adapters for the nodes in the pool.
+
+    :param float hedge_percentile:
+        Percentile of the selected node's recent response times after
+        which a duplicate request is sent to another node.  Set to
+        ``None`` to disable hedged requests.
+
+    :param float alpha:
+        Smoothing factor for the latency and error rate moving averages
+        (higher values favor recent requests).
+
+    :param int max_failures:
+        Number of consecutive failures after which a node is ejected.
+
+    :param float eject_time:
+        Number of seconds before an ejected node is probed again.
+
+    :return:
+        :py:class:`PoolWrapper` object.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from iota import Iota
+        from iota.adapter.wrappers import PoolWrapper
+
+        api = Iota(
+          PoolWrapper([
+            'https://nodes.thetangle.org:443',
+            'https://nodes.iota.org:443',
+            'http://localhost:14265',
+          ]),
+        )
+    """
+
+    IDEMPOTENT_COMMANDS = frozenset({
+        'checkConsistency',
+        'findTransactions',
+        'getBalances',
+        'getInclusionStates',
+        'getNeighbors',
+        'getNodeAPIConfiguration',
+        'getNodeInfo',
+        'getTips',
+        'getTransactionsToApprove',
+        'getTrytes',
+        'wereAddressesSpentFrom',
+    })
+    """
+    Commands that are safe to send to more than one node.
+    """
+
+    def __init__(
+            self,
+            adapters: Iterable[AdapterSpec],
+            hedge_percentile: Optional[float] = 0.95,
+            alpha: float = 0.3,
+            max_failures: int = 3,
+            eject_time: float = 30.0,
+    ) -> None:
+        adapters = [
+            adapter if isinstance(adapter, BaseAdapter)
+            else resolve_adapter(adapter)
+            for adapter in adapters
+        ]
+
+        if not adapters:
+            raise with_context(
+                exc=ValueError('``adapters`` must not be empty.'),
+
+                context={
+                    'adapters': adapters,
+                },
+            )
+
+        super(PoolWrapper, self).__init__(adapters[0])
+
+        self.hedge_percentile = hedge_percentile
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.eject_time = eject_time
+
+        self.nodes: List[NodeStats] = [
+            NodeStats(adapter, window=100) for adapter in adapters
+        ]
+
+    def get_uri(self) -> str:
+        return ', '.join(node.adapter.get_uri() for node in self.nodes)
+
+    async def aclose(self) -> None:
+        for node in self.nodes:
+            await node.adapter.aclose()
+
+    def get_nodes(self) -> List[NodeStats]:
+        """
+        Returns the nodes that may receive requests, best first.
+
+        If every node has been ejected, the nodes are returned anyway, so
+        that requests can still be attempted.
+        """
+        now = monotonic()
+
+        available = [
+            node for node in self.nodes
+            if node.ejected_until is None or node.ejected_until <= now
+        ]
+
+        return sorted(available or self.nodes, key=NodeStats.get_score)
+
+    async def send_request(self, payload: dict, **kwargs: Any) -> dict:
+        command = payload.get('command')
+        nodes = self.get_nodes()
+
+        if command not in self.IDEMPOTENT_COMMANDS:
+            return await self._send_to_node(nodes[0], payload, **kwargs)
+
+        error: Optional[Exception] = None
+
+        while nodes:
+            primary = nodes.pop(0)
+            task = asyncio.ensure_future(
+                self._send_to_node(primary, payload, **kwargs),
+            )
+
+            deadline = None
+            if self.hedge_percentile is not None and nodes:
+                deadline = primary.get_deadline(self.hedge_percentile)
+
+            if deadline is not None:
+                done, _ = await asyncio.wait([task], timeout=deadline)
+
+                if not done:
+                    # The node is slower than usual; ask the next-best
+                    # node as well, and use whichever responds first.
+                    secondary = nodes.pop(0)
+                    hedge = asyncio.ensure_future(
+                        self._send_to_node(secondary, payload, **kwargs),
+                    )
+
+                    try:
+                        return await self._first_response(task, hedge)
+                    except BadApiResponse:
+                        raise
+                    except Exception as e:
+                        error = e
+                        continue
+
+            try:
+                return await task
+            except BadApiResponse:
+                raise
+            except Exception as e:
+                # Try the next node.
+                error = e
+
+        raise error
+
+    @staticmethod
+    async def _first_response(*tasks: asyncio.Future) -> dict:
+        """
+        Returns the first successful result from ``tasks``, cancelling
+        the others.
+        """
+        pending = set(tasks)
+        error: Optional[Exception] = None
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                for task in done:
+                    try:
+                        return task.result()
+                    except BadApiResponse:
+                        raise
+                    except Exception as e:
+                        error = e
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    async def _send_to_node(
+            self,
+            node: NodeStats,
+            payload: dict,
+            **kwargs: Any
+    ) -> dict:
+        """
+        Sends a request to a node, and updates the node's statistics.
+        """
+        started = monotonic()
+
+        try:
+            response = await node.adapter.send_request(payload, **kwargs)
+        except asyncio.CancelledError:
+            # A hedged request won the race, or the caller gave up; we
+            # learned nothing about this node, so leave its stats alone.
+            raise
+        except BadApiResponse:
+            # The node responded, even if it didn't like the request.
+            self._record(node, monotonic() - started, failed=False)
+            raise
+        except Exception:
+            self._record(node, monotonic() - started, failed=True)
+            raise
+
+        self._record(node, monotonic() - started, failed=False)
+        return response
+
+    def _record(self, node: NodeStats, elapsed: float, failed: bool) -> None:
+        """
+        Updates a node's statistics after a request.
+        """
+        node.error_rate += self.alpha * (float(failed) - node.error_rate)
+
+        if failed:
+            node.failures += 1
+
+            if node.failures >= self.max_failures:
+                node.ejected_until = monotonic() + self.eject_time
+
+                self._log(
+                    level=WARNING,
+                    message='Ejecting node {uri} from the pool.'.format(
+                        uri=node.adapter.get_uri(),
+                    ),
+                    context={
+                        'failures': node.failures,
+                        'error_rate': node.error_rate,
+                    },
+                )
+            return
+
+        node.failures = 0
+        node.ejected_until = None
+
+        node.samples.append(elapsed)
+
+        if node.latency is None:
+            node.latency = elapsed
+        else:
+            node.latency += self.alpha * (elapsed - node.latency)
+
+
+class BatchingWrapper(BaseWrapper):
+    """
+    Combines concurrent requests into fewer requests to the node.
+
+    - Requests for the commands in :py:attr:`BATCHED_COMMANDS` (e.g.
+      ``getTrytes``) are buffered for up to ``window`` seconds (or until
+      ``max_items`` items are buffered), then sent to the node as a
+      single request.  Duplicate items are only requested once.  Each
+      caller receives a response that only contains its own items.
+    - Identical read-only requests that are in flight at the same time
+      share a single request to the node.
+
+    :param AdapterSpec adapter:
+        The adapter to send requests to.
+
+    :param float window:
+        Number of seconds to buffer requests for.
+
+    :param int max_items:
+        Max number of items to send in a single request; the buffer is
+        sent as soon as it reaches this size.
+
+    :return:
+        :py:class:`BatchingWrapper` object.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from iota import AsyncIota
+        from iota.adapter.wrappers import BatchingWrapper
+
+        api = AsyncIota(BatchingWrapper('https://nodes.thetangle.org:443'))
+    """
+
+    BATCHED_COMMANDS: Dict[str, Tuple[str, str]] = {
+        'getBalances': ('addresses', 'balances'),
+        'getInclusionStates': ('transactions', 'states'),
+        'getTrytes': ('hashes', 'trytes'),
+        'wereAddressesSpentFrom': ('addresses', 'states'),
+    }
+    """
+    Commands that can be batched, with the name of the request parameter
+    that contains the items and the response value that contains the
+    results (in the same order).
+    """
+
+    SHARED_COMMANDS = frozenset({
+        'findTransactions',
+        'getNeighbors',
+        'getNodeAPIConfiguration',
+        'getNodeInfo',
+        'getTips',
+    }) | frozenset(BATCHED_COMMANDS)
+    """
+    Commands for which identical in-flight requests are shared.
+    """
+
+    def __init__(
+            self,
+            adapter: AdapterSpec,
+            window: float = 0.002,
+            max_items: int = 1000,
+    ) -> None:
+        super(BatchingWrapper, self).__init__(adapter)
+
+        self.window = window
+        self.max_items = max_items
+
+        self._batches: Dict[str, _Batch] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+    async def send_request(self, payload: dict, **kwargs: Any) -> dict:
+        command = payload.get('command')
+
+        if kwargs or command not in self.SHARED_COMMANDS:
+            return await self.adapter.send_request(payload, **kwargs)
+
+        key = json.dumps(payload, cls=JsonEncoder, sort_keys=True)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            if command in self.BATCHED_COMMANDS:
+                future = asyncio.ensure_future(self._add_to_batch(payload))
+            else:
+                future = asyncio.ensure_future(
+                    self.adapter.send_request(payload),
+                )
+
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Every caller gets its own copy of the response, in case it
+        # gets modified.
+        return deepcopy(await asyncio.shield(future))
+
+    async def _add_to_batch(self, payload: dict) -> dict:
+        """
+        Adds a request to the buffer, and waits for the response.
+        """
+        items_param, results_param = self.BATCHED_COMMANDS[payload['command']]
+
+        # Only requests with the same parameters (other than the items)
+        # can be combined.
+        key = json.dumps(
+            {k: v for k, v in payload.items() if k != items_param},
+            cls=JsonEncoder,
+            sort_keys=True,
+        )
+
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(payload, items_param)
+            batch.timer = asyncio.get_event_loop().call_later(
+                self.window,
+                self._flush,
+                key,
+            )
+
+        items = payload[items_param]
+        future = batch.add(items)
+
+        if len(batch.items) >= self.max_items:
+            self._flush(key)
+
+        response = await future
+
+        results = dict(zip(batch.items, response[results_param]))
+
+        return dict(
+            response,
+            **{results_param: [results[str(item)] for item in items]}
+        )
+
+    def _flush(self, key: str) -> None:
+        """
+        Sends buffered requests to the node.
+        """
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+
+        batch.timer.cancel()
+
+        payload = dict(batch.payload)
+        payload[batch.items_param] = list(batch.items.values())
+
+        task = asyncio.ensure_future(self.adapter.send_request(payload))
+        task.add_done_callback(batch.resolve)
+
+
+class _Batch(object):
+    """
+    Requests buffered by :py:class:`BatchingWrapper`.
+    """
+
+    def __init__(self, payload: dict, items_param: str) -> None:
+        super(_Batch, self).__init__()
+
+        self.payload = payload
+        self.items_param = items_param
+
+        self.items: Dict[str, Any] = OrderedDict()
+        self.futures: List[asyncio.Future] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    def add(self, items: Iterable[Any]) -> asyncio.Future:
+        """
+        Adds items to the batch, and returns a future that resolves to
+        the response for the whole batch.
+        """
+        for item in items:
+            self.items.setdefault(str(item), item)
+
+        future = asyncio.get_event_loop().create_future()
+        self.futures.append(future)
+        return future
+
+    def resolve(self, task: asyncio.Future) -> None:
+        """
+        Passes the response (or error) for the batch to every request in
+        the batch.
+        """
+        for future in self.futures:
+            if future.done():
+                continue
+
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
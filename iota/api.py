@@ -1,9 +1,11 @@
-from typing import Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from iota import AdapterSpec, Address, BundleHash, ProposedTransaction, Tag, \
     TransactionHash, TransactionTrytes, TryteString, TrytesCompatible
 from iota.crypto.addresses import AddressGenerator
+from iota.exceptions import with_context
 from iota.api_async import AsyncStrictIota, AsyncIota
+from iota.runner import EventLoopRunner, get_runner
 import asyncio
 
 __all__ = [
@@ -27,7 +29,7 @@ class InvalidCommand(ValueError):
 # def make_synchronous(new_name, async_class: type):
 #   def make_sync(method):
 #     def sync_version(*args, **kwargs):
-#       return asyncio.get_event_loop().run_until_complete(method(*args, **kwargs))
+#       return get_runner().run(method(*args, **kwargs))
 #     return sync_version
 
 #   return type(new_name, (async_class,), {
@@ -63,11 +65,15 @@ class StrictIota(AsyncStrictIota):
         On the devnet, minimum weight magnitude is set to 9, on mainnet
         it is 1 by default.
 
-    :param Optional[bool] local_pow:
+    :param Optional[Union[bool, str]] local_pow:
         Whether to perform proof-of-work locally by redirecting all calls
         to :py:meth:`attach_to_tangle` to
         `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+        If the extension is not installed, or if ``local_pow`` is
+        ``'builtin'``, the built-in
+        :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
             See :ref:`README:Optional Local Pow` for more info and
             :ref:`find out<pow-label>` how to use it.
 
@@ -77,7 +83,7 @@ class StrictIota(AsyncStrictIota):
             self,
             adapter: AdapterSpec,
             devnet: bool = False,
-            local_pow: bool = False
+            local_pow: Union[bool, str] = False
     ) -> None:
         """
         :param AdapterSpec adapter:
@@ -88,16 +94,123 @@ class StrictIota(AsyncStrictIota):
             On the devnet, minimum weight magnitude is set to 9, on mainnet
             it is 1 by default.
 
-        :param Optional[bool] local_pow:
+        :param Optional[Union[bool, str]] local_pow:
             Whether to perform proof-of-work locally by redirecting all calls
             to :py:meth:`attach_to_tangle` to
             `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+            If the extension is not installed, or if ``local_pow`` is
+            ``'builtin'``, the built-in
+            :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
                 See :ref:`README:Optional Local Pow` for more info and
                 :ref:`find out<pow-label>` how to use it.
         """
         super().__init__(adapter, devnet, local_pow)
 
+    runner: Optional[EventLoopRunner] = None
+    """
+    Runs the coroutines behind the synchronous API methods.
+
+    If ``None``, the default runner (see
+    :py:func:`iota.runner.get_runner`) is used, so that every sync API
+    instance shares a single background event loop.
+    """
+
+    def _run(self, coro):
+        """
+        Runs a coroutine and waits for its result.
+        """
+        return (self.runner or get_runner()).run(coro)
+
+    def map(
+            self,
+            method: Union[str, Callable],
+            arg_list: Iterable[Any],
+            concurrency: int = 8,
+    ) -> List[Any]:
+        """
+        Calls an API method once for each set of arguments, running up to
+        ``concurrency`` calls at a time.
+
+        Example::
+
+            results = api.map(
+                'get_balances',
+                [{'addresses': chunk} for chunk in address_chunks],
+                concurrency=4,
+            )
+
+        :param Union[str, Callable] method:
+            Name of the API method to call (e.g. ``'get_trytes'``), or the
+            method itself (e.g. ``api.get_trytes``).
+
+        :param Iterable arg_list:
+            Arguments for each call.  Each item can be:
+
+            - a ``dict`` of keyword arguments,
+            - a ``tuple`` of positional arguments,
+            - any other value, used as the only positional argument.
+
+        :param int concurrency:
+            Max number of calls in progress at once.
+
+        :return:
+            List of results, in the same order as ``arg_list``.
+            If any call raises an exception, it is re-raised here.
+        """
+        if concurrency < 1:
+            raise with_context(
+                exc=ValueError('``concurrency`` must be >= 1.'),
+
+                context={
+                    'concurrency': concurrency,
+                },
+            )
+
+        name = method if isinstance(method, str) else method.__name__
+
+        # Use the async implementation of the method, so that the calls
+        # can share the runner's event loop.
+        async_method = getattr(super(StrictIota, self), name)
+
+        async def run_all() -> List[Any]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def call(args: Any) -> Any:
+                async with semaphore:
+                    if isinstance(args, dict):
+                        return await async_method(**args)
+
+                    if isinstance(args, tuple):
+                        return await async_method(*args)
+
+                    return await async_method(args)
+
+            return list(await asyncio.gather(*map(call, arg_list)))
+
+        return self._run(run_all())
+
+    def close(self) -> None:
+        """
+        Closes the adapter, releasing its network connections.
+
+        The API instance should not be used after it is closed.  You can
+        also use the API instance as a context manager::
+
+            with Iota('https://nodes.thetangle.org:443') as api:
+                ...
+
+        :returns: None
+        """
+        self._run(super().aclose())
+
+    def __enter__(self) -> 'StrictIota':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def add_neighbors(self, uris: Iterable[str]) -> dict:
         """
         Add one or more neighbors to the node.  Lasts until the node is
@@ -129,7 +242,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().add_neighbors(uris)
         )
 
@@ -179,7 +292,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().attach_to_tangle(
                         trunk_transaction,
                         branch_transaction,
@@ -213,7 +326,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().broadcast_transactions(
                         trytes,
                 )
@@ -251,7 +364,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().check_consistency(
                         tails,
                 )
@@ -302,7 +415,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().find_transactions(
                         bundles,
                         addresses,
@@ -356,7 +469,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_balances(
                         addresses,
                         tips,
@@ -395,7 +508,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_inclusion_states(
                         transactions,
                 )
@@ -426,7 +539,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_missing_transactions()
         )
 
@@ -463,7 +576,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_neighbors()
         )
 
@@ -491,7 +604,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_node_api_configuration()
         )
 
@@ -554,7 +667,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_node_info()
         )
 
@@ -598,7 +711,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_transactions_to_approve(
                         depth,
                         reference,
@@ -633,7 +746,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_trytes(
                         hashes,
                 )
@@ -659,7 +772,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().interrupt_attaching_to_tangle()
         )
 
@@ -689,7 +802,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().remove_neighbors(uris)
         )
 
@@ -720,7 +833,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().store_transactions(trytes)
         )
 
@@ -756,7 +869,7 @@ class StrictIota(AsyncStrictIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().were_addresses_spent_from(addresses)
         )
 
@@ -784,11 +897,15 @@ class Iota(StrictIota, AsyncIota):
         For more info on the Mainnet and the Devnet, visit
         `the official docs site<https://docs.iota.org/docs/getting-started/0.1/network/iota-networks/>`.
 
-    :param Optional[bool] local_pow:
+    :param Optional[Union[bool, str]] local_pow:
         Whether to perform proof-of-work locally by redirecting all calls
         to :py:meth:`attach_to_tangle` to
         `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+        If the extension is not installed, or if ``local_pow`` is
+        ``'builtin'``, the built-in
+        :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
             See :ref:`README:Optional Local Pow` for more info and
             :ref:`find out<pow-label>` how to use it.
 
@@ -803,7 +920,7 @@ class Iota(StrictIota, AsyncIota):
             adapter: AdapterSpec,
             seed: Optional[TrytesCompatible] = None,
             devnet: bool = False,
-            local_pow: bool = False
+            local_pow: Union[bool, str] = False
     ) -> None:
         """
         :param seed:
@@ -841,7 +958,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().broadcast_and_store(trytes)
         )
 
@@ -872,7 +989,7 @@ class Iota(StrictIota, AsyncIota):
 
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().broadcast_bundle(tail_transaction_hash)
         )
 
@@ -922,7 +1039,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().find_transaction_objects(
                         bundles,
                         addresses,
@@ -1007,7 +1124,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_account_data(
                         start,
                         stop,
@@ -1024,6 +1141,15 @@ class Iota(StrictIota, AsyncIota):
         Returns the bundle(s) associated with the specified transaction
         hashes.
 
+        When fetching multiple bundles, all of them are traversed together,
+        one transaction per bundle at a time, so that the number of
+        requests sent to the node does not grow with the number of
+        bundles.  See
+        :py:attr:`iota.commands.extended.get_bundles.GetBundlesCommand.chunk_size`
+        and
+        :py:attr:`iota.commands.extended.get_bundles.GetBundlesCommand.max_concurrency`
+        to tune the requests.
+
         :param Iterable[TransactionHash] transactions:
             Transaction hashes.  Must be a tail transaction.
 
@@ -1046,7 +1172,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_bundles(transactions)
         )
 
@@ -1155,7 +1281,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_inputs(
                         start,
                         stop,
@@ -1170,6 +1296,7 @@ class Iota(StrictIota, AsyncIota):
             count: int = 1,
             security_level: int = AddressGenerator.DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
     ):
         """
         Generates one or more new addresses from the seed.
@@ -1211,6 +1338,11 @@ class Iota(StrictIota, AsyncIota):
             Specify whether to return the address with the checksum.
             Defaults to ``False``.
 
+        :param Optional[int] workers:
+            Number of worker processes to spread address generation
+            across.  By default, addresses are generated in a single
+            background thread.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1226,12 +1358,13 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_new_addresses(
                         count=count,
                         index=index,
                         security_level=security_level,
                         checksum=checksum,
+                        workers=workers,
                 )
         )
 
@@ -1262,7 +1395,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_transaction_objects(hashes)
         )
 
@@ -1325,7 +1458,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().get_transfers(
                         start,
                         stop,
@@ -1369,7 +1502,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().is_promotable(tails)
         )
 
@@ -1428,7 +1561,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().prepare_transfer(
                         transfers,
                         inputs,
@@ -1469,7 +1602,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().promote_transaction(
                         transaction,
                         depth,
@@ -1515,7 +1648,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().replay_bundle(
                         transaction,
                         depth,
@@ -1584,7 +1717,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().send_transfer(
                         transfers,
                         depth,
@@ -1632,7 +1765,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().send_trytes(
                         trytes,
                         depth,
@@ -1668,7 +1801,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().is_reattachable(
                         addresses,
                 )
@@ -1678,11 +1811,14 @@ class Iota(StrictIota, AsyncIota):
         """
         Fetches and traverses a bundle from the Tangle given a tail transaction
         hash.
-        Recursively traverse the Tangle, collecting transactions until
-        we hit a new bundle.
+        Traverses the Tangle, collecting transactions until we hit a new
+        bundle.
 
-        This method is (usually) faster than :py:meth:`find_transactions`, and
-        it ensures we don't collect transactions from replayed bundles.
+        The transactions of the bundle are fetched in one batch and
+        linked together by following the trunk transactions, which
+        ensures we don't collect transactions from replayed bundles.
+        Transactions are only fetched one at a time if the node's results
+        are incomplete.
 
         :param TransactionHash tail_hash:
             Tail transaction hash of the bundle.
@@ -1699,7 +1835,7 @@ class Iota(StrictIota, AsyncIota):
         """
         # Execute original coroutine inside an event loop to make this method
         # synchronous
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run(
                 super().traverse_bundle(
                         tail_hash,
                 )
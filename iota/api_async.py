@@ -1,4 +1,4 @@
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Union
 
 from iota import AdapterSpec, Address, BundleHash, ProposedTransaction, Tag, \
     TransactionHash, TransactionTrytes, TryteString, TrytesCompatible
@@ -32,11 +32,15 @@ class AsyncStrictIota:
         On the devnet, minimum weight magnitude is set to 9, on mainnet
         it is 1 by default.
 
-    :param Optional[bool] local_pow:
+    :param Optional[Union[bool, str]] local_pow:
         Whether to perform proof-of-work locally by redirecting all calls
         to :py:meth:`attach_to_tangle` to
         `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+        If the extension is not installed, or if ``local_pow`` is
+        ``'builtin'``, the built-in
+        :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
             See :ref:`README:Optional Local Pow` for more info and
             :ref:`find out<pow-label>` how to use it.
 
@@ -46,7 +50,7 @@ class AsyncStrictIota:
             self,
             adapter: AdapterSpec,
             devnet: bool = False,
-            local_pow: bool = False
+            local_pow: Union[bool, str] = False
     ) -> None:
         """
         :param AdapterSpec adapter:
@@ -57,11 +61,15 @@ class AsyncStrictIota:
             On the devnet, minimum weight magnitude is set to 9, on mainnet
             it is 1 by default.
 
-        :param Optional[bool] local_pow:
+        :param Optional[Union[bool, str]] local_pow:
             Whether to perform proof-of-work locally by redirecting all calls
             to :py:meth:`attach_to_tangle` to
             `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+            If the extension is not installed, or if ``local_pow`` is
+            ``'builtin'``, the built-in
+            :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
                 See :ref:`README:Optional Local Pow` for more info and
                 :ref:`find out<pow-label>` how to use it.
         """
@@ -84,6 +92,26 @@ class AsyncStrictIota:
         self.adapter.set_local_pow(local_pow)
         self.devnet = devnet
 
+    async def aclose(self) -> None:
+        """
+        Closes the adapter, releasing its network connections.
+
+        The API instance should not be used after it is closed.  You can
+        also use the API instance as an async context manager::
+
+            async with AsyncIota('https://nodes.thetangle.org:443') as api:
+                ...
+
+        :returns: None
+        """
+        await self.adapter.aclose()
+
+    async def __aenter__(self) -> 'AsyncStrictIota':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     def create_command(self, command: str) -> CustomCommand:
         """
         Creates a pre-configured CustomCommand instance.
@@ -97,7 +125,7 @@ class AsyncStrictIota:
         """
         return CustomCommand(self.adapter, command)
 
-    def set_local_pow(self, local_pow: bool) -> None:
+    def set_local_pow(self, local_pow: Union[bool, str]) -> None:
         """
         Sets the :py:attr:`local_pow` attribute of the adapter of the api
         instance. If it is ``True``, :py:meth:`~Iota.attach_to_tangle` command calls
@@ -108,14 +136,61 @@ class AsyncStrictIota:
         This particular method is needed if one wants to change
         local_pow behavior dynamically.
 
-        :param bool local_pow:
-            Whether to perform pow locally.
+        :param Union[bool, str] local_pow:
+            Whether to perform pow locally (``'builtin'`` to always use
+            the built-in PoW engine).
 
         :returns: None
 
         """
         self.adapter.set_local_pow(local_pow)
 
+    def set_scan_window(self, scan_window: Optional[int]) -> None:
+        """
+        Sets the :py:attr:`scan_window` attribute of the adapter of the
+        api instance.  If it is set, commands that search for used
+        addresses (e.g. :py:meth:`~Iota.get_new_addresses`,
+        :py:meth:`~Iota.get_inputs`, :py:meth:`~Iota.get_account_data`
+        and :py:meth:`~Iota.get_transfers`) check a window of addresses
+        per request to the node, instead of one address at a time.
+
+        The window size adapts to the observed latency of the node,
+        starting from ``scan_window``.
+
+        By default, :py:attr:`scan_window` is set to ``None``.
+
+        :param Optional[int] scan_window:
+            Initial number of addresses to check per request.
+
+        :returns: None
+
+        """
+        self.adapter.set_scan_window(scan_window)
+
+    def set_trusted(self, trusted: bool) -> None:
+        """
+        Sets the :py:attr:`trusted` attribute of the adapter of the api
+        instance.  If it is ``True``, API methods accept values that
+        already have the expected type (e.g.,
+        :py:class:`~iota.TransactionHash` or :py:class:`~iota.Address`
+        objects created by PyOTA) without validating them again, which
+        is much faster for large requests.  Values of any other type
+        (e.g., ``str``) are still validated.
+
+        Requests that commands send internally (e.g., the ``getTrytes``
+        requests sent by :py:meth:`~Iota.get_bundles`) are always
+        trusted.
+
+        By default, :py:attr:`trusted` is set to ``False``.
+
+        :param bool trusted:
+            Whether to trust typed values.
+
+        :returns: None
+
+        """
+        self.adapter.set_trusted(trusted)
+
     @property
     def default_min_weight_magnitude(self) -> int:
         """
@@ -726,11 +801,15 @@ class AsyncIota(AsyncStrictIota):
         For more info on the Mainnet and the Devnet, visit
         `the official docs site<https://docs.iota.org/docs/getting-started/0.1/network/iota-networks/>`.
 
-    :param Optional[bool] local_pow:
+    :param Optional[Union[bool, str]] local_pow:
         Whether to perform proof-of-work locally by redirecting all calls
         to :py:meth:`attach_to_tangle` to
         `ccurl pow interface <https://pypi.org/project/PyOTA-PoW/>`_.
 
+        If the extension is not installed, or if ``local_pow`` is
+        ``'builtin'``, the built-in
+        :py:class:`iota.crypto.pearl_diver.PearlDiver` is used instead.
+
             See :ref:`README:Optional Local Pow` for more info and
             :ref:`find out<pow-label>` how to use it.
 
@@ -745,7 +824,7 @@ class AsyncIota(AsyncStrictIota):
             adapter: AdapterSpec,
             seed: Optional[TrytesCompatible] = None,
             devnet: bool = False,
-            local_pow: bool = False
+            local_pow: Union[bool, str] = False
     ) -> None:
         """
         :param seed:
@@ -956,6 +1035,15 @@ class AsyncIota(AsyncStrictIota):
         Returns the bundle(s) associated with the specified transaction
         hashes.
 
+        When fetching multiple bundles, all of them are traversed together,
+        one transaction per bundle at a time, so that the number of
+        requests sent to the node does not grow with the number of
+        bundles.  See
+        :py:attr:`iota.commands.extended.get_bundles.GetBundlesCommand.chunk_size`
+        and
+        :py:attr:`iota.commands.extended.get_bundles.GetBundlesCommand.max_concurrency`
+        to tune the requests.
+
         :param Iterable[TransactionHash] transactions:
             Transaction hashes.  Must be a tail transaction.
 
@@ -1097,6 +1185,7 @@ class AsyncIota(AsyncStrictIota):
             count: int = 1,
             security_level: int = AddressGenerator.DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
     ):
         """
         Generates one or more new addresses from the seed.
@@ -1138,6 +1227,11 @@ class AsyncIota(AsyncStrictIota):
             Specify whether to return the address with the checksum.
             Defaults to ``False``.
 
+        :param Optional[int] workers:
+            Number of worker processes to spread address generation
+            across.  By default, addresses are generated in a single
+            background thread.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1156,6 +1250,7 @@ class AsyncIota(AsyncStrictIota):
                 index=index,
                 securityLevel=security_level,
                 checksum=checksum,
+                workers=workers,
                 seed=self.seed,
         )
 
@@ -1585,11 +1680,14 @@ class AsyncIota(AsyncStrictIota):
         """
         Fetches and traverses a bundle from the Tangle given a tail transaction
         hash.
-        Recursively traverse the Tangle, collecting transactions until
-        we hit a new bundle.
-
-        This method is (usually) faster than :py:meth:`find_transactions`, and
-        it ensures we don't collect transactions from replayed bundles.
+        Traverses the Tangle, collecting transactions until we hit a new
+        bundle.
+
+        The transactions of the bundle are fetched in one batch and
+        linked together by following the trunk transactions, which
+        ensures we don't collect transactions from replayed bundles.
+        Transactions are only fetched one at a time if the node's results
+        are incomplete.
 
         :param TransactionHash tail_hash:
             Tail transaction hash of the bundle.
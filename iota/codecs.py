@@ -1,11 +1,21 @@
-from codecs import Codec, CodecInfo, register as lookup_function
-from typing import Union, Tuple
+from codecs import BufferedIncrementalDecoder, Codec, CodecInfo, \
+    IncrementalEncoder, StreamReader, StreamWriter, \
+    register as lookup_function
+from itertools import chain
+from sys import byteorder
+from typing import Dict, List, Optional, Union, Tuple
 from warnings import warn
 
 from iota.exceptions import with_context
+from iota.trits import trits_from_int
 
 __all__ = [
     'AsciiTrytesCodec',
+    'AsciiTrytesIncrementalDecoder',
+    'AsciiTrytesIncrementalEncoder',
+    'AsciiTrytesStreamReader',
+    'AsciiTrytesStreamWriter',
+    'T5B1Codec',
     'TrytesDecodeError',
 ]
 
@@ -60,9 +70,14 @@ class AsciiTrytesCodec(Codec):
         codec = cls()
 
         codec_info = {
+            'name': cls.name,
             'encode': codec.encode,
             'decode': codec.decode,
-            
+            'incrementalencoder': AsciiTrytesIncrementalEncoder,
+            'incrementaldecoder': AsciiTrytesIncrementalDecoder,
+            'streamreader': AsciiTrytesStreamReader,
+            'streamwriter': AsciiTrytesStreamWriter,
+
             # In Python 2, all codecs are made equal.
             # In Python 3, some codecs are more equal than others.
             '_is_text_encoding': False
@@ -91,18 +106,12 @@ class AsciiTrytesCodec(Codec):
                 },
             )
 
-        # :bc: In Python 2, iterating over a byte string yields
-        # characters instead of integers.
-        if not isinstance(input, bytearray):
-            input = bytearray(input)
-
-        trytes = bytearray()
-
-        for c in input:
-            second, first = divmod(c, len(self.alphabet))
-
-            trytes.append(self.alphabet[first])
-            trytes.append(self.alphabet[second])
+        # Each byte becomes two trytes: ``byte % 27`` followed by
+        # ``byte // 27``.  Convert all of the bytes in one go, then
+        # interleave the results.
+        trytes = bytearray(len(input) * 2)
+        trytes[0::2] = input.translate(_ENCODE_FIRST)
+        trytes[1::2] = input.translate(_ENCODE_SECOND)
 
         return bytes(trytes), len(input)
 
@@ -127,6 +136,15 @@ class AsciiTrytesCodec(Codec):
                 },
             )
 
+        # Try to decode every pair of trytes in one go; if that fails,
+        # fall back to decoding one pair at a time, so that errors are
+        # reported (or replaced/ignored) correctly.
+        if not len(input) % 2:
+            decoded = _decode_pairs(input)
+
+            if decoded is not None:
+                return decoded, len(input)
+
         # :bc: In Python 2, iterating over a byte string yields
         # characters instead of integers.
         if not isinstance(input, bytearray):
@@ -188,6 +206,390 @@ class AsciiTrytesCodec(Codec):
         return bytes(bytes_), len(input)
 
 
+def _build_tables() -> Tuple[bytes, bytes, List[Optional[int]]]:
+    """
+    Precomputes the lookup tables used by :py:class:`AsciiTrytesCodec`.
+    """
+    alphabet = AsciiTrytesCodec.alphabet
+    radix = len(alphabet)
+
+    # Byte => first/second tryte, for :py:meth:`bytes.translate`.
+    encode_first = bytes(alphabet[c % radix] for c in range(256))
+    encode_second = bytes(alphabet[c // radix] for c in range(256))
+
+    # Pair of trytes, read as a native-endian 16-bit integer => byte.
+    # Pairs that contain invalid characters, or that decode to values
+    # greater than 255, map to ``None``.
+    decode_pairs: List[Optional[int]] = [None] * 65536
+
+    for first, first_value in AsciiTrytesCodec.index.items():
+        for second, second_value in AsciiTrytesCodec.index.items():
+            value = first_value + second_value * radix
+
+            if value < 256:
+                if byteorder == 'little':
+                    key = first | (second << 8)
+                else:
+                    key = (first << 8) | second
+
+                decode_pairs[key] = value
+
+    return encode_first, encode_second, decode_pairs
+
+
+_ENCODE_FIRST, _ENCODE_SECOND, _DECODE_PAIRS = _build_tables()
+
+
+def _decode_pairs(input: Union[bytes, bytearray]) -> Optional[bytes]:
+    """
+    Decodes an even-length tryte sequence, using :py:data:`_DECODE_PAIRS`.
+
+    Returns ``None`` if any pair of trytes cannot be decoded.
+    """
+    try:
+        return bytes(map(
+            _DECODE_PAIRS.__getitem__,
+            memoryview(input).cast('H'),
+        ))
+    except TypeError:
+        # At least one pair mapped to ``None``.
+        return None
+
+
+class AsciiTrytesIncrementalEncoder(IncrementalEncoder):
+    """
+    Incrementally encodes byte strings into trytes, using
+    :py:class:`AsciiTrytesCodec`.
+
+    Every byte is encoded independently, so no state is kept between
+    calls.
+    """
+
+    def encode(
+            self,
+            input: Union[bytes, bytearray],
+            final: bool = False,
+    ) -> bytes:
+        return AsciiTrytesCodec().encode(input, self.errors)[0]
+
+
+class AsciiTrytesIncrementalDecoder(BufferedIncrementalDecoder):
+    """
+    Incrementally decodes trytes into byte strings, using
+    :py:class:`AsciiTrytesCodec`.
+
+    If a chunk ends in the middle of a pair of trytes, the last tryte is
+    kept until the next chunk arrives.
+    """
+
+    def _buffer_decode(
+            self,
+            input: Union[bytes, bytearray],
+            errors: str,
+            final: bool,
+    ) -> Tuple[bytes, int]:
+        if not final:
+            input = input[:len(input) - (len(input) % 2)]
+
+        return AsciiTrytesCodec().decode(input, errors)
+
+
+class AsciiTrytesStreamWriter(AsciiTrytesCodec, StreamWriter):
+    """
+    Encodes byte strings into trytes, and writes them to a stream.
+
+    Example usage::
+
+        import codecs
+
+        with open('message.trytes', 'wb') as f:
+            writer = codecs.getwriter('trytes_ascii')(f)
+            writer.write(b'Hello, IOTA!')
+    """
+
+
+class AsciiTrytesStreamReader(AsciiTrytesCodec, StreamReader):
+    """
+    Reads trytes from a stream, and decodes them into byte strings.
+
+    Example usage::
+
+        import codecs
+
+        with open('message.trytes', 'rb') as f:
+            reader = codecs.getreader('trytes_ascii')(f)
+
+            for chunk in iter(lambda: reader.read(65536), b''):
+                ...
+
+    If the stream ends with an odd number of trytes, the last tryte is
+    handled according to ``errors``, the same way as
+    :py:meth:`AsciiTrytesCodec.decode` (i.e., a
+    :py:class:`TrytesDecodeError` is raised by default).
+    """
+    charbuffertype = bytes
+
+    def read(
+            self,
+            size: int = -1,
+            chars: int = -1,
+            firstline: bool = False,
+    ) -> bytes:
+        data = super(AsciiTrytesStreamReader, self).read(
+            size,
+            chars,
+            firstline,
+        )
+
+        # The stream is exhausted if we read all of it, or if there was
+        # nothing left to read; anything left in the buffer is an
+        # incomplete pair.
+        exhausted = (not data) or (size < 0 and chars < 0)
+
+        if exhausted and self.bytebuffer and size != 0 and chars != 0:
+            leftover, self.bytebuffer = self.bytebuffer, b''
+            data += AsciiTrytesCodec.decode(self, leftover, self.errors)[0]
+
+        return data
+
+    def decode(
+            self,
+            input: Union[memoryview, bytes, bytearray],
+            errors: str = 'strict',
+    ) -> Tuple[bytes, int]:
+        # Leave an incomplete pair in the buffer until more data is read.
+        return super(AsciiTrytesStreamReader, self).decode(
+            input[:len(input) - (len(input) % 2)],
+            errors,
+        )
+
+
+class T5B1Codec(Codec):
+    """
+    Codec for converting trytes into a compact binary format, and vice
+    versa.
+
+    Trits are packed 5 to a byte ("T5B1"), each byte holding the
+    balanced ternary value of its 5 trits (-121..121) as a signed
+    integer.  This uses 3 bytes for every 5 trytes, instead of 5 bytes
+    when the trytes are stored as ASCII.
+
+    Like :py:class:`AsciiTrytesCodec`, converting trytes into bytes is
+    a *decode* operation.
+
+    .. note::
+        The packed format does not store the number of trytes.  If the
+        number of trytes is not a multiple of 5, the padding trits may
+        be decoded as an extra ``9`` tryte.  See
+        :py:meth:`iota.TryteString.from_packed`.
+
+    .. note::
+        This codec only supports ``errors='strict'``.
+    """
+    name = 'trytes_t5b1'
+
+    TRITS_PER_BYTE = 5
+    """
+    Number of trits packed into each byte.
+    """
+
+    @classmethod
+    def get_codec_info(cls) -> CodecInfo:
+        """
+        Returns information used by the codecs library to configure the
+        codec for use.
+        """
+        codec = cls()
+
+        return CodecInfo(
+            name=cls.name,
+            encode=codec.encode,
+            decode=codec.decode,
+            _is_text_encoding=False,
+        )
+
+    def encode(self,
+               input: Union[memoryview, bytes, bytearray],
+               errors: str = 'strict') -> Tuple[bytes, int]:
+        """
+        Unpacks a byte string into trytes.
+        """
+        if not isinstance(input, (memoryview, bytes, bytearray)):
+            raise with_context(
+                exc=TypeError(
+                    "Can't encode {type}; byte string expected.".format(
+                        type=type(input).__name__,
+                    )),
+
+                context={
+                    'input': input,
+                },
+            )
+
+        try:
+            trits = list(chain.from_iterable(
+                map(_T5B1_TRITS_BY_BYTE.__getitem__, input),
+            ))
+        except TypeError:
+            # At least one byte mapped to ``None``.
+            i = next(
+                i for i, byte in enumerate(bytes(input))
+                if _T5B1_TRITS_BY_BYTE[byte] is None
+            )
+
+            raise with_context(
+                exc=ValueError(
+                    "'{name}' codec can't encode byte {byte:#04x} "
+                    "at position {i}: value not in range(-121, 122)".format(
+                        name=self.name,
+                        byte=input[i],
+                        i=i,
+                    ),
+                ),
+
+                context={
+                    'input': input,
+                },
+            )
+
+        # Drop padding trits at the end of the last byte.
+        padding = len(trits) % 3
+        if padding:
+            if any(trits[-padding:]):
+                raise with_context(
+                    exc=ValueError(
+                        "'{name}' codec can't encode value; "
+                        "padding trits are not zero.".format(
+                            name=self.name,
+                        ),
+                    ),
+
+                    context={
+                        'input': input,
+                    },
+                )
+
+            del trits[-padding:]
+
+        iterator = iter(trits)
+        return (
+            bytes(map(
+                _ORDINALS_BY_TRITS.__getitem__,
+                zip(iterator, iterator, iterator),
+            )),
+
+            len(input),
+        )
+
+    def decode(self,
+               input: Union[memoryview, bytes, bytearray],
+               errors: str = 'strict') -> Tuple[bytes, int]:
+        """
+        Packs a tryte string into bytes.
+        """
+        if not isinstance(input, (memoryview, bytes, bytearray)):
+            raise with_context(
+                exc=TypeError(
+                    "Can't decode {type}; byte string expected.".format(
+                        type=type(input).__name__,
+                    )),
+
+                context={
+                    'input': input,
+                },
+            )
+
+        try:
+            trits = list(chain.from_iterable(
+                map(_TRITS_BY_ORDINAL.__getitem__, input),
+            ))
+        except TypeError:
+            # At least one character mapped to ``None``.
+            i = next(
+                i for i, ordinal in enumerate(bytes(input))
+                if _TRITS_BY_ORDINAL[ordinal] is None
+            )
+
+            raise with_context(
+                exc=TrytesDecodeError(
+                    "'{name}' codec can't decode character {char!r} "
+                    "at position {i} (expected A-Z or 9).".format(
+                        name=self.name,
+                        char=chr(input[i]),
+                        i=i,
+                    ),
+                ),
+
+                context={
+                    'input': input,
+                },
+            )
+
+        # Pad the last byte with zero trits.
+        trits += [0] * (-len(trits) % self.TRITS_PER_BYTE)
+
+        iterator = iter(trits)
+        return (
+            bytes(map(
+                _T5B1_BYTES_BY_TRITS.__getitem__,
+                zip(iterator, iterator, iterator, iterator, iterator),
+            )),
+
+            len(input),
+        )
+
+
+def _build_trit_tables() -> Tuple[
+    List[Optional[Tuple[int, ...]]],
+    Dict[Tuple[int, ...], int],
+    List[Optional[Tuple[int, ...]]],
+    Dict[Tuple[int, ...], int],
+]:
+    """
+    Precomputes the lookup tables used by :py:class:`T5B1Codec`.
+    """
+    radix = len(AsciiTrytesCodec.alphabet)
+
+    # ASCII tryte => 3 trits.
+    trits_by_ordinal: List[Optional[Tuple[int, ...]]] = [None] * 256
+
+    for value, ordinal in AsciiTrytesCodec.alphabet.items():
+        # Values greater than 13 overflow, e.g., 14 => -13.
+        n = (value - radix) if value > 13 else value
+        trits_by_ordinal[ordinal] = tuple(trits_from_int(n, pad=3))
+
+    # Byte (signed value of 5 trits, stored as unsigned) => 5 trits.
+    max_value = (3 ** T5B1Codec.TRITS_PER_BYTE - 1) // 2
+    trits_by_byte: List[Optional[Tuple[int, ...]]] = [None] * 256
+
+    for n in range(-max_value, max_value + 1):
+        trits_by_byte[n & 0xFF] = tuple(
+            trits_from_int(n, pad=T5B1Codec.TRITS_PER_BYTE),
+        )
+
+    def invert(table):
+        return {
+            trits: key
+            for key, trits in enumerate(table)
+            if trits is not None
+        }
+
+    return (
+        trits_by_ordinal,
+        invert(trits_by_ordinal),
+        trits_by_byte,
+        invert(trits_by_byte),
+    )
+
+
+(
+    _TRITS_BY_ORDINAL,
+    _ORDINALS_BY_TRITS,
+    _T5B1_TRITS_BY_BYTE,
+    _T5B1_BYTES_BY_TRITS,
+) = _build_trit_tables()
+
+
 @lookup_function
 def check_trytes_codec(encoding):
     """
@@ -200,6 +602,9 @@ def check_trytes_codec(encoding):
     if encoding == AsciiTrytesCodec.name:
         return AsciiTrytesCodec.get_codec_info()
 
+    elif encoding == T5B1Codec.name:
+        return T5B1Codec.get_codec_info()
+
     elif encoding == AsciiTrytesCodec.compat_name:
         warn(
             '"{old_codec}" codec will be removed in PyOTA v2.1. '
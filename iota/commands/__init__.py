@@ -1,19 +1,33 @@
+import asyncio
 from abc import ABCMeta, abstractmethod as abstract_method
-from typing import Any, Mapping, Optional
+from contextvars import ContextVar
+from itertools import product
+from threading import local
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple
 
 import filters as f
 
-from iota.adapter import BaseAdapter
+from iota.adapter import BadApiResponse, BaseAdapter
 from iota.exceptions import with_context
+from iota.filters import trusted_values
 
 __all__ = [
   'BaseCommand',
+  'ChunkedFilterCommand',
   'CustomCommand',
   'FilterCommand',
   'RequestFilter',
   'ResponseFilter',
 ]
 
+# Whether the current coroutine is running inside a command (i.e., any
+# commands it calls are internal to the library).
+_nested: ContextVar[bool] = ContextVar('nested', default=False)
+
+# Filter instances, per command class.  Kept per thread, because
+# filters hold state while they run.
+_filter_cache = local()
+
 
 class BaseCommand(object, metaclass=ABCMeta):
   """
@@ -52,7 +66,11 @@ class BaseCommand(object, metaclass=ABCMeta):
     if replacement is not None:
       self.request = replacement
 
-    self.response = await self._execute(self.request)
+    token = _nested.set(True)
+    try:
+      self.response = await self._execute(self.request)
+    finally:
+      _nested.reset(token)
 
     replacement = self._prepare_response(self.response)
     if replacement is not None:
@@ -183,7 +201,39 @@ class ResponseFilter(f.FilterChain):
 class FilterCommand(BaseCommand, metaclass=ABCMeta):
   """
   Uses filters to manipulate request/response values.
+
+  Filter instances are built once per command class, and reused for
+  every call.
   """
+  def __init__(
+      self,
+      adapter: BaseAdapter,
+      trusted: Optional[bool] = None,
+  ) -> None:
+    """
+    :param adapter:
+      Adapter that will send request payloads to the node.
+
+    :param trusted:
+      Whether to skip validating request values that already have the
+      expected type (see :py:func:`iota.filters.trusted_values`).
+
+      If ``None``, the adapter's ``trusted`` setting is used, and
+      commands called by other commands are trusted.
+    """
+    super(FilterCommand, self).__init__(adapter)
+
+    self.trusted = trusted
+
+  def is_trusted(self) -> bool:
+    """
+    Returns whether request values that already have the expected type
+    are accepted without validation.
+    """
+    if self.trusted is not None:
+      return self.trusted
+
+    return self.adapter.trusted or _nested.get()
 
   @abstract_method
   def get_request_filter(self) -> Optional[RequestFilter]:
@@ -212,19 +262,47 @@ class FilterCommand(BaseCommand, metaclass=ABCMeta):
     )
 
   def _prepare_request(self, request: dict) -> dict:
-    return self._apply_filter(
-      value           = request,
-      filter_         = self.get_request_filter(),
-      failure_message = 'Request failed validation',
-    )
+    with trusted_values(self.is_trusted()):
+      return self._apply_filter(
+        value           = request,
+        filter_         = self._get_filter('request'),
+        failure_message = 'Request failed validation',
+      )
 
   def _prepare_response(self, response: dict) -> dict:
     return self._apply_filter(
       value           = response,
-      filter_         = self.get_response_filter(),
+      filter_         = self._get_filter('response'),
       failure_message = 'Response failed validation',
     )
 
+  def _get_filter(self, kind: str) -> Optional[f.BaseFilter]:
+    """
+    Returns the request or response filter for this command, building
+    it the first time it is needed.
+
+    :param kind:
+      ``'request'`` or ``'response'``.
+    """
+    try:
+      filters = _filter_cache.filters
+    except AttributeError:
+      filters = _filter_cache.filters = {}
+
+    key = (type(self), kind)
+
+    try:
+      return filters[key]
+    except KeyError:
+      filter_ = (
+        self.get_request_filter()
+        if kind == 'request'
+        else self.get_response_filter()
+      )
+
+      filters[key] = filter_
+      return filter_
+
   @staticmethod
   def _apply_filter(
           value: dict,
@@ -258,3 +336,228 @@ class FilterCommand(BaseCommand, metaclass=ABCMeta):
         )
 
     return value
+
+
+class ChunkedFilterCommand(FilterCommand, metaclass=ABCMeta):
+  """
+  Splits requests that exceed the node's API limits into chunks.
+
+  The limits are fetched from the node (``getNodeAPIConfiguration``)
+  the first time a request might exceed them, and cached in
+  :py:attr:`iota.adapter.BaseAdapter.api_limits`.  Chunks are sent
+  concurrently, and the responses are merged in the original order.
+  """
+  DEFAULT_API_LIMITS: Dict[str, int] = {
+    'maxGetTrytes': 10000,
+    'maxRequestsList': 1000,
+  }
+  """
+  Limits used if the node does not report its own (IRI defaults).
+  """
+
+  UNCHECKED_SIZE = 100
+  """
+  Requests where no list is longer than this are sent as-is, without
+  checking the node's limits.
+  """
+
+  max_concurrency = 4
+  """
+  Max number of chunks to send to the node at the same time.
+  """
+
+  chunked_params: Tuple[str, ...] = ()
+  """
+  Request parameters that may be split into chunks.
+  """
+
+  limit_name = 'maxRequestsList'
+  """
+  Name of the node API limit that applies to :py:attr:`chunked_params`.
+  """
+
+  merged_param: Optional[str] = None
+  """
+  Response value that contains the results from every chunk.
+  """
+
+  pinned_params: Dict[str, str] = {}
+  """
+  Request parameters that are copied from the response to the first
+  chunk into the remaining chunks (request parameter => response
+  value), so that every chunk is evaluated against the same state of
+  the Tangle.
+
+  If set, the first chunk is sent before the others.  Parameters that
+  are already present in the request are not overridden.
+  """
+
+  merge_unique = False
+  """
+  Whether to discard duplicate values when merging
+  :py:attr:`merged_param`.
+
+  Set this for commands where a value may match more than one chunk
+  (e.g., ``findTransactions``), but not for commands whose results
+  correspond to the request values by position.
+  """
+
+  async def stream(self, **kwargs: Any) -> AsyncIterator[Any]:
+    """
+    Sends the command to the node, and yields the members of
+    :py:attr:`merged_param` as they arrive, instead of returning the
+    entire response at once.
+
+    Chunks are sent one at a time, so that memory usage stays bounded
+    no matter how many results the node returns.  If
+    :py:attr:`merge_unique` is set, the values that were already
+    yielded are remembered, so that values matching more than one chunk
+    are only yielded once.
+
+    Example::
+
+      async for txn_hash in FindTransactionsCommand(adapter).stream(
+          addresses=addresses,
+      ):
+        ...
+    """
+    if self.called:
+      raise with_context(
+        exc = RuntimeError('Command has already been called.'),
+
+        context = {
+          'last_request':   self.request,
+          'last_response':  self.response,
+        },
+      )
+
+    self.called = True
+    self.request = self._prepare_request(kwargs)
+
+    seen = set()
+
+    for chunk in await self._split_request(self.request):
+      chunk['command'] = self.command
+
+      async for values in self.adapter.stream_request(
+          chunk,
+          self.merged_param,
+      ):
+        response = self._prepare_response({self.merged_param: values})
+
+        for value in response.get(self.merged_param) or []:
+          if self.merge_unique:
+            if value in seen:
+              continue
+
+            seen.add(value)
+
+          yield value
+
+  async def _execute(self, request: dict) -> dict:
+    chunks = await self._split_request(request)
+
+    if len(chunks) == 1:
+      return await super(ChunkedFilterCommand, self)._execute(request)
+
+    semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def send_chunk(chunk: dict) -> dict:
+      async with semaphore:
+        chunk['command'] = self.command
+        return await self.adapter.send_request(chunk)
+
+    pinned = {
+      param: value
+      for param, value in self.pinned_params.items()
+      if request.get(param) is None
+    }
+
+    responses = []
+    if pinned:
+      responses.append(await send_chunk(chunks.pop(0)))
+
+      for chunk in chunks:
+        for param, value in pinned.items():
+          chunk[param] = responses[0][value]
+
+    responses.extend(await asyncio.gather(*map(send_chunk, chunks)))
+
+    return self._merge_responses(responses)
+
+  async def _split_request(self, request: dict) -> List[dict]:
+    """
+    Splits the request into chunks that don't exceed the node's API
+    limits.
+    """
+    chunked = {
+      param: request[param]
+      for param in self.chunked_params
+      if request.get(param) and len(request[param]) > self.UNCHECKED_SIZE
+    }
+
+    if not chunked:
+      return [request]
+
+    limit = (await self._get_api_limits()).get(self.limit_name)
+    if not limit:
+      return [request]
+
+    chunked = {
+      param: [values[i:i + limit] for i in range(0, len(values), limit)]
+      for param, values in chunked.items()
+      if len(values) > limit
+    }
+
+    if not chunked:
+      return [request]
+
+    params = list(chunked)
+    return [
+      dict(request, **dict(zip(params, values)))
+      for values in product(*(chunked[param] for param in params))
+    ]
+
+  def _merge_responses(self, responses: List[dict]) -> dict:
+    """
+    Combines the responses for each chunk into a single response.
+    """
+    response = dict(responses[0])
+
+    if self.merged_param:
+      values = [
+        value
+        for chunk_response in responses
+        for value in chunk_response.get(self.merged_param) or []
+      ]
+
+      if self.merge_unique:
+        values = list(dict.fromkeys(values))
+
+      response[self.merged_param] = values
+
+    return response
+
+  async def _get_api_limits(self) -> Dict[str, int]:
+    """
+    Returns the node's API limits, fetching them if necessary.
+    """
+    if self.adapter.api_limits is None:
+      try:
+        config = await self.adapter.send_request({
+          'command': 'getNodeAPIConfiguration',
+        })
+      except BadApiResponse:
+        # The node doesn't support ``getNodeAPIConfiguration``.
+        config = {}
+
+      self.adapter.api_limits = dict(
+        self.DEFAULT_API_LIMITS,
+        **{
+          name: config[name]
+          for name in self.DEFAULT_API_LIMITS
+          if isinstance(config.get(name), int)
+        }
+      )
+
+    return self.adapter.api_limits
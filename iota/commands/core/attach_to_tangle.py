@@ -1,8 +1,10 @@
+from asyncio import get_event_loop
+
 import filters as f
 
 from iota import TransactionHash, TransactionTrytes
 from iota.commands import FilterCommand, RequestFilter, ResponseFilter
-from iota.filters import Trytes
+from iota.filters import Trytes, TrytesArray
 from iota.adapter import async_return
 
 __all__ = [
@@ -26,16 +28,35 @@ class AttachToTangleCommand(FilterCommand):
 
     async def _execute(self, request: dict) -> dict:
         if self.adapter.local_pow is True:
-            from pow import ccurl_interface
-            powed_trytes = ccurl_interface.attach_to_tangle(
-                request['trytes'],
-                request['branchTransaction'],
+            try:
+                from pow import ccurl_interface
+            except ImportError:
+                # Fall back to the built-in PoW engine.
+                pass
+            else:
+                powed_trytes = ccurl_interface.attach_to_tangle(
+                    request['trytes'],
+                    request['branchTransaction'],
+                    request['trunkTransaction'],
+                    request['minWeightMagnitude']
+                )
+                return await async_return({'trytes': powed_trytes})
+
+        if self.adapter.local_pow:
+            # Run the search in a separate thread, so that it doesn't
+            # block the event loop (and can be interrupted by
+            # ``interruptAttachingToTangle``).
+            powed_trytes = await get_event_loop().run_in_executor(
+                None,
+                self.adapter.get_pearl_diver().attach_to_tangle,
                 request['trunkTransaction'],
-                request['minWeightMagnitude']
+                request['branchTransaction'],
+                request['trytes'],
+                request['minWeightMagnitude'],
             )
-            return await async_return({'trytes': powed_trytes})
-        else:
-            return await super(FilterCommand, self)._execute(request)
+            return {'trytes': powed_trytes}
+
+        return await super(FilterCommand, self)._execute(request)
 
 
 class AttachToTangleRequestFilter(RequestFilter):
@@ -61,8 +82,5 @@ class AttachToTangleResponseFilter(ResponseFilter):
     def __init__(self) -> None:
         super(AttachToTangleResponseFilter, self).__init__({
             'trytes':
-                f.FilterRepeater(
-                    f.ByteString(encoding='ascii') |
-                    Trytes(TransactionTrytes),
-                ),
+                TrytesArray(TransactionTrytes),
         })
@@ -1,7 +1,7 @@
 import filters as f
 
 from iota import TransactionTrytes
-from iota.commands import FilterCommand, RequestFilter
+from iota.commands import ChunkedFilterCommand, RequestFilter
 from iota.filters import StringifiedTrytesArray
 
 __all__ = [
@@ -9,13 +9,14 @@ __all__ = [
 ]
 
 
-class BroadcastTransactionsCommand(FilterCommand):
+class BroadcastTransactionsCommand(ChunkedFilterCommand):
     """
     Executes `broadcastTransactions` command.
 
     See :py:meth:`iota.api.StrictIota.broadcast_transactions`.
     """
     command = 'broadcastTransactions'
+    chunked_params = ('trytes',)
 
     def get_request_filter(self):
         return BroadcastTransactionsRequestFilter()
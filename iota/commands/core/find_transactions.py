@@ -1,21 +1,25 @@
 import filters as f
 
 from iota import BundleHash, Tag, TransactionHash
-from iota.commands import FilterCommand, RequestFilter, ResponseFilter
-from iota.filters import AddressNoChecksum, StringifiedTrytesArray, Trytes
+from iota.commands import ChunkedFilterCommand, RequestFilter, ResponseFilter
+from iota.filters import AddressNoChecksum, StringifiedTrytesArray, \
+    TrytesArray
 
 __all__ = [
     'FindTransactionsCommand',
 ]
 
 
-class FindTransactionsCommand(FilterCommand):
+class FindTransactionsCommand(ChunkedFilterCommand):
     """
     Executes `findTransactions` command.
 
     See :py:meth:`iota.api.StrictIota.find_transactions`.
     """
     command = 'findTransactions'
+    chunked_params = ('addresses', 'approvees', 'bundles', 'tags')
+    merged_param = 'hashes'
+    merge_unique = True
 
     def get_request_filter(self):
         return FindTransactionsRequestFilter()
@@ -81,9 +85,6 @@ class FindTransactionsResponseFilter(ResponseFilter):
     def __init__(self) -> None:
         super(FindTransactionsResponseFilter, self).__init__({
             'hashes':
-                f.FilterRepeater(
-                    f.ByteString(encoding='ascii') |
-                    Trytes(TransactionHash)
-                ) |
-                f.Optional(default=[]),
+                TrytesArray(TransactionHash) |
+                f.Optional(default=list),
         })
@@ -1,21 +1,27 @@
 import filters as f
 
 from iota import TransactionHash
-from iota.commands import FilterCommand, RequestFilter, ResponseFilter
-from iota.filters import AddressNoChecksum, StringifiedTrytesArray, Trytes
+from iota.commands import ChunkedFilterCommand, RequestFilter, ResponseFilter
+from iota.filters import AddressNoChecksum, StringifiedTrytesArray, \
+    TrytesArray
 
 __all__ = [
     'GetBalancesCommand',
 ]
 
 
-class GetBalancesCommand(FilterCommand):
+class GetBalancesCommand(ChunkedFilterCommand):
     """
     Executes `getBalances` command.
 
     See :py:meth:`iota.api.StrictIota.get_balances`.
     """
     command = 'getBalances'
+    chunked_params = ('addresses',)
+    merged_param = 'balances'
+
+    # Every chunk must use the same milestone as the first one.
+    pinned_params = {'tips': 'references'}
 
     def get_request_filter(self):
         return GetBalancesRequestFilter()
@@ -68,8 +74,5 @@ class GetBalancesResponseFilter(ResponseFilter):
             'balances': f.Array | f.FilterRepeater(f.Int),
 
             'references':
-                f.Array | f.FilterRepeater(
-                    f.ByteString(encoding='ascii') |
-                    Trytes(TransactionHash)
-                ),
+                f.Array | TrytesArray(TransactionHash),
         })
@@ -2,7 +2,7 @@ import filters as f
 
 from iota import TransactionHash
 from iota.commands import FilterCommand, RequestFilter, ResponseFilter
-from iota.filters import Trytes
+from iota.filters import TrytesArray
 
 __all__ = [
     'GetMissingTransactionsCommand',
@@ -35,9 +35,6 @@ class GetMissingTransactionsResponseFilter(ResponseFilter):
     def __init__(self) -> None:
         super(GetMissingTransactionsResponseFilter, self).__init__({
             'hashes':
-                f.FilterRepeater(
-                    f.ByteString(encoding='ascii') |
-                    Trytes(TransactionHash)
-                ) |
-                f.Optional(default=[]),
+                TrytesArray(TransactionHash) |
+                f.Optional(default=list),
         })
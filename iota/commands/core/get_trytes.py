@@ -1,21 +1,24 @@
 import filters as f
 
 from iota import TransactionHash
-from iota.commands import FilterCommand, RequestFilter, ResponseFilter
-from iota.filters import StringifiedTrytesArray, Trytes
+from iota.commands import ChunkedFilterCommand, RequestFilter, ResponseFilter
+from iota.filters import StringifiedTrytesArray, TrytesArray
 
 __all__ = [
     'GetTrytesCommand',
 ]
 
 
-class GetTrytesCommand(FilterCommand):
+class GetTrytesCommand(ChunkedFilterCommand):
     """
     Executes ``getTrytes`` command.
 
     See :py:meth:`iota.api.StrictIota.get_trytes`.
     """
     command = 'getTrytes'
+    chunked_params = ('hashes',)
+    limit_name = 'maxGetTrytes'
+    merged_param = 'trytes'
 
     def get_request_filter(self):
         return GetTrytesRequestFilter()
@@ -36,8 +39,5 @@ class GetTrytesResponseFilter(ResponseFilter):
     def __init__(self) -> None:
         super(GetTrytesResponseFilter, self).__init__({
             'trytes':
-                f.Array | f.FilterRepeater(
-                    f.ByteString(encoding='ascii') |
-                    Trytes
-                ),
+                f.Array | TrytesArray(),
         })
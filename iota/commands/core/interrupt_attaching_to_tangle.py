@@ -19,6 +19,20 @@ class InterruptAttachingToTangleCommand(FilterCommand):
     def get_response_filter(self):
         pass
 
+    async def _execute(self, request: dict) -> dict:
+        pearl_diver = self.adapter.get_pearl_diver(create=False)
+        if pearl_diver is not None and pearl_diver.is_searching:
+            # Proof-of-work is performed by the built-in engine, so
+            # there is nothing for the node to interrupt.
+            pearl_diver.interrupt()
+            return {}
+
+        if self.adapter.local_pow == 'builtin':
+            # No search is running, so there is nothing to interrupt.
+            return {}
+
+        return await super(FilterCommand, self)._execute(request)
+
 
 class InterruptAttachingToTangleRequestFilter(RequestFilter):
     def __init__(self) -> None:
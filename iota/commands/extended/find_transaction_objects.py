@@ -1,6 +1,7 @@
 from typing import Iterable, List, Optional
 
-from iota import Address, BundleHash, Tag, Transaction, TransactionHash
+from iota import Address, BundleHash, Tag, Transaction, TransactionHash, \
+    TransactionTrytes
 from iota.commands.core import GetTrytesCommand, FindTransactionsCommand
 
 __all__ = [
@@ -16,6 +17,12 @@ class FindTransactionObjectsCommand(FindTransactionsCommand):
     """
     command = 'findTransactionObjects'
 
+    batch_size = 1000
+    """
+    Number of transaction hashes to collect before fetching the
+    corresponding trytes.
+    """
+
     def get_response_filter(self):
         pass
 
@@ -29,23 +36,42 @@ class FindTransactionObjectsCommand(FindTransactionsCommand):
         approvees: Optional[Iterable[TransactionHash]] = request\
             .get('approvees')
 
-        ft_response = await FindTransactionsCommand(adapter=self.adapter)(
-            bundles=bundles,
-            addresses=addresses,
-            tags=tags,
-            approvees=approvees,
-        )
+        transactions: List[Transaction] = []
+        hashes: List[TransactionHash] = []
 
-        hashes = ft_response['hashes']
-        transactions = []
-        if hashes:
-            gt_response = await GetTrytesCommand(adapter=self.adapter)(hashes=hashes)
+        # Stream the results, so that only one batch of raw hashes and
+        # trytes is held in memory at a time.
+        async for txn_hash in FindTransactionsCommand(self.adapter).stream(
+                bundles=bundles,
+                addresses=addresses,
+                tags=tags,
+                approvees=approvees,
+        ):
+            hashes.append(txn_hash)
 
-            transactions: List[Transaction] = list(map(
-                Transaction.from_tryte_string,
-                gt_response.get('trytes') or [],
-            ))
+            if len(hashes) >= self.batch_size:
+                transactions.extend(await self._get_transactions(hashes))
+                hashes = []
+
+        if hashes:
+            transactions.extend(await self._get_transactions(hashes))
 
         return {
             'transactions': transactions,
         }
+
+    async def _get_transactions(
+            self,
+            hashes: List[TransactionHash],
+    ) -> List[Transaction]:
+        """
+        Fetches the transactions with the specified hashes.
+        """
+        trytes = [
+            TransactionTrytes(t)
+            async for t in GetTrytesCommand(self.adapter).stream(hashes=hashes)
+        ]
+
+        # We requested each transaction by its hash, so there's no need
+        # to compute it again.
+        return list(map(Transaction.from_tryte_string, trytes, hashes))
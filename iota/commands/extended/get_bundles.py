@@ -1,9 +1,11 @@
-from typing import Iterable
+from typing import Dict, List
 
 import filters as f
 
-from iota import BadApiResponse, TransactionHash
+from iota import BadApiResponse, Bundle, Transaction, TransactionHash, \
+    TransactionTrytes
 from iota.commands import FilterCommand, RequestFilter
+from iota.commands.core.get_trytes import GetTrytesCommand
 from iota.commands.extended.traverse_bundle import TraverseBundleCommand
 from iota.exceptions import with_context
 from iota.transaction.validator import BundleValidator
@@ -23,6 +25,18 @@ class GetBundlesCommand(FilterCommand):
     """
     command = 'getBundles'
 
+    chunk_size: int = 250
+    """
+    Max number of transaction hashes to send in a single ``getTrytes``
+    request when fetching multiple bundles.
+    """
+
+    max_concurrency: int = 4
+    """
+    Max number of ``getTrytes`` requests in flight at the same time when
+    fetching multiple bundles.
+    """
+
     def get_request_filter(self):
         return GetBundlesRequestFilter()
 
@@ -30,13 +44,22 @@ class GetBundlesCommand(FilterCommand):
         pass
 
     async def _execute(self, request: dict) -> dict:
-        transaction_hashes: Iterable[TransactionHash] = request['transactions']
+        transaction_hashes: List[TransactionHash] = list(
+            request['transactions'],
+        )
+
+        unique_hashes = list(dict.fromkeys(transaction_hashes))
 
-        async def fetch_and_validate(tx_hash):
-            bundle = (await TraverseBundleCommand(self.adapter)(
-                transaction=tx_hash
-            ))['bundles'][0]  # Currently 1 bundle only
+        if len(unique_hashes) == 1:
+            traversed = {
+                unique_hashes[0]: (await TraverseBundleCommand(self.adapter)(
+                    transaction=unique_hashes[0],
+                ))['bundles'][0],  # Currently 1 bundle only
+            }
+        else:
+            traversed = await self._traverse_bundles(unique_hashes)
 
+        for bundle in traversed.values():
             validator = BundleValidator(bundle)
 
             if not validator.is_valid():
@@ -51,17 +74,145 @@ class GetBundlesCommand(FilterCommand):
                     },
                 )
 
-            return bundle
+        return {
+            'bundles': [traversed[tx_hash] for tx_hash in transaction_hashes],
+        }
 
-        # Fetch bundles asynchronously
-        bundles = await asyncio.gather(
-            *[fetch_and_validate(tx_hash) for tx_hash in transaction_hashes]
-        )
+    async def _traverse_bundles(
+            self,
+            tail_hashes: List[TransactionHash],
+    ) -> Dict[TransactionHash, Bundle]:
+        """
+        Traverses multiple bundles at once, advancing every bundle one
+        trunk transaction at a time.
+
+        Each step fetches the next transaction of every unfinished bundle
+        with one (chunked) ``getTrytes`` request, so the number of
+        requests depends on the size of the largest bundle, not on the
+        number of bundles.
+
+        A bundle is finished when its trunk transaction has a different
+        bundle hash (same as :py:class:`TraverseBundleCommand`).
+        """
+        transactions: Dict[TransactionHash, List[Transaction]] = {
+            tail_hash: [] for tail_hash in tail_hashes
+        }
+
+        # Maps the hash of the next transaction to fetch to the bundles
+        # that are waiting for it.
+        frontier: Dict[TransactionHash, List[TransactionHash]] = {
+            tail_hash: [tail_hash] for tail_hash in tail_hashes
+        }
+
+        while frontier:
+            fetched = await self._get_transactions(list(frontier))
+
+            next_frontier: Dict[TransactionHash, List[TransactionHash]] = {}
+
+            for txn_hash, waiting in frontier.items():
+                transaction = fetched.get(txn_hash)
+
+                for tail_hash in waiting:
+                    bundle_txns = transactions[tail_hash]
+
+                    if transaction is None:
+                        raise with_context(
+                            exc=BadApiResponse(
+                                'Could not get trytes of bundle transaction '
+                                'from the Tangle. '
+                                'Bundle transactions not visible.'
+                                '(``exc.context`` has more info).',
+                            ),
+
+                            context={
+                                'transaction_hash': txn_hash,
+                                'tail_hash': tail_hash,
+                            },
+                        )
+
+                    if not bundle_txns:
+                        if transaction.current_index:
+                            raise with_context(
+                                exc=BadApiResponse(
+                                    '``_traverse_bundles`` started with a '
+                                    'non-tail transaction '
+                                    '(``exc.context`` has more info).',
+                                ),
+
+                                context={
+                                    'transaction_object': transaction,
+                                    'tail_hash': tail_hash,
+                                },
+                            )
+                    elif transaction.bundle_hash != bundle_txns[0].bundle_hash:
+                        # We've hit a different bundle; we can stop now.
+                        continue
+
+                    bundle_txns.append(transaction)
+
+                    if transaction.current_index == transaction.last_index == 0:
+                        # Bundle only has one transaction.
+                        continue
+
+                    next_frontier.setdefault(
+                        transaction.trunk_transaction_hash,
+                        [],
+                    ).append(tail_hash)
+
+            frontier = next_frontier
 
         return {
-            'bundles': bundles,
+            tail_hash: Bundle(txns)
+            for tail_hash, txns in transactions.items()
         }
 
+    async def _get_transactions(
+            self,
+            hashes: List[TransactionHash],
+    ) -> Dict[TransactionHash, Transaction]:
+        """
+        Fetches transactions from the Tangle, splitting the hashes into
+        chunks of :py:attr:`chunk_size` and sending up to
+        :py:attr:`max_concurrency` requests at the same time.
+
+        Transactions that the node could not find are omitted.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(chunk: List[TransactionHash]) -> List[TransactionTrytes]:
+            async with semaphore:
+                return (await GetTrytesCommand(self.adapter)(
+                    hashes=chunk,
+                ))['trytes']
+
+        chunks = [
+            hashes[i:i + self.chunk_size]
+            for i in range(0, len(hashes), self.chunk_size)
+        ]
+
+        found_hashes = []
+        found_trytes = []
+
+        for chunk, chunk_trytes in zip(
+                chunks,
+                await asyncio.gather(*map(fetch, chunks)),
+        ):
+            for txn_hash, txn_trytes in zip(chunk, chunk_trytes):
+                txn_trytes = TransactionTrytes(txn_trytes)
+
+                # If no tx was found by the node for txn_hash, it returns
+                # 9s.
+                if txn_trytes != TransactionTrytes(''):
+                    found_hashes.append(txn_hash)
+                    found_trytes.append(txn_trytes)
+
+        # We requested each transaction by its hash, so there's no need
+        # to compute it again.
+        return dict(zip(
+            found_hashes,
+            map(Transaction.from_tryte_string, found_trytes, found_hashes),
+        ))
+
 
 class GetBundlesRequestFilter(RequestFilter):
     def __init__(self) -> None:
@@ -7,6 +7,7 @@ from iota.commands import FilterCommand, RequestFilter
 from iota.commands.core.find_transactions import FindTransactionsCommand
 from iota.commands.core.were_addresses_spent_from import \
     WereAddressesSpentFromCommand
+from iota.commands.extended.utils import scan_addresses
 from iota.crypto.addresses import AddressGenerator
 from iota.crypto.types import Seed
 from iota.filters import SecurityLevel, Trytes
@@ -37,6 +38,7 @@ class GetNewAddressesCommand(FilterCommand):
         index: int = request['index']
         security_level: int = request['securityLevel']
         seed: Seed = request['seed']
+        workers: Optional[int] = request['workers']
 
         return {
             'addresses':
@@ -46,6 +48,7 @@ class GetNewAddressesCommand(FilterCommand):
                     count,
                     security_level,
                     checksum,
+                    workers,
                 ),
         }
 
@@ -55,35 +58,83 @@ class GetNewAddressesCommand(FilterCommand):
             index: int,
             count: Optional[int],
             security_level: int,
-            checksum: bool
+            checksum: bool,
+            workers: Optional[int] = None
     ) -> List[Address]:
         """
         Find addresses matching the command parameters.
         """
-        generator = AddressGenerator(seed, security_level, checksum)
+        generator = AddressGenerator(
+            seed,
+            security_level,
+            checksum,
+            workers=workers,
+        )
+
+        # Address generation is CPU-bound; run it in a separate thread so
+        # that it doesn't block the event loop.
+        loop = asyncio.get_event_loop()
+
+        if count is None and self.adapter.scan_window:
+            # Check a window of addresses per request.
+            async for addy, hashes, spent in scan_addresses(
+                    self.adapter,
+                    generator,
+                    index,
+                    self.adapter.scan_window,
+            ):
+                if not (hashes or spent):
+                    return [addy]
 
         if count is None:
             # Connect to Tangle and find the first unused address.
-            for addy in generator.create_iterator(start=index):
-                # We use addy.address here because the commands do
-                # not work on an address with a checksum
-                # Execute two checks concurrently
-                responses = await asyncio.gather(
-                    WereAddressesSpentFromCommand(self.adapter)(
-                        addresses=[addy.address],
-                    ),
-                    FindTransactionsCommand(self.adapter)(
-                        addresses=[addy.address],
-                    ),
-                )
-                # responses[0] -> was it spent from?
-                # responses[1] -> any transaction found?
-                if responses[0]['states'][0] or responses[1].get('hashes'):
-                    continue
-
-                return [addy]
-
-        return generator.get_addresses(start=index, count=count)
+            # The next addresses are generated while we wait for the
+            # node to respond.
+            iterator = generator.create_iterator(
+                start=index,
+                prefetch=workers or 1,
+            )
+
+            next_address: Optional[asyncio.Future] = None
+
+            try:
+                while True:
+                    # Shield the call, so that if this task is cancelled,
+                    # we can still wait for ``next`` to finish below.
+                    next_address = loop.run_in_executor(None, next, iterator)
+                    addy = await asyncio.shield(next_address)
+
+                    # We use addy.address here because the commands do
+                    # not work on an address with a checksum
+                    # Execute two checks concurrently
+                    responses = await asyncio.gather(
+                        WereAddressesSpentFromCommand(self.adapter)(
+                            addresses=[addy.address],
+                        ),
+                        FindTransactionsCommand(self.adapter)(
+                            addresses=[addy.address],
+                        ),
+                    )
+                    # responses[0] -> was it spent from?
+                    # responses[1] -> any transaction found?
+                    if responses[0]['states'][0] or responses[1].get('hashes'):
+                        continue
+
+                    return [addy]
+            finally:
+                # The iterator can't be closed while ``next`` is still
+                # running in another thread.
+                if next_address is not None and not next_address.done():
+                    await asyncio.wait([next_address])
+
+                iterator.close()
+
+        return await loop.run_in_executor(
+            None,
+            generator.get_addresses,
+            index,
+            count,
+        )
 
 
 class GetNewAddressesRequestFilter(RequestFilter):
@@ -97,6 +148,9 @@ class GetNewAddressesRequestFilter(RequestFilter):
                 'securityLevel': SecurityLevel,
 
                 'seed': f.Required | Trytes(Seed),
+
+                # Local setting; not sent to the node.
+                'workers': f.Type(int) | f.Min(0),
             },
 
             allow_missing_keys={
@@ -104,5 +158,6 @@ class GetNewAddressesRequestFilter(RequestFilter):
                 'count',
                 'index',
                 'securityLevel',
+                'workers',
             },
         )
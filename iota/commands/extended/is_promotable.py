@@ -2,7 +2,7 @@ from typing import Optional
 
 from iota.commands import FilterCommand, RequestFilter
 from iota.commands.core import CheckConsistencyCommand, GetTrytesCommand
-from iota.transaction import Transaction
+from iota.transaction import LazyTransaction
 from iota import TransactionHash
 import filters as f
 from iota.filters import Trytes
@@ -69,9 +69,14 @@ class IsPromotableCommand(FilterCommand):
                 'info': cc_response['info'],
             }
       
+        # Only the attachment timestamps are needed, so decode the
+        # transactions lazily.
         transactions = [
-            Transaction.from_tryte_string(x) for x in
-            (await GetTrytesCommand(self.adapter)(hashes=tails))['trytes']
+            LazyTransaction.from_tryte_string(x, tx_hash) for tx_hash, x in
+            zip(
+                tails,
+                (await GetTrytesCommand(self.adapter)(hashes=tails))['trytes'],
+            )
         ]
 
         response = {
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import filters as f
 
@@ -6,6 +6,8 @@ from iota import BadApiResponse, Transaction, \
     TransactionHash, TryteString, Bundle, TransactionTrytes
 from iota.commands import FilterCommand, RequestFilter
 from iota.commands.core.get_trytes import GetTrytesCommand
+from iota.commands.extended.find_transaction_objects import \
+    FindTransactionObjectsCommand
 from iota.exceptions import with_context
 from iota.filters import Trytes
 
@@ -45,33 +47,19 @@ class TraverseBundleCommand(FilterCommand):
             target_bundle_hash: Optional[TransactionHash]
     ) -> List[Transaction]:
         """
-        Recursively traverse the Tangle, collecting transactions until
-        we hit a new bundle.
+        Traverse the Tangle, collecting transactions until we hit a new
+        bundle.
 
-        This method is (usually) faster than ``findTransactions``, and
-        it ensures we don't collect transactions from replayed bundles.
-        """
-        trytes: List[TryteString] = (await GetTrytesCommand(self.adapter)(
-            hashes=[txn_hash])
-        )['trytes']
-
-        # If no tx was found by the node for txn_hash, it returns 9s,
-        # so we check here if it returned all 9s trytes.
-        if not trytes or trytes == [TransactionTrytes('')]:
-            raise with_context(
-                exc=BadApiResponse(
-                    'Could not get trytes of bundle transaction from the Tangle. '
-                    'Bundle transactions not visible.'
-                    '(``exc.context`` has more info).',
-                ),
-
-                context={
-                    'transaction_hash': txn_hash,
-                    'target_bundle_hash': target_bundle_hash,
-                },
-            )
+        After fetching the tail transaction, every transaction with the
+        same bundle hash is fetched in one batch, and the trunk chain is
+        assembled locally.  Transactions are only fetched one at a time
+        if the node's results are incomplete.
 
-        transaction = Transaction.from_tryte_string(trytes[0])
+        Following the trunk chain (instead of simply returning every
+        transaction with the bundle hash) ensures we don't collect
+        transactions from replayed bundles.
+        """
+        transaction = await self._get_transaction(txn_hash, target_bundle_hash)
 
         if (not target_bundle_hash) and transaction.current_index:
             raise with_context(
@@ -97,12 +85,73 @@ class TraverseBundleCommand(FilterCommand):
             # Bundle only has one transaction.
             return [transaction]
 
-        # Recursively follow the trunk transaction, to fetch the next
-        # transaction in the bundle.
-        return [transaction] + await self._traverse_bundle(
-            transaction.trunk_transaction_hash,
-            target_bundle_hash
-        )
+        candidates: Dict[TransactionHash, Transaction] = {
+            txn.hash: txn
+            for txn in (await FindTransactionObjectsCommand(self.adapter)(
+                bundles=[target_bundle_hash],
+            ))['transactions']
+            if txn.bundle_hash == target_bundle_hash
+        }
+
+        transactions = [transaction]
+
+        # Follow the trunk transactions, to collect the rest of the
+        # bundle.
+        while True:
+            trunk_hash = transaction.trunk_transaction_hash
+
+            if trunk_hash in candidates:
+                transaction = candidates[trunk_hash]
+            elif candidates and (
+                    transaction.current_index == transaction.last_index
+            ):
+                # The whole bundle was found in the batch.
+                break
+            else:
+                # The node's results are incomplete; fetch the next
+                # transaction separately.
+                transaction = await self._get_transaction(
+                    trunk_hash,
+                    target_bundle_hash,
+                )
+
+                if target_bundle_hash != transaction.bundle_hash:
+                    # We've hit a different bundle; we can stop now.
+                    break
+
+            transactions.append(transaction)
+
+        return transactions
+
+    async def _get_transaction(
+            self,
+            txn_hash: TransactionHash,
+            target_bundle_hash: Optional[TransactionHash]
+    ) -> Transaction:
+        """
+        Fetches a single transaction from the Tangle.
+        """
+        trytes: List[TryteString] = (await GetTrytesCommand(self.adapter)(
+            hashes=[txn_hash])
+        )['trytes']
+
+        # If no tx was found by the node for txn_hash, it returns 9s,
+        # so we check here if it returned all 9s trytes.
+        if not trytes or trytes == [TransactionTrytes('')]:
+            raise with_context(
+                exc=BadApiResponse(
+                    'Could not get trytes of bundle transaction from the Tangle. '
+                    'Bundle transactions not visible.'
+                    '(``exc.context`` has more info).',
+                ),
+
+                context={
+                    'transaction_hash': txn_hash,
+                    'target_bundle_hash': target_bundle_hash,
+                },
+            )
+
+        return Transaction.from_tryte_string(trytes[0])
 
 
 class TraverseBundleRequestFilter(RequestFilter):
@@ -1,6 +1,8 @@
+import asyncio
+from time import monotonic
 from typing import Iterable, List, Optional, Tuple
 
-from iota import Address, Bundle, Transaction, \
+from iota import Address, Bundle, LazyTransaction, Transaction, \
     TransactionHash, TransactionTrytes, BadApiResponse
 from iota.adapter import BaseAdapter
 from iota.exceptions import with_context
@@ -15,6 +17,18 @@ from iota.commands.core.get_inclusion_states import \
 from iota.crypto.addresses import AddressGenerator
 from iota.crypto.types import Seed
 
+MAX_SCAN_WINDOW = 250
+"""
+Upper bound for the number of addresses that :py:func:`scan_addresses`
+checks in a single window.
+"""
+
+MAX_SCAN_CONCURRENCY = 4
+"""
+Maximum number of ``findTransactions`` requests that
+:py:func:`scan_addresses` sends at the same time.
+"""
+
 
 async def iter_used_addresses(
         adapter: BaseAdapter,
@@ -31,6 +45,9 @@ async def iter_used_addresses(
     This is basically the opposite of invoking ``getNewAddresses`` with
     ``count=None``.
 
+    If the adapter has a ``scan_window`` set, addresses are checked in
+    batches (see :py:func:`scan_addresses`).
+
     .. important::
         This is an async generator!
 
@@ -38,6 +55,20 @@ async def iter_used_addresses(
     if security_level is None:
         security_level = AddressGenerator.DEFAULT_SECURITY_LEVEL
 
+    if adapter.scan_window:
+        async for addy, hashes, spent in scan_addresses(
+                adapter,
+                AddressGenerator(seed, security_level),
+                start,
+                adapter.scan_window,
+        ):
+            if not (hashes or spent):
+                break
+
+            yield addy, hashes
+
+        return
+
     ft_command = FindTransactionsCommand(adapter)
     wasf_command = WereAddressesSpentFromCommand(adapter)
 
@@ -58,6 +89,85 @@ async def iter_used_addresses(
         wasf_command.reset()
 
 
+async def scan_addresses(
+        adapter: BaseAdapter,
+        generator: AddressGenerator,
+        start: int,
+        window: int,
+) -> 'AsyncGenerator[Tuple[Address, List[TransactionHash], bool], None]':
+    """
+    Checks addresses in windows, instead of one address at a time.
+
+    For each window, one ``wereAddressesSpentFrom`` request checks every
+    address, and one ``findTransactions`` request per address (up to
+    :py:data:`MAX_SCAN_CONCURRENCY` at a time) finds its transactions.
+    ``findTransactions`` does not say which address each hash belongs
+    to, so sending the addresses separately avoids downloading the
+    trytes of every transaction just to find out.
+
+    Yields ``(address, transaction hashes, was spent from)`` for each
+    address, in order, up to and including the first unused address.
+
+    The window starts at ``window`` addresses.  It grows while the node's
+    response time exceeds the time it takes to generate the addresses
+    (so that fewer round-trips are needed), and shrinks when address
+    generation dominates (so that fewer addresses are generated past the
+    first unused one).
+
+    .. important::
+        This is an async generator!
+
+    """
+    loop = asyncio.get_event_loop()
+    semaphore = asyncio.Semaphore(MAX_SCAN_CONCURRENCY)
+
+    async def find_transactions(address: Address) -> List[TransactionHash]:
+        async with semaphore:
+            response = await FindTransactionsCommand(adapter)(
+                addresses=[address],
+            )
+
+        return response['hashes']
+
+    index = start
+    while True:
+        started = monotonic()
+        addresses = await loop.run_in_executor(
+            None,
+            generator.get_addresses,
+            index,
+            window,
+        )
+        generate_time = monotonic() - started
+
+        # The commands do not work on addresses with a checksum.
+        raw_addresses = [addy.address for addy in addresses]
+
+        started = monotonic()
+        wasf_response, *hashes_per_address = await asyncio.gather(
+            WereAddressesSpentFromCommand(adapter)(addresses=raw_addresses),
+            *map(find_transactions, raw_addresses),
+        )
+        request_time = monotonic() - started
+
+        for addy, hashes, spent in zip(
+                addresses,
+                hashes_per_address,
+                wasf_response['states'],
+        ):
+            yield addy, hashes, spent
+
+            if not (hashes or spent):
+                return
+
+        index += window
+
+        if request_time > generate_time:
+            window = min(window * 2, MAX_SCAN_WINDOW)
+        elif request_time * 2 < generate_time:
+            window = max(window // 2, 1)
+
+
 async def get_bundles_from_transaction_hashes(
         adapter: BaseAdapter,
         transaction_hashes: Iterable[TransactionHash],
@@ -75,8 +185,16 @@ async def get_bundles_from_transaction_hashes(
     tail_transaction_hashes = set()
     non_tail_bundle_hashes = set()
 
-    gt_response = await GetTrytesCommand(adapter)(hashes=transaction_hashes)
-    for tx_hash, tx_trytes in zip(transaction_hashes, gt_response['trytes']):
+    # Stream the trytes, converting each transaction as it arrives, so
+    # that the raw response is never held in memory all at once.
+    all_transactions: List[Transaction] = []
+    i = 0
+    async for tx_trytes in GetTrytesCommand(adapter).stream(
+            hashes=transaction_hashes,
+    ):
+        tx_hash = transaction_hashes[i]
+        i += 1
+
         # If no tx was found by the node for tx_hash, it returns 9s,
         # so we check here if it returned all 9s trytes.
         if tx_trytes == TransactionTrytes(''):
@@ -91,10 +209,13 @@ async def get_bundles_from_transaction_hashes(
                         'returned_transaction_trytes': tx_trytes,
                     },
             )
-    all_transactions: List[Transaction] = list(map(
-        Transaction.from_tryte_string,
-        gt_response['trytes'],
-    ))
+
+        # We already know the hash, and only need a couple of fields to
+        # sort the transactions into bundles, so there's no need to
+        # decode the whole transaction.
+        all_transactions.append(
+            LazyTransaction.from_tryte_string(tx_trytes, tx_hash),
+        )
 
     for txn in all_transactions:
         if txn.is_tail:
@@ -1,16 +1,321 @@
-from typing import Generator, Iterable, List
+import sqlite3
+from abc import ABCMeta, abstractmethod as abstract_method
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from hashlib import sha256
+from threading import Lock, RLock
+from typing import Callable, Dict, Generator, Iterable, List, Optional, \
+    Tuple
+from weakref import WeakValueDictionary
 
 from iota import Address, TRITS_PER_TRYTE, TrytesCompatible
 from iota.crypto.kerl import Kerl
-from iota.crypto.signing import KeyGenerator, KeyIterator
+from iota.crypto.signing import KeyGenerator, KeyIterator, \
+    get_worker_pool, map_index_range
 from iota.crypto.types import Digest, PrivateKey, Seed
 from iota.exceptions import with_context
 
 __all__ = [
     'AddressGenerator',
+    'BaseAddressCache',
+    'MemoryAddressCache',
+    'SqliteAddressCache',
 ]
 
 
+class BaseAddressCache(object, metaclass=ABCMeta):
+    """
+    Cache used to improve the performance of
+    :py:class:`AddressGenerator`.
+
+    Each cached item applies to a single seed, key index and security
+    level.  Seeds are never stored; items are keyed by a fingerprint of
+    the seed instead (see :py:meth:`get_seed_fingerprint`).
+
+    Addresses are always cached without a checksum.
+    """
+
+    def __init__(self) -> None:
+        super(BaseAddressCache, self).__init__()
+
+        self.lock = RLock()
+
+        # Locks for addresses that are being generated; entries are
+        # discarded automatically once nobody holds the lock.
+        self._address_locks: \
+            'WeakValueDictionary[Tuple[str, int, int], Lock]' = \
+            WeakValueDictionary()
+
+    def acquire_lock(self) -> RLock:
+        """
+        Acquires a lock for the cache instance, to prevent other threads
+        from generating the same addresses at the same time.
+        """
+        return self.lock
+
+    def acquire_address_lock(
+            self,
+            seed: Seed,
+            index: int,
+            security_level: int,
+    ) -> Lock:
+        """
+        Returns a lock for a single address, to prevent other threads
+        from generating the same address at the same time.
+
+        Unlike :py:meth:`acquire_lock`, this does not block threads that
+        are generating other addresses.
+        """
+        key = (self.get_seed_fingerprint(seed), index, security_level)
+
+        with self.lock:
+            lock = self._address_locks.get(key)
+            if lock is None:
+                lock = self._address_locks[key] = Lock()
+
+            return lock
+
+    @abstract_method
+    def get(
+            self,
+            seed: Seed,
+            index: int,
+            security_level: int,
+    ) -> Optional[Address]:
+        """
+        Retrieves an address from the cache.
+
+        :return:
+            The cached address, or ``None`` if it isn't cached.
+        """
+        raise NotImplementedError(
+            'Not implemented in {cls}.'.format(cls=type(self).__name__),
+        )
+
+    @abstract_method
+    def set(self, seed: Seed, address: Address) -> None:
+        """
+        Adds an address to the cache.
+
+        The key index and security level are taken from the address.
+        """
+        raise NotImplementedError(
+            'Not implemented in {cls}.'.format(cls=type(self).__name__),
+        )
+
+    @abstract_method
+    def clear(self) -> None:
+        """
+        Removes every address from the cache.
+        """
+        raise NotImplementedError(
+            'Not implemented in {cls}.'.format(cls=type(self).__name__),
+        )
+
+    def get_many(
+            self,
+            seed: Seed,
+            indexes: Iterable[int],
+            security_level: int,
+    ) -> Dict[int, Address]:
+        """
+        Retrieves several addresses from the cache at once.
+
+        :return:
+            Cached addresses, keyed by index.  Indexes that aren't cached
+            are omitted.
+        """
+        cached = {}
+
+        for index in indexes:
+            address = self.get(seed, index, security_level)
+            if address is not None:
+                cached[index] = address
+
+        return cached
+
+    def set_many(self, seed: Seed, addresses: Iterable[Address]) -> None:
+        """
+        Adds several addresses to the cache at once.
+        """
+        for address in addresses:
+            self.set(seed, address)
+
+    @staticmethod
+    def get_seed_fingerprint(seed: Seed) -> str:
+        """
+        Returns the value used to identify a seed in the cache.
+        """
+        return sha256(b'address-cache:' + bytes(seed)).hexdigest()
+
+    @staticmethod
+    def _strip_checksum(address: Address) -> Address:
+        """
+        Returns a copy of the address without its checksum.
+        """
+        return Address(
+            address.address,
+            key_index=address.key_index,
+            security_level=address.security_level,
+        )
+
+
+class MemoryAddressCache(BaseAddressCache):
+    """
+    Caches addresses in memory.
+
+    :param Optional[int] max_size:
+        Maximum number of addresses to keep; the least recently used
+        addresses are evicted first.  If ``None``, the cache is
+        unbounded.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super(MemoryAddressCache, self).__init__()
+
+        self.max_size = max_size
+        self.cache: \
+            'OrderedDict[Tuple[str, int, int], Address]' = OrderedDict()
+
+    def get(
+            self,
+            seed: Seed,
+            index: int,
+            security_level: int,
+    ) -> Optional[Address]:
+        key = (self.get_seed_fingerprint(seed), index, security_level)
+
+        with self.lock:
+            address = self.cache.get(key)
+            if address is not None:
+                self.cache.move_to_end(key)
+
+            return address
+
+    def set(self, seed: Seed, address: Address) -> None:
+        key = (
+            self.get_seed_fingerprint(seed),
+            address.key_index,
+            address.security_level,
+        )
+
+        with self.lock:
+            self.cache[key] = self._strip_checksum(address)
+            self.cache.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(self.cache) > self.max_size:
+                    self.cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+
+class SqliteAddressCache(BaseAddressCache):
+    """
+    Caches addresses in a SQLite database, so that they persist between
+    runs.
+
+    :param str path:
+        Path to the database file (created if necessary).
+    """
+
+    def __init__(self, path: str) -> None:
+        super(SqliteAddressCache, self).__init__()
+
+        self.path = path
+
+        # Access is serialized by :py:attr:`lock`.
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self.lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS addresses ('
+                '  seed_fingerprint TEXT NOT NULL,'
+                '  key_index INTEGER NOT NULL,'
+                '  security_level INTEGER NOT NULL,'
+                '  address TEXT NOT NULL,'
+                '  PRIMARY KEY (seed_fingerprint, key_index, security_level)'
+                ')'
+            )
+
+    def get(
+            self,
+            seed: Seed,
+            index: int,
+            security_level: int,
+    ) -> Optional[Address]:
+        return self.get_many(seed, [index], security_level).get(index)
+
+    def get_many(
+            self,
+            seed: Seed,
+            indexes: Iterable[int],
+            security_level: int,
+    ) -> Dict[int, Address]:
+        fingerprint = self.get_seed_fingerprint(seed)
+
+        with self.lock:
+            rows = [
+                self._connection.execute(
+                    'SELECT key_index, address FROM addresses '
+                    'WHERE seed_fingerprint = ? AND key_index = ? '
+                    'AND security_level = ?',
+                    (fingerprint, index, security_level),
+                ).fetchone()
+                for index in indexes
+            ]
+
+        return {
+            row[0]: Address(
+                row[1].encode('ascii'),
+                key_index=row[0],
+                security_level=security_level,
+            )
+            for row in rows
+            if row is not None
+        }
+
+    def set(self, seed: Seed, address: Address) -> None:
+        self.set_many(seed, [address])
+
+    def set_many(self, seed: Seed, addresses: Iterable[Address]) -> None:
+        fingerprint = self.get_seed_fingerprint(seed)
+
+        with self.lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO addresses '
+                '(seed_fingerprint, key_index, security_level, address) '
+                'VALUES (?, ?, ?, ?)',
+
+                [
+                    (
+                        fingerprint,
+                        address.key_index,
+                        address.security_level,
+                        str(address.address),
+                    )
+                    for address in addresses
+                ],
+            )
+
+    def clear(self) -> None:
+        with self.lock, self._connection:
+            self._connection.execute('DELETE FROM addresses')
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self.lock:
+            self._connection.close()
+
+
 class AddressGenerator(Iterable[Address]):
     """
     Generates new addresses using a standard algorithm.
@@ -42,6 +347,19 @@ class AddressGenerator(Iterable[Address]):
     :param bool checksum:
         Whether to generate address with or without checksum.
 
+    :param Optional[int] workers:
+        Number of worker processes to spread address generation across.
+        By default, addresses are generated in the calling thread.
+
+    :param Optional[Executor] executor:
+        Executor to spread address generation across, instead of
+        starting new worker processes.
+
+    :param Optional[BaseAddressCache] cache:
+        Cache to look addresses up in before generating them (and to
+        store newly-generated addresses in).  Defaults to
+        :py:attr:`AddressGenerator.cache`.
+
     :returns: :py:class:`iota.crypto.addresses.AddressGenerator` object.
     """
     DEFAULT_SECURITY_LEVEL = 2
@@ -58,17 +376,35 @@ class AddressGenerator(Iterable[Address]):
     - :py:class:`iota.transaction.BundleValidator`
     """
 
+    cache: Optional[BaseAddressCache] = None
+    """
+    Default cache for every ``AddressGenerator`` (including the ones that
+    the API commands create internally).
+
+    Example::
+
+        AddressGenerator.cache = SqliteAddressCache('addresses.db')
+    """
+
     def __init__(
             self,
             seed: TrytesCompatible,
             security_level: int = DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> None:
         super(AddressGenerator, self).__init__()
 
+        if cache is not None:
+            self.cache = cache
+
         self.security_level = security_level
         self.checksum = checksum
         self.seed = Seed(seed)
+        self.workers = workers
+        self.executor = executor
 
     def __iter__(self) -> Generator[Address, None, None]:
         """
@@ -143,6 +479,9 @@ class AddressGenerator(Iterable[Address]):
                 },
             )
 
+        if self.workers or self.executor:
+            return self._get_addresses_in_parallel(start, count, step)
+
         generator = self.create_iterator(start, step)
 
         addresses = []
@@ -159,7 +498,8 @@ class AddressGenerator(Iterable[Address]):
     def create_iterator(
             self,
             start: int = 0,
-            step: int = 1
+            step: int = 1,
+            prefetch: int = 0,
     ) -> Generator[Address, None, None]:
         """
         Creates an iterator that can be used to progressively generate new
@@ -183,10 +523,20 @@ class AddressGenerator(Iterable[Address]):
                 The generator may take awhile to advance between
                 iterations if ``step`` is a large number!
 
+        :param int prefetch:
+            Number of addresses to generate ahead of the consumer, in
+            the background (using :py:attr:`executor`, worker processes
+            if :py:attr:`workers` is set, or a background thread
+            otherwise).
+
         :return:
             ``Generator[Address, None, None]`` object that you can iterate to
             generate addresses.
         """
+        if prefetch > 0:
+            yield from self._create_prefetching_iterator(start, step, prefetch)
+            return
+
         key_iterator = (
             KeyGenerator(self.seed).create_iterator(
                 start,
@@ -195,8 +545,213 @@ class AddressGenerator(Iterable[Address]):
             )
         )
 
-        while True:
-            yield self._generate_address(key_iterator)
+        if self.cache is None:
+            while True:
+                yield self._generate_address(key_iterator)
+
+        while key_iterator.current >= 0:
+            # Hold the lock for this address, so that other threads don't
+            # generate the same address at the same time.
+            with self.cache.acquire_address_lock(
+                    self.seed,
+                    key_iterator.current,
+                    self.security_level,
+            ):
+                address = self.cache.get(
+                    self.seed,
+                    key_iterator.current,
+                    self.security_level,
+                )
+
+                if address is None:
+                    address = self._generate_address(key_iterator)
+                    self.cache.set(self.seed, address)
+                else:
+                    key_iterator.advance()
+
+                    if self.checksum:
+                        address = address.with_valid_checksum()
+
+            yield address
+
+    def precompute(self, start: int, count: int) -> None:
+        """
+        Generates addresses and stores them in :py:attr:`cache`, without
+        returning them.
+
+        Use this to fill the cache ahead of time (e.g., offline), so that
+        later lookups for these addresses are fast.
+
+        Addresses that are already cached are skipped.  Generation is
+        spread across :py:attr:`workers`/:py:attr:`executor` if set.
+
+        :param int start:
+            Starting index.
+            Must be >= 0.
+
+        :param int count:
+            Number of addresses to generate.
+            Must be > 0.
+
+        :raises ValueError:
+            - if no cache is configured.
+            - if ``count`` is lower than 1.
+        """
+        if self.cache is None:
+            raise with_context(
+                exc=ValueError('No address cache configured.'),
+
+                context={
+                    'start': start,
+                    'count': count,
+                },
+            )
+
+        self.get_addresses(start, count)
+
+    def _get_addresses_in_parallel(
+            self,
+            start: int,
+            count: int,
+            step: int,
+    ) -> List[Address]:
+        """
+        Implements :py:meth:`get_addresses` when :py:attr:`workers` or
+        :py:attr:`executor` is set.
+
+        If a cache is configured, only addresses that are missing from
+        the cache are generated.
+        """
+        if self.cache is None:
+            return map_index_range(
+                self._get_address_factory(),
+                start,
+                count,
+                step,
+                self.workers,
+                self.executor,
+            )
+
+        indexes = [
+            i for i in range(start, start + (count * step), step)
+            if i >= 0
+        ]
+
+        # The cache is only locked while reading and writing, so that
+        # other threads can generate addresses at the same time.
+        addresses = self.cache.get_many(
+            self.seed,
+            indexes,
+            self.security_level,
+        )
+
+        # Generate each contiguous run of missing indexes as a single
+        # range.
+        missing: List[Tuple[int, int]] = []
+        for i in indexes:
+            if i in addresses:
+                continue
+
+            if missing and (missing[-1][0] + missing[-1][1] * step == i):
+                missing[-1] = (missing[-1][0], missing[-1][1] + 1)
+            else:
+                missing.append((i, 1))
+
+        factory = self._get_address_factory()
+        for run_start, run_count in missing:
+            generated = map_index_range(
+                factory,
+                run_start,
+                run_count,
+                step,
+                self.workers,
+                self.executor,
+            )
+
+            self.cache.set_many(self.seed, generated)
+            addresses.update((a.key_index, a) for a in generated)
+
+        result = [addresses[i] for i in indexes]
+
+        if self.checksum:
+            result = [
+                a if a.checksum else a.with_valid_checksum()
+                for a in result
+            ]
+
+        return result
+
+    def _create_prefetching_iterator(
+            self,
+            start: int,
+            step: int,
+            prefetch: int,
+    ) -> Generator[Address, None, None]:
+        """
+        Implements :py:meth:`create_iterator` when ``prefetch`` is set.
+        """
+        executor = self.executor
+        if executor is None:
+            if self.workers:
+                executor = get_worker_pool(self.workers)
+            else:
+                executor = _get_background_executor()
+
+        factory = self._get_address_factory()
+
+        pending = deque()
+        index = start
+
+        try:
+            while True:
+                while (len(pending) < prefetch) and (index >= 0):
+                    cached = None
+                    if self.cache is not None:
+                        cached = self.cache.get(
+                            self.seed,
+                            index,
+                            self.security_level,
+                        )
+
+                    if cached is None:
+                        pending.append(executor.submit(factory, index, 1, 1))
+                    else:
+                        if self.checksum:
+                            cached = cached.with_valid_checksum()
+
+                        pending.append(cached)
+
+                    index += step
+
+                if not pending:
+                    return
+
+                address = pending.popleft()
+                if not isinstance(address, Address):
+                    address = address.result()[0]
+
+                    if self.cache is not None:
+                        self.cache.set(self.seed, address)
+
+                yield address
+        finally:
+            # The executor is shared, so stop the work that nobody is
+            # waiting for anymore.
+            for future in pending:
+                if not isinstance(future, Address):
+                    future.cancel()
+
+    def _get_address_factory(self) -> Callable[[int, int, int], List[Address]]:
+        """
+        Returns a picklable callable that generates addresses with the
+        same settings as this generator (used by worker processes).
+        """
+        return partial(
+            _generate_addresses,
+            self.seed,
+            self.security_level,
+            self.checksum,
+        )
 
     @staticmethod
     def address_from_digest(digest: Digest) -> Address:
@@ -241,3 +796,48 @@ class AddressGenerator(Iterable[Address]):
         """
         private_key: PrivateKey = next(key_iterator)
         return private_key.get_digest()
+
+
+def _generate_addresses(
+        seed: Seed,
+        security_level: int,
+        checksum: bool,
+        start: int,
+        count: int,
+        step: int,
+) -> List[Address]:
+    """
+    Generates addresses in a worker process.
+
+    References:
+
+    - :py:meth:`AddressGenerator.get_addresses`
+    """
+    generator = AddressGenerator(seed, security_level, checksum)
+
+    # The calling generator takes care of the cache.
+    generator.cache = None
+
+    return generator.get_addresses(start, count, step)
+
+
+_background_executor: Optional[ThreadPoolExecutor] = None
+_background_executor_lock = Lock()
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    """
+    Returns the thread pool used to prefetch addresses when no worker
+    processes are configured.
+
+    The pool is started on first use and shared by every generator.
+    """
+    global _background_executor
+
+    with _background_executor_lock:
+        if _background_executor is None:
+            _background_executor = ThreadPoolExecutor(
+                thread_name_prefix='AddressGenerator',
+            )
+
+        return _background_executor
@@ -0,0 +1,386 @@
+"""
+Bit-sliced implementation of Curl, used to hash many inputs at once.
+
+Instead of storing one trit per list item (see
+:py:class:`iota.crypto.pycurl.Curl`), :py:class:`BatchCurl` stores each
+trit of the sponge state as two bits (a "low" and a "high" bit), and
+packs the bits of every lane (independent sponge) into a single Python
+integer.  Each bitwise operation in :py:meth:`BatchCurl._transform`
+therefore advances every sponge in the batch at once.
+
+References:
+
+- https://github.com/iotaledger/iri/blob/v1.8.6/src/main/java/com/iota/iri/crypto/PearlDiver.java
+"""
+
+from typing import Iterable, List, Sequence, Tuple, Type, TypeVar
+
+from iota.crypto.pycurl import (
+    HASH_LENGTH,
+    NUMBER_OF_ROUNDS,
+    STATE_LENGTH,
+    TRANSFORM_INDICES,
+)
+from iota.exceptions import with_context
+from iota.types import Hash, TryteString, TrytesCompatible
+
+__all__ = [
+    'BatchCurl',
+    'curl_hash_many',
+]
+
+T = TypeVar('T', bound=TryteString)
+
+MAX_LANES = 1024
+"""
+Maximum number of sponges that :py:func:`curl_hash_many` will pack into
+a single :py:class:`BatchCurl`.
+
+Python integers are arbitrary-precision, so this is not a hard limit;
+larger batches are still correct, but each additional lane saves less
+time while the memory needed to transpose the inputs keeps growing.
+"""
+
+MIN_LANES = 3
+"""
+Smallest number of sponges for which a :py:class:`BatchCurl` is faster
+than hashing each input separately with :py:class:`iota.crypto.Curl`.
+
+Every transform costs the same regardless of how many lanes are used,
+so small batches are slower than the scalar sponge.
+"""
+
+TRYTE_LENGTH = HASH_LENGTH // 3
+"""
+Number of trytes absorbed per transform.
+"""
+
+
+_INDEX_PAIRS = list(zip(TRANSFORM_INDICES[:-1], TRANSFORM_INDICES[1:]))
+"""
+Pairs of state positions that are combined to produce each trit of the
+new state.
+"""
+
+# Trits are encoded as (low, high) bits:
+#   -1 => (1, 0)
+#    0 => (1, 1)
+#    1 => (0, 1)
+#
+# The tables below map each ASCII tryte to the ``'0'``/``'1'`` character
+# of the low or high bit of its first, second and third trit, so that
+# the bit planes can be built with :py:meth:`bytes.translate` and
+# :py:func:`int`.
+_TRYTE_ALPHABET = b'9ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+_TRYTE_TRITS = [
+    (0, 0, 0), (1, 0, 0), (-1, 1, 0), (0, 1, 0), (1, 1, 0), (-1, -1, 1),
+    (0, -1, 1), (1, -1, 1), (-1, 0, 1), (0, 0, 1), (1, 0, 1), (-1, 1, 1),
+    (0, 1, 1), (1, 1, 1), (-1, -1, -1), (0, -1, -1), (1, -1, -1),
+    (-1, 0, -1), (0, 0, -1), (1, 0, -1), (-1, 1, -1), (0, 1, -1),
+    (1, 1, -1), (-1, -1, 0), (0, -1, 0), (1, -1, 0), (-1, 0, 0),
+]
+
+
+def _build_plane_tables(plane: int) -> List[bytes]:
+    tables = []
+    for position in range(3):
+        table = bytearray(range(256))
+        for char, trits in zip(_TRYTE_ALPHABET, _TRYTE_TRITS):
+            trit = trits[position]
+            bit = (trit != 1) if plane == 0 else (trit != -1)
+            table[char] = ord('1') if bit else ord('0')
+        tables.append(bytes(table))
+    return tables
+
+
+_LOW_TABLES = _build_plane_tables(0)
+_HIGH_TABLES = _build_plane_tables(1)
+
+# Maps the sum of (low bit char) + 2 * (high bit char) for three
+# consecutive trits back to the corresponding ASCII tryte.
+_TRIT_CODE = {(1, 0): 1, (1, 1): 3, (0, 1): 2}
+
+_CODE_TO_TRYTE = bytearray(256)
+for _char, _trits in zip(_TRYTE_ALPHABET, _TRYTE_TRITS):
+    _codes = [
+        _TRIT_CODE[(int(t != 1), int(t != -1))]
+        for t in _trits
+    ]
+    _CODE_TO_TRYTE[_codes[0] + 4 * _codes[1] + 16 * _codes[2]] = _char
+_CODE_TO_TRYTE = bytes(_CODE_TO_TRYTE)
+
+_LOW_CODE = bytes.maketrans(b'01', b'\x00\x01')
+_HIGH_CODE = bytes.maketrans(b'01', b'\x00\x02')
+_TIMES_4 = bytes((4 * i) & 0xFF for i in range(256))
+_TIMES_16 = bytes((16 * i) & 0xFF for i in range(256))
+
+
+def _as_tryte_bytes(trytes: TrytesCompatible) -> bytes:
+    """
+    Returns the ASCII representation of a tryte sequence, validating it
+    unless it is already a :py:class:`TryteString`.
+    """
+    if not isinstance(trytes, TryteString):
+        trytes = TryteString(trytes)
+
+    return bytes(trytes)
+
+
+def _interleave(planes: Sequence[bytes]) -> bytes:
+    """
+    Interleaves the per-position bit planes of a tryte sequence, so that
+    the result contains one character per trit.
+    """
+    result = bytearray(len(planes[0]) * 3)
+    result[0::3] = planes[0]
+    result[1::3] = planes[1]
+    result[2::3] = planes[2]
+    return bytes(result)
+
+
+class BatchCurl(object):
+    """
+    Bit-sliced Curl sponge, which hashes several equally-long tryte
+    sequences at the same time.
+
+    Each input occupies one "lane" of the sponge; the result of
+    :py:meth:`squeeze` for that lane is identical to the result of
+    absorbing/squeezing the same trytes with
+    :py:class:`iota.crypto.pycurl.Curl`.
+
+    **IMPORTANT: Not thread-safe!**
+
+    :param int lanes:
+        Number of independent sponges to run in parallel.
+    """
+
+    def __init__(self, lanes: int) -> None:
+        if lanes < 1:
+            raise with_context(
+                exc=ValueError('``lanes`` must be positive.'),
+
+                context={
+                    'lanes': lanes,
+                },
+            )
+
+        self.lanes = lanes
+        self._mask = (1 << lanes) - 1
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Resets internal state.
+        """
+        # A null trit is encoded as (1, 1).
+        self._low: List[int] = [self._mask] * STATE_LENGTH
+        self._high: List[int] = [self._mask] * STATE_LENGTH
+
+    def absorb(self, trytes: Sequence[TrytesCompatible]) -> None:
+        """
+        Absorbs one tryte sequence into each lane of the sponge.
+
+        :param trytes:
+            One tryte sequence per lane.  All sequences must have the
+            same length; they are padded to a multiple of one hash
+            length, the same way :py:meth:`Curl.absorb` pads its input.
+        """
+        if len(trytes) != self.lanes:
+            raise with_context(
+                exc=ValueError(
+                    'Expected {lanes} tryte sequences, got {actual}.'.format(
+                        lanes=self.lanes,
+                        actual=len(trytes),
+                    ),
+                ),
+
+                context={
+                    'trytes': trytes,
+                },
+            )
+
+        rows = [_as_tryte_bytes(t) for t in trytes]
+
+        length = len(rows[0])
+        if (not length) or any(len(row) != length for row in rows):
+            raise with_context(
+                exc=ValueError(
+                    'Tryte sequences must be non-empty '
+                    'and have the same length.',
+                ),
+
+                context={
+                    'trytes': trytes,
+                },
+            )
+
+        length += -length % TRYTE_LENGTH
+        rows = [row.ljust(length, b'9') for row in rows]
+
+        low_rows = [
+            _interleave([row.translate(t) for t in _LOW_TABLES])
+            for row in rows
+        ]
+        high_rows = [
+            _interleave([row.translate(t) for t in _HIGH_TABLES])
+            for row in rows
+        ]
+
+        for start in range(0, length * 3, HASH_LENGTH):
+            stop = start + HASH_LENGTH
+
+            # Transpose the chunk, so that each column contains the bits
+            # of one trit position across every lane.  Lane ``i`` ends
+            # up in bit ``lanes - 1 - i`` of each integer.
+            self._low[0:HASH_LENGTH] = [
+                int(bytes(column), 2)
+                for column in zip(*(r[start:stop] for r in low_rows))
+            ]
+            self._high[0:HASH_LENGTH] = [
+                int(bytes(column), 2)
+                for column in zip(*(r[start:stop] for r in high_rows))
+            ]
+
+            self._transform()
+
+    def squeeze(self) -> List[bytes]:
+        """
+        Squeezes one hash out of each lane of the sponge.
+
+        :return:
+            One ASCII tryte sequence (81 trytes) per lane, in the same
+            order as the inputs passed to :py:meth:`absorb`.
+        """
+        width = '0{lanes}b'.format(lanes=self.lanes)
+
+        low_columns = [
+            format(plane, width).encode('ascii').translate(_LOW_CODE)
+            for plane in self._low[0:HASH_LENGTH]
+        ]
+        high_columns = [
+            format(plane, width).encode('ascii').translate(_HIGH_CODE)
+            for plane in self._high[0:HASH_LENGTH]
+        ]
+
+        hashes = []
+        for low, high in zip(zip(*low_columns), zip(*high_columns)):
+            codes = bytes(map(int.__add__, low, high))
+            hashes.append(
+                bytes(map(
+                    int.__add__,
+                    codes[0::3],
+                    map(
+                        int.__add__,
+                        codes[1::3].translate(_TIMES_4),
+                        codes[2::3].translate(_TIMES_16),
+                    ),
+                )).translate(_CODE_TO_TRYTE)
+            )
+
+        self._transform()
+
+        return hashes
+
+    def _transform(self) -> None:
+        """
+        Transforms internal state, for every lane at once.
+        """
+        self._low, self._high = transform_planes(
+            self._low,
+            self._high,
+            self._mask,
+        )
+
+
+def transform_planes(
+        low: List[int],
+        high: List[int],
+        mask: int,
+) -> Tuple[List[int], List[int]]:
+    """
+    Applies the Curl transform to a bit-sliced sponge state.
+
+    :param low:
+        Low bit of each trit of the state, for every lane.
+
+    :param high:
+        High bit of each trit of the state, for every lane.
+
+    :param mask:
+        Integer with one bit set for every lane.
+
+    :return:
+        The transformed ``(low, high)`` bit planes.
+    """
+    index_pairs = _INDEX_PAIRS
+
+    for _ in range(NUMBER_OF_ROUNDS):
+        new_low = [0] * STATE_LENGTH
+        new_high = [0] * STATE_LENGTH
+
+        pos = 0
+        for a, b in index_pairs:
+            alpha = low[a]
+            gamma = high[b]
+            delta = (alpha | (gamma ^ mask)) & (low[b] ^ high[a])
+
+            new_low[pos] = delta ^ mask
+            new_high[pos] = (alpha ^ gamma) | delta
+
+            pos += 1
+
+        low = new_low
+        high = new_high
+
+    return low, high
+
+
+def curl_hash_many(
+        trytes: Iterable[TrytesCompatible],
+        result_type: Type[T] = Hash,
+) -> List[T]:
+    """
+    Computes the Curl hash of each tryte sequence, using as few
+    :py:class:`BatchCurl` transforms as possible.
+
+    This is equivalent to absorbing each sequence into a fresh
+    :py:class:`iota.crypto.Curl` sponge and squeezing one hash, but it
+    is much faster when hashing many sequences (e.g., the transactions
+    returned by ``getTrytes``).
+
+    :param Iterable[TrytesCompatible] trytes:
+        Tryte sequences to hash.  Sequences do not have to be the same
+        length.
+
+    :param Type[TryteString] result_type:
+        Type of the returned hashes (e.g.,
+        :py:class:`iota.transaction.TransactionHash`).
+
+    :return:
+        One hash per input, in the same order.
+    """
+    rows = [bytes(TryteString(t)) for t in trytes]
+
+    # Only sequences that pad to the same length can share a sponge.
+    groups = {}
+    for i, row in enumerate(rows):
+        padded_length = len(row) + (-len(row) % TRYTE_LENGTH)
+        groups.setdefault(padded_length, []).append(i)
+
+    hashes: List[T] = [None] * len(rows)
+
+    for padded_length, indices in groups.items():
+        for start in range(0, len(indices), MAX_LANES):
+            batch = indices[start:start + MAX_LANES]
+
+            # Padding with ``9`` trytes does not change the hash, and it
+            # gives every lane the same length.
+            sponge = BatchCurl(len(batch))
+            sponge.absorb([rows[i].ljust(padded_length, b'9') for i in batch])
+
+            for i, hash_trytes in zip(batch, sponge.squeeze()):
+                hashes[i] = result_type(hash_trytes)
+
+    return hashes
@@ -1,9 +1,37 @@
-from typing import List, Dict
+from array import array
+from operator import mul
+from typing import Dict, Iterable, List, Sequence
 
 
 BYTE_HASH_LENGTH = 48
 TRIT_HASH_LENGTH = 243
 
+TRIT_POWERS: List[int] = [3 ** i for i in range(TRIT_HASH_LENGTH)]
+"""
+Powers of three, used to convert trits into integers without computing
+``3 ** i`` for every trit.
+"""
+
+_TRIT_RANGE = 3 ** TRIT_HASH_LENGTH
+_TRIT_HALF_RANGE = (_TRIT_RANGE - 1) // 2
+
+# Integers that can be represented by :py:data:`TRIT_HASH_LENGTH - 1`
+# trits, i.e., the values that Kerl absorbs and squeezes (the last trit
+# of each chunk is always zero).
+_HASH_RANGE = 3 ** (TRIT_HASH_LENGTH - 1)
+_HASH_HALF_RANGE = (_HASH_RANGE - 1) // 2
+
+_BYTE_RANGE = 1 << (BYTE_HASH_LENGTH * 8)
+
+# Converts 5 trits at a time from integers (offset by
+# ``_TRIT_HALF_RANGE`` so that every digit is non-negative).
+_CHUNK_TRITS = 5
+_CHUNK_RANGE = 3 ** _CHUNK_TRITS
+_CHUNK_TABLE: List[List[int]] = [
+    [(value // (3 ** i)) % 3 - 1 for i in range(_CHUNK_TRITS)]
+    for value in range(_CHUNK_RANGE)
+]
+
 tryte_table: Dict[str, List[int]] = {
     '9': [0, 0, 0],  # 0
     'A': [1, 0, 0],  # 1
@@ -56,66 +84,100 @@ def trits_to_trytes(trits: List[int]) -> str:
     return ''.join(trytes)
 
 
-def convertToTrits(bytes_k: List[int]) -> List[int]:
-    bigInt = convertBytesToBigInt(bytes_k)
-    trits = convertBigintToBase(bigInt, 3, TRIT_HASH_LENGTH)
+def trits_to_int(trits: Sequence[int]) -> int:
+    """
+    Converts up to :py:data:`TRIT_HASH_LENGTH` trits into the integer
+    that they represent (balanced ternary, least significant trit
+    first).
+    """
+    return sum(map(mul, trits, TRIT_POWERS))
+
+
+def int_to_trits(value: int, length: int = TRIT_HASH_LENGTH) -> List[int]:
+    """
+    Converts an integer into ``length`` trits (at most
+    :py:data:`TRIT_HASH_LENGTH`).
+
+    Values that don't fit are truncated to their least significant
+    trits.
+    """
+    # Offsetting the value turns balanced ternary digits into regular
+    # base-3 digits (each one is 1 higher), which can be looked up
+    # several at a time.
+    value = (value + _TRIT_HALF_RANGE) % _TRIT_RANGE
+
+    trits: List[int] = []
+    extend = trits.extend
+    for _ in range(-(-length // _CHUNK_TRITS)):
+        value, chunk = divmod(value, _CHUNK_RANGE)
+        extend(_CHUNK_TABLE[chunk])
+
+    del trits[length:]
     return trits
 
 
-def convertToBytes(trits: List[int]) -> List[int]:
-    bigInt = convertBaseToBigint(trits, 3)
-    bytes_k = convertBigIntToBytes(bigInt)
-    return bytes_k
+def truncate_hash_int(value: int) -> int:
+    """
+    Reduces an integer to the value of its :py:data:`TRIT_HASH_LENGTH`
+    - 1 least significant trits.
 
+    This is equivalent to converting ``value`` to trits and setting the
+    last trit to zero, as Kerl does with every chunk.
+    """
+    return (value + _HASH_HALF_RANGE) % _HASH_RANGE - _HASH_HALF_RANGE
 
-def convertBytesToBigInt(ba: List[int]) -> int:
-    # copy of array
-    bytesArray = list(map(lambda x: x, ba))
 
-    # number sign in MSB
-    signum = (1 if bytesArray[0] >= 0 else -1)
+def int_to_bytes(value: int) -> bytes:
+    """
+    Converts an integer into its 48-byte, big-endian, two's complement
+    representation (wrapping around if necessary).
+    """
+    return (value % _BYTE_RANGE).to_bytes(BYTE_HASH_LENGTH, 'big')
 
-    if signum == -1:
-        # sub1
-        for pos in reversed(range(len(bytesArray))):
-            sub = (bytesArray[pos] & 0xFF) - 1
-            bytesArray[pos] = (sub if sub <= 0x7F else sub - 0x100)
-            if bytesArray[pos] != -1:
-                break
 
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
+def bytes_to_int(bytes_: bytes) -> int:
+    """
+    Converts a big-endian, two's complement byte string into an
+    integer.
+    """
+    return int.from_bytes(bytes_, 'big', signed=True)
 
-    # sum magnitudes and set sign
-    return sum((x & 0xFF) << pos * 8 for (pos, x) in
-               enumerate(reversed(bytesArray))) * signum
 
+def trits_to_bytes(trits: Sequence[int]) -> bytes:
+    """
+    Converts up to :py:data:`TRIT_HASH_LENGTH` trits into the bytes that
+    Kerl feeds to Keccak.
+    """
+    return int_to_bytes(trits_to_int(trits))
+
+
+def bytes_to_trits(bytes_: bytes) -> List[int]:
+    """
+    Converts a Keccak digest into :py:data:`TRIT_HASH_LENGTH` trits.
+    """
+    return int_to_trits(bytes_to_int(bytes_))
 
-def convertBigIntToBytes(big: int) -> List[int]:
-    bytesArrayTemp = [(abs(big) >> pos * 8) % (1 << 8) for pos in
-                      range(48)]
 
-    # big endian and balanced
-    bytesArray = list(map(
-        lambda x: (x if x <= 0x7F else x - 0x100),
-        reversed(bytesArrayTemp)
-    ))
+def convertToTrits(bytes_k: List[int]) -> List[int]:
+    return bytes_to_trits(_signed_to_bytes(bytes_k))
 
-    if big < 0:
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
 
-        # add1
-        for pos in reversed(range(len(bytesArray))):
-            add = (bytesArray[pos] & 0xFF) + 1
-            bytesArray[pos] = (add if add <= 0x7F else add - 0x100)
-            if bytesArray[pos] != 0:
-                break
+def convertToBytes(trits: List[int]) -> List[int]:
+    return _bytes_to_signed(trits_to_bytes(trits))
+
+
+def convertBytesToBigInt(ba: List[int]) -> int:
+    return bytes_to_int(_signed_to_bytes(ba))
+
 
-    return bytesArray
+def convertBigIntToBytes(big: int) -> List[int]:
+    return _bytes_to_signed(int_to_bytes(big))
 
 
 def convertBaseToBigint(array: List[int], base: int) -> int:
+    if base == 3 and len(array) <= TRIT_HASH_LENGTH:
+        return trits_to_int(array)
+
     bigint = 0
 
     for i in range(len(array)):
@@ -125,6 +187,9 @@ def convertBaseToBigint(array: List[int], base: int) -> int:
 
 
 def convertBigintToBase(bigInt: int, base: int, length: int) -> List[int]:
+    if base == 3 and length <= TRIT_HASH_LENGTH:
+        return int_to_trits(bigInt, length)
+
     result = []
 
     is_negative = bigInt < 0
@@ -159,3 +224,17 @@ def convert_sign(byte: int) -> int:
     elif byte > 127:
         return -256 + byte
     return byte
+
+
+def _signed_to_bytes(signed: Iterable[int]) -> bytes:
+    """
+    Converts a sequence of signed bytes into a byte string.
+    """
+    return array('b', signed).tobytes()
+
+
+def _bytes_to_signed(bytes_: bytes) -> List[int]:
+    """
+    Converts a byte string into a list of signed bytes.
+    """
+    return memoryview(bytes_).cast('b').tolist()
@@ -1,4 +1,4 @@
-from typing import MutableSequence, Optional
+from typing import MutableSequence, Optional, Union
 
 from sha3 import keccak_384
 
@@ -12,6 +12,9 @@ __all__ = [
 BYTE_HASH_LENGTH = 48
 TRIT_HASH_LENGTH = 243
 
+# Flips every bit of a hash before it is fed back into the sponge.
+_FLIP_MASK = (1 << (BYTE_HASH_LENGTH * 8)) - 1
+
 
 class Kerl(object):
     k: keccak_384 = None
@@ -65,16 +68,7 @@ class Kerl(object):
             if stop - offset == TRIT_HASH_LENGTH:
                 trits[stop - 1] = 0
 
-            signed_nums = conv.convertToBytes(trits[offset:stop])
-
-            # Convert signed bytes into their equivalent unsigned
-            # representation, in order to use Python's built-in bytes
-            # type.
-            unsigned_bytes = bytearray(
-                conv.convert_sign(b) for b in signed_nums
-            )
-
-            self.k.update(unsigned_bytes)
+            self.k.update(conv.trits_to_bytes(trits[offset:stop]))
 
             offset += TRIT_HASH_LENGTH
 
@@ -123,25 +117,141 @@ class Kerl(object):
             )
 
         while offset < length:
-            unsigned_hash = self.k.digest()
-
-            signed_hash = [conv.convert_sign(b) for b in unsigned_hash]
-
-            trits_from_hash = conv.convertToTrits(signed_hash)
-            trits_from_hash[TRIT_HASH_LENGTH - 1] = 0
+            # Note that the last trit of the hash is always zero.
+            trits_from_hash = conv.int_to_trits(self.squeeze_int())
 
             stop = min(TRIT_HASH_LENGTH, length - offset)
             trits[offset:offset + stop] = trits_from_hash[0:stop]
 
-            flipped_bytes = bytearray(
-                conv.convert_sign(~b) for b in unsigned_hash
+            offset += TRIT_HASH_LENGTH
+
+    def absorb_int(self, value: int) -> None:
+        """
+        Absorbs a single hash, represented as an integer (e.g., the
+        result of :py:meth:`squeeze_int`).
+
+        This is equivalent to absorbing the trits that represent
+        ``value``, but skips the conversion.  As with :py:meth:`absorb`,
+        the last trit of the hash is ignored.
+        """
+        self.k.update(conv.int_to_bytes(conv.truncate_hash_int(value)))
+
+    def absorb_bytes(self, bytes_: bytes) -> None:
+        """
+        Absorbs one or more hashes, in the byte representation that Kerl
+        uses internally (see :py:meth:`squeeze_bytes` and
+        :py:func:`conv.trits_to_bytes`).
+
+        :param bytes_:
+            Byte string; its length must be a multiple of
+            :py:data:`BYTE_HASH_LENGTH`.
+        """
+        if (not bytes_) or (len(bytes_) % BYTE_HASH_LENGTH):
+            raise with_context(
+                exc=ValueError(
+                    'Length of ``bytes_`` must be a positive multiple '
+                    'of {length}.'.format(length=BYTE_HASH_LENGTH),
+                ),
+
+                context={
+                    'bytes_': bytes_,
+                },
             )
 
-            # Reset internal state before feeding back in.
-            self.reset()
-            self.k.update(flipped_bytes)
+        for offset in range(0, len(bytes_), BYTE_HASH_LENGTH):
+            self.k.update(bytes_[offset:offset + BYTE_HASH_LENGTH])
 
-            offset += TRIT_HASH_LENGTH
+    def squeeze_int(self) -> int:
+        """
+        Squeezes a single hash from the sponge, as an integer.
+
+        This is equivalent to squeezing :py:data:`TRIT_HASH_LENGTH` trits
+        and converting them into an integer.
+        """
+        unsigned_hash = self.k.digest()
+
+        value = conv.truncate_hash_int(conv.bytes_to_int(unsigned_hash))
+
+        # Reset internal state before feeding back in the flipped bytes
+        # of the hash.
+        self.reset()
+        self.k.update(
+            (int.from_bytes(unsigned_hash, 'big') ^ _FLIP_MASK).to_bytes(
+                BYTE_HASH_LENGTH,
+                'big',
+            ),
+        )
+
+        return value
+
+    def squeeze_bytes(self, length: int = BYTE_HASH_LENGTH) -> bytes:
+        """
+        Squeezes one or more hashes from the sponge, in the byte
+        representation that :py:meth:`absorb_bytes` accepts.
+
+        :param length:
+            Number of bytes to squeeze; must be a positive multiple of
+            :py:data:`BYTE_HASH_LENGTH`.
+        """
+        if (length < 1) or (length % BYTE_HASH_LENGTH):
+            raise with_context(
+                exc=ValueError(
+                    '``length`` must be a positive multiple '
+                    'of {length}.'.format(length=BYTE_HASH_LENGTH),
+                ),
+
+                context={
+                    'length': length,
+                },
+            )
+
+        return b''.join(
+            conv.int_to_bytes(self.squeeze_int())
+            for _ in range(length // BYTE_HASH_LENGTH)
+        )
+
+    @staticmethod
+    def hash_chain(value: Union[int, bytes], n: int) -> int:
+        """
+        Hashes a single hash ``n`` times in a row, using a fresh sponge
+        for each iteration.
+
+        This is equivalent to (but much faster than) repeating the
+        following ``n`` times::
+
+            sponge = Kerl()
+            sponge.absorb(trits)
+            sponge.squeeze(trits)
+
+        :param value:
+            The hash to start from, as an integer (see
+            :py:meth:`absorb_int`) or in Kerl's byte representation (see
+            :py:meth:`absorb_bytes`).
+
+        :param n:
+            Number of iterations.  If less than 1, ``value`` is returned
+            unchanged (as an integer).
+
+        :return:
+            The resulting hash, as an integer.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            value = conv.bytes_to_int(value)
+
+        if n < 1:
+            return value
+
+        # Copy some values locally so we can avoid global lookups in the
+        # loop.
+        truncate = conv.truncate_hash_int
+        to_bytes = conv.int_to_bytes
+        from_bytes = conv.bytes_to_int
+        keccak = keccak_384
+
+        for _ in range(n):
+            value = truncate(from_bytes(keccak(to_bytes(truncate(value))).digest()))
+
+        return value
 
     def reset(self) -> None:
         self.k = keccak_384()
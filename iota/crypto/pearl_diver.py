@@ -0,0 +1,597 @@
+"""
+Built-in proof-of-work engine.
+
+Searches for transaction nonces using the bit-sliced Curl transform
+from :py:mod:`iota.crypto.batch_curl`: every transform tries a whole
+batch of nonces at once, and batches are spread across a pool of worker
+processes.
+
+References:
+
+- https://github.com/iotaledger/iri/blob/v1.8.6/src/main/java/com/iota/iri/crypto/PearlDiver.java
+- https://github.com/iotaledger/iri/blob/v1.8.6/src/main/java/com/iota/iri/service/API.java
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from os import cpu_count
+from threading import Event, Lock
+from time import time
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from iota.crypto.batch_curl import transform_planes
+from iota.crypto.pycurl import (
+    Curl,
+    HASH_LENGTH,
+    NUMBER_OF_ROUNDS,
+    STATE_LENGTH,
+    TRANSFORM_INDICES,
+)
+from iota.exceptions import with_context
+from iota.transaction.types import (
+    Nonce,
+    TransactionHash,
+    TransactionTrytes,
+)
+from iota.trits import trits_from_int
+from iota.types import TryteString
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = [
+    'PearlDiver',
+]
+
+LANES = 1024
+"""
+Number of nonces that are tried with each transform.
+"""
+
+LANE_TRITS = 7
+"""
+Number of nonce trits that vary between lanes (``3 ** LANE_TRITS``
+must be at least :py:data:`LANES`).
+
+The remaining nonce trits hold a counter that is incremented after each
+transform.
+"""
+
+BATCHES_PER_TASK = 16
+"""
+Number of transforms that a worker process performs before reporting
+back.
+
+Lower values make :py:meth:`PearlDiver.interrupt` more responsive, at
+the cost of more inter-process communication.
+"""
+
+MAX_TIMESTAMP_VALUE = (3 ** 27 - 1) // 2
+"""
+Largest value that fits in a 27-trit timestamp field; used as the
+attachment timestamp upper bound.
+"""
+
+NONCE_LENGTH = Nonce.LEN * 3
+"""
+Length of a nonce, in trits.
+"""
+
+NONCE_OFFSET = HASH_LENGTH - NONCE_LENGTH
+"""
+Position of the nonce within the last hash-sized chunk of a
+transaction.
+"""
+
+Match = Tuple[int, int, List[int]]
+"""
+Result of a successful search: counter, lane and hash trits.
+"""
+
+
+def _lane_trits(lane: int) -> List[int]:
+    """
+    Returns the nonce trits that identify a lane.
+    """
+    return [(lane // (3 ** i)) % 3 - 1 for i in range(LANE_TRITS)]
+
+
+_LANE_NONCE_TRITS = [_lane_trits(lane) for lane in range(LANES)]
+
+if np is not None:
+    _WORDS = LANES // 64
+
+    _NP_FIRST = np.array(TRANSFORM_INDICES[:-1], dtype=np.intp)
+    _NP_SECOND = np.array(TRANSFORM_INDICES[1:], dtype=np.intp)
+
+    # Bit planes for the nonce trits that identify each lane.
+    _NP_LANE_TRITS = np.array(_LANE_NONCE_TRITS, dtype=np.int8).T.copy()
+    _NP_LANE_LOW = np.packbits(
+        _NP_LANE_TRITS != 1, axis=1, bitorder='little',
+    ).view('<u8')
+    _NP_LANE_HIGH = np.packbits(
+        _NP_LANE_TRITS != -1, axis=1, bitorder='little',
+    ).view('<u8')
+
+
+def _search_python(
+        state: Sequence[int],
+        min_weight_magnitude: int,
+        first: int,
+        count: int,
+) -> Optional[Match]:
+    """
+    Searches for a nonce using Python integers as bit planes (lane ``i``
+    is stored in bit ``i``).
+    """
+    mask = (1 << LANES) - 1
+
+    # Trits are encoded as (low, high) bits; see
+    # :py:mod:`iota.crypto.batch_curl`.
+    low = [0 if t == 1 else mask for t in state]
+    high = [0 if t == -1 else mask for t in state]
+
+    for i in range(LANE_TRITS):
+        trits = [lane_trits[i] for lane_trits in _LANE_NONCE_TRITS]
+        low[NONCE_OFFSET + i] = sum(
+            1 << lane for lane, t in enumerate(trits) if t != 1
+        )
+        high[NONCE_OFFSET + i] = sum(
+            1 << lane for lane, t in enumerate(trits) if t != -1
+        )
+
+    for counter in range(first, first + count):
+        counter_trits = _counter_trits(counter)
+        for i, t in enumerate(counter_trits, NONCE_OFFSET + LANE_TRITS):
+            low[i] = 0 if t == 1 else mask
+            high[i] = 0 if t == -1 else mask
+
+        new_low, new_high = transform_planes(low, high, mask)
+
+        # A trit is zero if both of its bits are set.
+        zeros = mask
+        for i in range(HASH_LENGTH - min_weight_magnitude, HASH_LENGTH):
+            zeros &= new_low[i] & new_high[i]
+
+        if zeros:
+            lane = (zeros & -zeros).bit_length() - 1
+
+            return counter, lane, [
+                ((new_high[i] >> lane) & 1) - ((new_low[i] >> lane) & 1)
+                for i in range(HASH_LENGTH)
+            ]
+
+    return None
+
+
+def _search_numpy(
+        state: Sequence[int],
+        min_weight_magnitude: int,
+        first: int,
+        count: int,
+) -> Optional[Match]:
+    """
+    Searches for a nonce using NumPy arrays of 64-bit words as bit
+    planes (lane ``i`` is stored in bit ``i % 64`` of word ``i // 64``).
+    """
+    state = np.array(state, dtype=np.int8)[:, np.newaxis]
+
+    ones = ~np.uint64(0)
+    zero = np.uint64(0)
+
+    low = np.where(state != 1, ones, zero).repeat(_WORDS, axis=1)
+    high = np.where(state != -1, ones, zero).repeat(_WORDS, axis=1)
+
+    low[NONCE_OFFSET:NONCE_OFFSET + LANE_TRITS] = _NP_LANE_LOW
+    high[NONCE_OFFSET:NONCE_OFFSET + LANE_TRITS] = _NP_LANE_HIGH
+
+    first_indices = _NP_FIRST
+    second_indices = _NP_SECOND
+
+    for counter in range(first, first + count):
+        counter_trits = np.array(_counter_trits(counter), dtype=np.int8)
+        counter_trits = counter_trits[:, np.newaxis]
+        low[NONCE_OFFSET + LANE_TRITS:HASH_LENGTH] = \
+            np.where(counter_trits != 1, ones, zero)
+        high[NONCE_OFFSET + LANE_TRITS:HASH_LENGTH] = \
+            np.where(counter_trits != -1, ones, zero)
+
+        new_low = low
+        new_high = high
+        for _ in range(NUMBER_OF_ROUNDS):
+            alpha = new_low[first_indices]
+            gamma = new_high[second_indices]
+            delta = (
+                (alpha | ~gamma)
+                & (new_low[second_indices] ^ new_high[first_indices])
+            )
+
+            new_low = ~delta
+            new_high = (alpha ^ gamma) | delta
+
+        start = HASH_LENGTH - min_weight_magnitude
+        zeros = np.bitwise_and.reduce(
+            new_low[start:HASH_LENGTH] & new_high[start:HASH_LENGTH],
+            axis=0,
+        )
+
+        words = np.flatnonzero(zeros)
+        if words.size:
+            word = int(words[0])
+            bits = int(zeros[word])
+            bit = (bits & -bits).bit_length() - 1
+
+            shift = np.uint64(bit)
+            hash_low = (new_low[0:HASH_LENGTH, word] >> shift) & np.uint64(1)
+            hash_high = (new_high[0:HASH_LENGTH, word] >> shift) & np.uint64(1)
+
+            return counter, word * 64 + bit, (
+                hash_high.astype(np.int8) - hash_low.astype(np.int8)
+            ).tolist()
+
+    return None
+
+
+def _counter_trits(counter: int) -> List[int]:
+    """
+    Returns the nonce trits that encode a counter value.
+    """
+    return trits_from_int(counter, pad=NONCE_LENGTH - LANE_TRITS)
+
+
+def _search_block(
+        state: Sequence[int],
+        min_weight_magnitude: int,
+        first: int,
+        count: int,
+        backend: str,
+) -> Optional[Match]:
+    """
+    Tries ``count`` batches of nonces, starting with counter value
+    ``first``.
+
+    Defined at module level so that it can be sent to worker processes.
+    """
+    search = _search_numpy if backend == 'numpy' else _search_python
+    return search(state, min_weight_magnitude, first, count)
+
+
+class PearlDiver(object):
+    """
+    Performs proof-of-work locally, without relying on a node or on the
+    optional ``pow`` extension.
+
+    :param Optional[int] workers:
+        Number of worker processes to use.  Defaults to the number of
+        CPUs.
+
+        Set to 0 to search in the calling thread instead.
+
+    :param Optional[str] backend:
+        Implementation of the transform function (see
+        :py:data:`iota.crypto.pycurl.BACKENDS`).  Defaults to
+        ``'numpy'`` if NumPy is installed, ``'python'`` otherwise.
+    """
+
+    def __init__(
+            self,
+            workers: Optional[int] = None,
+            backend: Optional[str] = None,
+    ) -> None:
+        super(PearlDiver, self).__init__()
+
+        if workers is None:
+            workers = cpu_count() or 1
+
+        if workers < 0:
+            raise with_context(
+                exc=ValueError('``workers`` must not be negative.'),
+
+                context={
+                    'workers': workers,
+                },
+            )
+
+        if backend is None:
+            backend = 'python' if np is None else 'numpy'
+
+        # Validates ``backend``.
+        Curl(backend=backend)
+
+        self.workers = workers
+        self.backend = backend
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = Lock()
+
+        # One event per running search, so that :py:meth:`interrupt`
+        # only affects searches that are actually in progress.
+        self._runs: Set[Event] = set()
+        self._runs_lock = Lock()
+
+    def __enter__(self) -> 'PearlDiver':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    @property
+    def is_searching(self) -> bool:
+        """
+        Whether a search is currently running.
+        """
+        with self._runs_lock:
+            return bool(self._runs)
+
+    def interrupt(self) -> None:
+        """
+        Interrupts the searches that are currently running.
+
+        Has no effect if no search is running; later searches are not
+        affected.
+
+        Thread-safe.
+        """
+        with self._runs_lock:
+            for run in self._runs:
+                run.set()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker processes (if they were started).
+
+        The pool is restarted automatically if the instance is used
+        again.
+
+        This method is called automatically when the instance is used as
+        a context manager.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def search(
+            self,
+            trytes: TransactionTrytes,
+            min_weight_magnitude: int,
+    ) -> Optional[Tuple[Nonce, TransactionHash]]:
+        """
+        Finds a nonce for a transaction, so that its hash ends with at
+        least ``min_weight_magnitude`` zero trits.
+
+        :param TransactionTrytes trytes:
+            Transaction trytes.  The nonce field is ignored.
+
+        :param int min_weight_magnitude:
+            Number of trailing zero trits required.
+
+        :return:
+            The nonce and the resulting transaction hash, or ``None`` if
+            the search was interrupted.
+        """
+        run = self._start_run()
+        try:
+            return self._search(trytes, min_weight_magnitude, run)
+        finally:
+            self._finish_run(run)
+
+    def attach_to_tangle(
+            self,
+            trunk_transaction: TransactionHash,
+            branch_transaction: TransactionHash,
+            trytes: Iterable[TransactionTrytes],
+            min_weight_magnitude: int,
+    ) -> List[TransactionTrytes]:
+        """
+        Local equivalent of the ``attachToTangle`` API command.
+
+        Transactions are processed in the order that they are provided
+        (i.e., head first).  The first transaction references the trunk
+        and branch transactions; each subsequent transaction references
+        the previous one (trunk) and ``trunk_transaction`` (branch).
+
+        :return:
+            The attached transaction trytes, in reverse order (same as
+            the node), or an empty list if interrupted by
+            :py:meth:`interrupt`.
+        """
+        run = self._start_run()
+        try:
+            return self._attach_to_tangle(
+                trunk_transaction,
+                branch_transaction,
+                trytes,
+                min_weight_magnitude,
+                run,
+            )
+        finally:
+            self._finish_run(run)
+
+    def _start_run(self) -> Event:
+        """
+        Registers a new search, so that it can be interrupted.
+        """
+        run = Event()
+
+        with self._runs_lock:
+            self._runs.add(run)
+
+        return run
+
+    def _finish_run(self, run: Event) -> None:
+        """
+        Unregisters a search started by :py:meth:`_start_run`.
+        """
+        with self._runs_lock:
+            self._runs.discard(run)
+
+    def _attach_to_tangle(
+            self,
+            trunk_transaction: TransactionHash,
+            branch_transaction: TransactionHash,
+            trytes: Iterable[TransactionTrytes],
+            min_weight_magnitude: int,
+            run: Event,
+    ) -> List[TransactionTrytes]:
+        """
+        Implements :py:meth:`attach_to_tangle`; stops when ``run`` is
+        set.
+        """
+        attached = []
+        previous: Optional[TransactionHash] = None
+
+        for tryte_string in trytes:
+            tryte_string = TransactionTrytes(tryte_string)
+
+            tag = tryte_string[2592:2619]
+            if not tag:
+                tag = tryte_string[2295:2322]
+
+            tryte_string = TransactionTrytes(
+                tryte_string[0:2430]
+                + (previous or trunk_transaction)
+                + (trunk_transaction if previous else branch_transaction)
+                + tag
+                + TryteString.from_trits(
+                    trits_from_int(int(time() * 1000), pad=27),
+                )
+                + TryteString.from_trits(trits_from_int(0, pad=27))
+                + TryteString.from_trits(
+                    trits_from_int(MAX_TIMESTAMP_VALUE, pad=27),
+                )
+            )
+
+            result = self._search(tryte_string, min_weight_magnitude, run)
+            if result is None:
+                return []
+
+            nonce, previous = result
+            attached.append(TransactionTrytes(tryte_string[0:2646] + nonce))
+
+        return attached[::-1]
+
+    def _search(
+            self,
+            trytes: TransactionTrytes,
+            min_weight_magnitude: int,
+            run: Event,
+    ) -> Optional[Tuple[Nonce, TransactionHash]]:
+        """
+        Implements :py:meth:`search`; stops when ``run`` is set.
+        """
+        if not (0 < min_weight_magnitude <= HASH_LENGTH):
+            raise with_context(
+                exc=ValueError(
+                    '``min_weight_magnitude`` must be between 1 '
+                    'and {max}.'.format(max=HASH_LENGTH),
+                ),
+
+                context={
+                    'min_weight_magnitude': min_weight_magnitude,
+                },
+            )
+
+        trits = TransactionTrytes(trytes).as_trits()
+
+        # Everything up to the last chunk is the same for every nonce,
+        # so we only need to absorb it once.
+        sponge = Curl(backend='python')
+        sponge.absorb(trits[0:len(trits) - HASH_LENGTH])
+
+        state = (
+            trits[len(trits) - HASH_LENGTH:]
+            + sponge._state[HASH_LENGTH:STATE_LENGTH]
+        )
+
+        if self.workers:
+            match = self._search_in_pool(state, min_weight_magnitude, run)
+        else:
+            match = self._search_in_thread(state, min_weight_magnitude, run)
+
+        if match is None:
+            return None
+
+        counter, lane, hash_trits = match
+
+        return (
+            Nonce.from_trits(_LANE_NONCE_TRITS[lane] + _counter_trits(counter)),
+            TransactionHash.from_trits(hash_trits),
+        )
+
+    def _search_in_thread(
+            self,
+            state: List[int],
+            min_weight_magnitude: int,
+            run: Event,
+    ) -> Optional[Match]:
+        """
+        Searches for a nonce without using worker processes.
+        """
+        counter = 0
+        while not run.is_set():
+            match = _search_block(
+                state,
+                min_weight_magnitude,
+                counter,
+                BATCHES_PER_TASK,
+                self.backend,
+            )
+
+            if match is not None:
+                return match
+
+            counter += BATCHES_PER_TASK
+
+        return None
+
+    def _search_in_pool(
+            self,
+            state: List[int],
+            min_weight_magnitude: int,
+            run: Event,
+    ) -> Optional[Match]:
+        """
+        Searches for a nonce, spreading the counter space across the
+        worker processes.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+
+            executor = self._executor
+
+        counter = 0
+        pending = set()
+
+        try:
+            while not run.is_set():
+                while len(pending) < self.workers:
+                    pending.add(executor.submit(
+                        _search_block,
+                        state,
+                        min_weight_magnitude,
+                        counter,
+                        BATCHES_PER_TASK,
+                        self.backend,
+                    ))
+
+                    counter += BATCHES_PER_TASK
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    match = future.result()
+                    if match is not None:
+                        return match
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return None
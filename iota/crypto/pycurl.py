@@ -1,7 +1,14 @@
+from array import array
+from os import environ
 from typing import List, MutableSequence, Optional, Sequence
 
 from iota.exceptions import with_context
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 __all__ = [
     'Curl',
     'HASH_LENGTH',
@@ -37,22 +44,115 @@ References:
   - :py:meth:`Curl._transform`.
 """
 
+BACKEND_ENV_VAR = 'PYOTA_CURL_BACKEND'
+"""
+Environment variable used to select the default backend for
+:py:class:`Curl` (see :py:data:`BACKENDS`).
+"""
+
+BACKENDS = ('python', 'numpy')
+"""
+Available implementations of :py:meth:`Curl._transform`.
+
+- ``'python'``: pure-Python implementation (default).
+- ``'numpy'``: vectorized implementation; requires NumPy.
+"""
+
+
+def _build_transform_indices() -> List[int]:
+    """
+    Returns the order in which :py:meth:`Curl._transform` visits the
+    positions of the sponge state.
+    """
+    indices = [0]
+    for _ in range(STATE_LENGTH):
+        index = indices[-1]
+        indices.append(index + (364 if index < 365 else -365))
+    return indices
+
+
+TRANSFORM_INDICES = _build_transform_indices()
+"""
+Positions of the sponge state, in the order that they are visited
+during each round of :py:meth:`Curl._transform`.
+
+Each trit of the new state is computed from two consecutive entries of
+this list, so it contains ``STATE_LENGTH + 1`` items.
+"""
+
+_INDEX_PAIRS = list(zip(TRANSFORM_INDICES[:-1], TRANSFORM_INDICES[1:]))
+
+if np is not None:
+    _NP_FIRST = np.array(TRANSFORM_INDICES[:-1], dtype=np.intp)
+    _NP_SECOND = np.array(TRANSFORM_INDICES[1:], dtype=np.intp)
+
+    # :py:data:`TRUTH_TABLE`, shifted so that trits (and lookup results)
+    # are represented as 0, 1, 2 instead of -1, 0, 1.
+    _NP_TRUTH_TABLE = np.array(TRUTH_TABLE, dtype=np.intp) + 1
+
 
 class Curl(object):
     """
     Python implementation of Curl.
 
     **IMPORTANT: Not thread-safe!**
+
+    :param Optional[str] backend:
+        Implementation to use for the transform function (see
+        :py:data:`BACKENDS`).
+
+        If not specified, the value of the ``PYOTA_CURL_BACKEND``
+        environment variable is used, falling back to ``'python'``.
+
+        When using the ``'numpy'`` backend, :py:meth:`absorb` and
+        :py:meth:`squeeze` also accept ``int8`` NumPy arrays and
+        memoryviews, without copying them into lists.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, backend: Optional[str] = None) -> None:
+        if backend is None:
+            backend = environ.get(BACKEND_ENV_VAR) or BACKENDS[0]
+
+        if backend not in BACKENDS:
+            raise with_context(
+                exc=ValueError(
+                    'Invalid Curl backend {backend!r} '
+                    '(expected one of {backends!r}).'.format(
+                        backend=backend,
+                        backends=BACKENDS,
+                    ),
+                ),
+
+                context={
+                    'backend': backend,
+                },
+            )
+
+        if backend == 'numpy' and np is None:
+            raise with_context(
+                exc=ImportError(
+                    'The {backend!r} Curl backend requires NumPy.'.format(
+                        backend=backend,
+                    ),
+                ),
+
+                context={
+                    'backend': backend,
+                },
+            )
+
+        self.backend = backend
+
         self.reset()
 
     def reset(self) -> None:
         """
         Resets internal state.
         """
-        self._state: List[int] = [0] * STATE_LENGTH
+        if self.backend == 'numpy':
+            self._state = np.zeros(STATE_LENGTH, dtype=np.int8)
+        else:
+            self._state: List[int] = [0] * STATE_LENGTH
 
     def absorb(
             self,
@@ -72,11 +172,18 @@ class Curl(object):
         :param length:
             Number of trits to absorb.  Defaults to ``len(trits)``.
         """
-        pad = ((len(trits) % HASH_LENGTH) or HASH_LENGTH)
-        trits += [0] * (HASH_LENGTH - pad)
+        if isinstance(trits, list):
+            pad = ((len(trits) % HASH_LENGTH) or HASH_LENGTH)
+            trits += [0] * (HASH_LENGTH - pad)
+        elif self.backend == 'numpy':
+            # Arrays and memoryviews can't be padded in place; any
+            # missing trits are treated as zeros below.
+            trits = np.asarray(trits, dtype=np.int8)
+        else:
+            trits = trits.tolist()
 
         if length is None:
-            length = len(trits)
+            length = len(trits) + (-len(trits) % HASH_LENGTH)
 
         if length < 1:
             raise with_context(
@@ -101,7 +208,11 @@ class Curl(object):
             # state. ``self._state`` is 3 hashes long, but only the
             # first hash is "public"; the other 2 are only accessible to
             # :py:meth:`_transform`.
-            self._state[0:stop - start] = trits[start:stop]
+            chunk = trits[start:stop]
+            self._state[0:len(chunk)] = chunk
+            self._state[len(chunk):stop - start] = [0] * (
+                stop - start - len(chunk)
+            )
 
             # Transform.
             self._transform()
@@ -148,10 +259,16 @@ class Curl(object):
 
         # Ensure that ``trits`` can hold at least one hash worth of
         # trits.
-        trits.extend([0] * max(0, length - len(trits)))
+        # Arrays and memoryviews can't be extended, so they must already
+        # be long enough.
+        if isinstance(trits, list):
+            trits.extend([0] * max(0, length - len(trits)))
+            capacity = HASH_LENGTH
+        else:
+            capacity = length
 
         # Check trits with offset can handle hash length
-        if len(trits) - offset < HASH_LENGTH:
+        if len(trits) - offset < capacity:
             raise with_context(
                 exc=ValueError('Invalid offset passed to ``squeeze``.'),
 
@@ -164,7 +281,7 @@ class Curl(object):
 
         while length >= HASH_LENGTH:
             # Copy exactly one hash.
-            trits[offset:offset + HASH_LENGTH] = self._state[0:HASH_LENGTH]
+            trits[offset:offset + HASH_LENGTH] = self._get_hash_for(trits)
 
             # One hash worth of trits copied; now transform.
             self._transform()
@@ -172,47 +289,71 @@ class Curl(object):
             offset += HASH_LENGTH
             length -= HASH_LENGTH
 
+    def _get_hash_for(self, trits: MutableSequence[int]) -> Sequence[int]:
+        """
+        Returns the "public" part of the internal state, in a form that
+        can be copied into a slice of ``trits``.
+        """
+        hash_trits = self._state[0:HASH_LENGTH]
+
+        if self.backend == 'numpy':
+            # Don't leak NumPy scalars into plain lists.
+            return hash_trits.tolist() if isinstance(trits, list) else hash_trits
+
+        if isinstance(trits, memoryview):
+            return array('b', hash_trits)
+
+        return hash_trits
+
     def _transform(self) -> None:
         """
         Transforms internal state.
         """
+        if self.backend == 'numpy':
+            self._state = _transform_numpy(self._state)
+            return
+
         # Copy some values locally so we can avoid global lookups in the
         # inner loop.
         #
         # References:
         #
         # - https://wiki.python.org/moin/PythonSpeed/PerformanceTips#Local_Variables
-        state_length = STATE_LENGTH
+        index_pairs = _INDEX_PAIRS
         truth_table = TRUTH_TABLE
 
-        # Operate on a copy of ``self._state`` to eliminate dot lookups
-        # in the inner loop.
-        #
-        # References:
-        #
-        # - https://wiki.python.org/moin/PythonSpeed/PerformanceTips#Avoiding_dots...
-        # - http://stackoverflow.com/a/2612990/
-        prev_state = self._state[:]
-        new_state = prev_state[:]
+        state = self._state
 
         # Note: This code looks significantly different from the C
         # implementation because it has been optimized to limit the
         # number of list item lookups (these are relatively slow in
-        # Python).
-        index = 0
+        # Python).  The order in which the state is visited is
+        # precomputed in :py:data:`TRANSFORM_INDICES`.
         for _ in range(NUMBER_OF_ROUNDS):
-            prev_trit = prev_state[index]
+            state = [
+                truth_table[state[a] + (3 * state[b]) + 4]
+                for a, b in index_pairs
+            ]
 
-            for pos in range(state_length):
-                index += (364 if index < 365 else -365)
+        self._state = state
 
-                new_trit = prev_state[index]
 
-                new_state[pos] = truth_table[prev_trit + (3 * new_trit) + 4]
+def _transform_numpy(state: 'np.ndarray') -> 'np.ndarray':
+    """
+    Vectorized version of :py:meth:`Curl._transform`.
+
+    Each round is computed with two gathers and one table lookup over
+    the whole state.
+    """
+    first = _NP_FIRST
+    second = _NP_SECOND
+    truth_table = _NP_TRUTH_TABLE
 
-                prev_trit = new_trit
+    # Work with trits shifted to 0, 1, 2, so that they can be used as
+    # indexes directly.
+    shifted = state.astype(np.intp) + 1
 
-            prev_state = new_state
-            new_state = new_state[:]
+    for _ in range(NUMBER_OF_ROUNDS):
+        shifted = truth_table[shifted[first] + (3 * shifted[second])]
 
-        self._state = new_state
+    return (shifted - 1).astype(np.int8)
@@ -1,8 +1,14 @@
-from typing import Iterator, List, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, \
+    TypeVar
 
 from iota import Hash, TRITS_PER_TRYTE, TryteString, TrytesCompatible, Address
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH
 from iota.crypto.kerl import Kerl
+from iota.crypto.kerl.conv import int_to_trits, trits_to_int
 from iota.crypto.types import PrivateKey, Seed
 from iota.exceptions import with_context
 from iota.trits import add_trits, trits_from_int
@@ -10,6 +16,8 @@ from iota.trits import add_trits, trits_from_int
 __all__ = [
     'KeyGenerator',
     'KeyIterator',
+    'get_worker_pool',
+    'map_index_range',
     'normalize',
     'SignatureFragmentGenerator',
     'validate_signature_fragments',
@@ -55,6 +63,116 @@ def normalize(hash_: Hash) -> List[List[int]]:
     return normalized
 
 
+T = TypeVar('T')
+
+_worker_pools: Dict[int, ProcessPoolExecutor] = {}
+_worker_pools_lock = Lock()
+
+
+def get_worker_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns a pool of ``workers`` worker processes.
+
+    Pools are started on first use and shared by every caller that asks
+    for the same number of workers, so that the cost of starting the
+    processes is only paid once.  They are shut down automatically when
+    the interpreter exits.
+
+    :param workers:
+        Number of worker processes.
+    """
+    with _worker_pools_lock:
+        pool = _worker_pools.get(workers)
+
+        if pool is None:
+            pool = _worker_pools[workers] = ProcessPoolExecutor(workers)
+
+        return pool
+
+
+def map_index_range(
+        func: Callable[[int, int, int], List[T]],
+        start: int,
+        count: int,
+        step: int,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+) -> List[T]:
+    """
+    Splits a range of key indexes into contiguous shards, and processes
+    them concurrently.
+
+    :param func:
+        Called with ``(start, count, step)`` for each shard; must return
+        one item per index.  If the shards are processed in worker
+        processes, ``func`` must be picklable (e.g., a module-level
+        function or a :py:func:`functools.partial` of one).
+
+    :param start:
+        Index of the first item.
+
+    :param count:
+        Number of items.  If ``step`` is negative, indexes below 0 are
+        skipped.
+
+    :param step:
+        Number of indexes to advance after each item.
+
+    :param workers:
+        Number of worker processes to use (only used if ``executor`` is
+        not provided; see :py:func:`get_worker_pool`).  If neither is
+        provided, the range is processed in the calling thread.
+
+    :param executor:
+        Executor that will process the shards.
+
+    :return:
+        The items returned by ``func``, in index order.
+    """
+    if step < 0:
+        count = min(count, start // -step + 1)
+
+    if (count < 1) or (executor is None and not workers):
+        return func(start, count, step)
+
+    shards = min(count, workers or cpu_count() or 1)
+    shard_size, remainder = divmod(count, shards)
+
+    if executor is None:
+        executor = get_worker_pool(workers)
+
+    futures = []
+    try:
+        for i in range(shards):
+            shard_count = shard_size + (1 if i < remainder else 0)
+            futures.append(executor.submit(func, start, shard_count, step))
+            start += shard_count * step
+
+        return [item for future in futures for item in future.result()]
+    finally:
+        # If a shard failed, don't leave the others running in the
+        # (shared) executor.
+        for future in futures:
+            future.cancel()
+
+
+def _generate_keys(
+        seed: Seed,
+        iterations: int,
+        start: int,
+        count: int,
+        step: int,
+) -> List[PrivateKey]:
+    """
+    Generates keys in a worker process.
+
+    References:
+
+    - :py:meth:`KeyGenerator.get_keys`
+    """
+    return KeyGenerator(seed).get_keys(start, count, step, iterations)
+
+
 class KeyGenerator(object):
     """
     Generates signing keys for messages.
@@ -106,7 +224,9 @@ class KeyGenerator(object):
             start: int,
             count: int = 1,
             step: int = 1,
-            iterations: int = 1
+            iterations: int = 1,
+            workers: Optional[int] = None,
+            executor: Optional[Executor] = None,
     ) -> List[PrivateKey]:
         """
         Generates and returns one or more keys at the specified
@@ -140,6 +260,14 @@ class KeyGenerator(object):
             Increasing this value makes key generation slower, but more
             resistant to brute-forcing.
 
+        :param workers:
+            Number of worker processes to spread the keys across.
+            By default, keys are generated in the calling thread.
+
+        :param executor:
+            Executor to spread the keys across, instead of starting new
+            worker processes.
+
         :return:
             Always returns a list, even if only one key is generated.
 
@@ -171,6 +299,16 @@ class KeyGenerator(object):
                     },
             )
 
+        if workers or executor:
+            return map_index_range(
+                    partial(_generate_keys, self.seed, iterations),
+                    start,
+                    count,
+                    step,
+                    workers,
+                    executor,
+            )
+
         iterator = self.create_iterator(start, step, iterations)
 
         keys = []
@@ -347,7 +485,6 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
         self._key_chunks = private_key.iter_chunks(FRAGMENT_LENGTH)
         self._iteration = -1
         self._normalized_hash = normalize(hash_)
-        self._sponge = Kerl()
 
     def __iter__(self) -> 'SignatureFragmentGenerator':
         return self
@@ -380,14 +517,12 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
             hash_start = i * HASH_LENGTH
             hash_end = hash_start + HASH_LENGTH
 
-            buffer: List[int] = signature_fragment[hash_start:hash_end]
-
-            for _ in range(13 - normalized_chunk[i]):
-                self._sponge.reset()
-                self._sponge.absorb(buffer)
-                self._sponge.squeeze(buffer)
-
-            signature_fragment[hash_start:hash_end] = buffer
+            signature_fragment[hash_start:hash_end] = int_to_trits(
+                Kerl.hash_chain(
+                    trits_to_int(signature_fragment[hash_start:hash_end]),
+                    13 - normalized_chunk[i],
+                ),
+            )
 
         return TryteString.from_trits(signature_fragment)
 
@@ -416,9 +551,35 @@ def validate_signature_fragments(
     :param sponge_type:
       The class used to create the cryptographic sponge (i.e., Curl or Kerl).
     """
-    checksum = [0] * (HASH_LENGTH * len(fragments))
     normalized_hash = normalize(hash_)
 
+    if sponge_type is Kerl:
+        # Fast path: keep hashes in their integer representation.
+        addy_sponge = Kerl()
+
+        for i, fragment in enumerate(fragments):
+            outer_sponge = Kerl()
+
+            # If there are more than 3 iterations, loop back around to
+            # the start.
+            normalized_chunk = normalized_hash[i % len(normalized_hash)]
+
+            for j, hash_trytes in enumerate(fragment.iter_chunks(Hash.LEN)):
+                # Note the sign flip compared to
+                # :py;class:`SignatureFragmentGenerator`.
+                outer_sponge.absorb_int(
+                    Kerl.hash_chain(
+                        trits_to_int(hash_trytes.as_trits()),
+                        13 + normalized_chunk[j],
+                    ),
+                )
+
+            addy_sponge.absorb_int(outer_sponge.squeeze_int())
+
+        return int_to_trits(addy_sponge.squeeze_int()) == public_key.as_trits()
+
+    checksum = [0] * (HASH_LENGTH * len(fragments))
+
     for i, fragment in enumerate(fragments):
         outer_sponge = sponge_type()
 
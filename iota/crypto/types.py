@@ -3,6 +3,7 @@ from typing import Optional
 
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH, SeedWarning
 from iota.crypto.kerl import Kerl
+from iota.crypto.kerl.conv import int_to_trits, trits_to_int
 from iota.exceptions import with_context
 from iota.transaction.base import Bundle
 from iota.types import Hash, TryteString, TrytesCompatible
@@ -240,41 +241,34 @@ class PrivateKey(TryteString):
         key_fragments = self.iter_chunks(FRAGMENT_LENGTH)
 
         # The digest will contain one hash per key fragment.
-        digest = [0] * HASH_LENGTH * len(key_fragments)
+        digest = []
 
         # Iterate over each fragment in the key.
-        for i, fragment in enumerate(key_fragments):
+        for fragment in key_fragments:
             fragment_trits = fragment.as_trits()
 
-            key_fragment = [0] * FRAGMENT_LENGTH
-            hash_trits = []
+            sponge = Kerl()
 
             # Within each fragment, iterate over one hash at a time.
+            # Hashes stay in their integer representation, so that we
+            # don't have to convert them to trits between iterations.
             for j in range(hashes_per_fragment):
                 hash_start = j * HASH_LENGTH
                 hash_end = hash_start + HASH_LENGTH
-                hash_trits = fragment_trits[hash_start:hash_end]
-
-                for k in range(26):
-                    sponge = Kerl()
-                    sponge.absorb(hash_trits)
-                    sponge.squeeze(hash_trits)
 
-                key_fragment[hash_start:hash_end] = hash_trits
+                sponge.absorb_int(
+                    Kerl.hash_chain(
+                        trits_to_int(fragment_trits[hash_start:hash_end]),
+                        26,
+                    ),
+                )
 
             # After processing all of the hashes in the fragment,
             # generate a final hash and append it to the digest.
             #
             # Note that we will do this once per fragment in the key, so
             # the longer the key is, the longer the digest will be.
-            sponge = Kerl()
-            sponge.absorb(key_fragment)
-            sponge.squeeze(hash_trits)
-
-            fragment_hash_start = i * HASH_LENGTH
-            fragment_hash_end = fragment_hash_start + HASH_LENGTH
-
-            digest[fragment_hash_start:fragment_hash_end] = hash_trits
+            digest += int_to_trits(sponge.squeeze_int())
 
         return Digest(TryteString.from_trits(digest), self.key_index)
 
@@ -1,11 +1,16 @@
-from typing import Type
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Type
 
 import filters as f
 from filters.macros import filter_macro
 from urllib.parse import urlparse
 
-from iota import Address, TryteString, TrytesCompatible
+from iota import Address, AsciiTrytesCodec, TryteString, TrytesCompatible
 from iota.crypto.addresses import AddressGenerator
+from iota.transaction.types import BundleHash, Fragment, Nonce, \
+    TransactionHash, TransactionTrytes
+from iota.types import Hash, Tag
 
 __all__ = [
     'AddressNoChecksum',
@@ -14,8 +19,44 @@ __all__ = [
     'SecurityLevel',
     'StringifiedTrytesArray',
     'Trytes',
+    'TrytesArray',
+    'is_trusted',
+    'trusted_values',
 ]
 
+_trusted: ContextVar[bool] = ContextVar('trusted', default=False)
+
+
+def is_trusted() -> bool:
+    """
+    Returns whether filters are running in trusted mode.
+
+    See :py:func:`trusted_values`.
+    """
+    return _trusted.get()
+
+
+@contextmanager
+def trusted_values(trusted: bool = True) -> Iterator[None]:
+    """
+    Context manager that puts filters in trusted mode.
+
+    In trusted mode, values that already have the expected type (e.g.,
+    a :py:class:`TransactionHash` where a transaction hash is expected)
+    are accepted as-is, instead of being validated again.  Values of any
+    other type are still validated, and address checksums are always
+    verified.
+
+    :param bool trusted:
+        Whether to enable trusted mode.  Pass ``False`` to force full
+        validation within the context.
+    """
+    token = _trusted.set(trusted)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
 
 class GeneratedAddress(f.BaseFilter):
     """
@@ -158,6 +199,10 @@ class Trytes(f.BaseFilter):
         self.result_type = result_type
 
     def _apply(self, value):
+        # Values created by this library are valid by construction.
+        if isinstance(value, self.result_type) and is_trusted():
+            return value
+
         value: TrytesCompatible = self._filter(
             filter_chain=f.Type(
                 (bytes, bytearray, str, TryteString)
@@ -204,8 +249,7 @@ class Trytes(f.BaseFilter):
             )
 
 
-@filter_macro
-def StringifiedTrytesArray(trytes_type: Type = TryteString) -> f.FilterChain:
+class StringifiedTrytesArray(f.BaseFilter):
     """
     Validates that the incoming value is an array containing tryte
     strings corresponding to the specified type (e.g.,
@@ -219,7 +263,7 @@ def StringifiedTrytesArray(trytes_type: Type = TryteString) -> f.FilterChain:
         to validate.
 
     :return:
-        :py:class:`filters.FilterChain` object.
+        :py:class:`StringifiedTrytesArray` object.
 
     .. important::
         This filter will return string values, suitable for inclusion in
@@ -231,11 +275,131 @@ def StringifiedTrytesArray(trytes_type: Type = TryteString) -> f.FilterChain:
         desirable, chain this filter with ``f.NotEmpty`` or
         ``f.Required``, respectively.
     """
-    return f.Array | f.FilterRepeater(
-        f.Required |
-        Trytes(trytes_type) |
-        f.Unicode(encoding='ascii', normalize=False),
+
+    def __init__(self, trytes_type: Type = TryteString) -> None:
+        super(StringifiedTrytesArray, self).__init__()
+
+        self.trytes_type = trytes_type
+
+        self._chain = f.Array | f.FilterRepeater(
+            f.Required |
+            Trytes(trytes_type) |
+            f.Unicode(encoding='ascii', normalize=False),
+        )
+
+    def _apply(self, value):
+        # In trusted mode, convert arrays of typed values in one go,
+        # instead of running the filter chain for each item.
+        if is_trusted() and isinstance(value, (list, tuple)):
+            trytes_type = self.trytes_type
+
+            if all(isinstance(item, trytes_type) for item in value):
+                return [str(item) for item in value]
+
+        value = self._filter(value, self._chain)
+
+        if self._has_errors:
+            return None
+
+        return value
+
+
+class TrytesArray(f.BaseFilter):
+    """
+    Converts an array of tryte strings (e.g., from a node response) into
+    objects of the specified type.
+
+    Equivalent to::
+
+        f.FilterRepeater(f.ByteString(encoding='ascii') | Trytes(result_type))
+
+    but arrays of ``str`` values (as decoded from JSON) are checked in a
+    single pass over the whole array, instead of running the filter
+    chain for each item.  If the check fails, the filter chain is used
+    to find out which items are invalid.
+
+    :param TryteString result_type:
+        Any subclass of :py:class:`~iota.TryteString` that you want the
+        filter to return.
+
+    :return:
+        :py:class:`TrytesArray` object.
+    """
+    BULK_TYPES = (
+        BundleHash,
+        Fragment,
+        Hash,
+        Nonce,
+        Tag,
+        TransactionHash,
+        TransactionTrytes,
+        TryteString,
     )
+    """
+    Types that can be built in bulk.  Instances of these types only
+    contain trytes, padded with ``9`` up to the type's ``LEN`` (if any).
+    Arrays of any other type are always converted one item at a time.
+    """
+
+    _alphabet = bytes(AsciiTrytesCodec.alphabet.values())
+
+    def __init__(self, result_type: type = TryteString) -> None:
+        super(TrytesArray, self).__init__()
+
+        self.result_type = result_type
+
+        self._chain = f.FilterRepeater(
+            f.ByteString(encoding='ascii') |
+            Trytes(result_type)
+        )
+
+    def _apply(self, value):
+        if self._can_bulk_decode(value):
+            return self._bulk_decode(value)
+
+        value = self._filter(value, self._chain)
+
+        if self._has_errors:
+            return None
+
+        return value
+
+    def _can_bulk_decode(self, value) -> bool:
+        """
+        Checks whether every item in the array is a valid tryte string
+        for :py:attr:`result_type`.
+        """
+        if type(value) is not list or self.result_type not in self.BULK_TYPES:
+            return False
+
+        if not all(type(item) is str for item in value):
+            return False
+
+        max_len = getattr(self.result_type, 'LEN', None)
+        if max_len and any(len(item) > max_len for item in value):
+            return False
+
+        # Check every character in one go, by deleting all of the valid
+        # ones and checking that nothing is left over.
+        try:
+            joined = ''.join(value).encode('ascii')
+        except UnicodeEncodeError:
+            return False
+
+        return not joined.translate(None, self._alphabet)
+
+    def _bulk_decode(self, value: list) -> list:
+        """
+        Converts an array of valid tryte strings into
+        :py:attr:`result_type` objects.
+        """
+        from_trusted = self.result_type._from_trusted
+        pad = getattr(self.result_type, 'LEN', 0)
+
+        return [
+            from_trusted(bytearray(item.ljust(pad, '9'), 'ascii'))
+            for item in value
+        ]
 
 
 class AddressNoChecksum(Trytes):
@@ -260,14 +424,18 @@ class AddressNoChecksum(Trytes):
         super(AddressNoChecksum, self).__init__(result_type=Address)
 
     def _apply(self, value):
-        super(AddressNoChecksum, self)._apply(value)
-
-        if self._has_errors:
-            return None
-
-        # Possible it's still just a TryteString.
-        if not isinstance(value, Address):
-            value = Address(value)
+        # In trusted mode, Address objects skip the trytes/length checks,
+        # but the checksum is still verified, since it protects against
+        # typos in addresses entered by the user.
+        if not (isinstance(value, Address) and is_trusted()):
+            super(AddressNoChecksum, self)._apply(value)
+
+            if self._has_errors:
+                return None
+
+            # Possible it's still just a TryteString.
+            if not isinstance(value, Address):
+                value = Address(value)
 
         # Bail out if we have a bad checksum.
         if value.checksum and not value.is_checksum_valid():
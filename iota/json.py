@@ -1,6 +1,29 @@
+import json
 from abc import ABCMeta, abstractmethod as abstract_method
+from codecs import getincrementaldecoder
+from json.decoder import JSONDecoder
 from json.encoder import JSONEncoder as BaseJsonEncoder
-from typing import Iterable, Mapping
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+from iota.exceptions import with_context
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+"""
+Supported JSON backends, in order of preference.
+
+``orjson`` and ``ujson`` are optional; ``json`` (the standard library)
+is always available.
+"""
 
 
 class JsonSerializable(object, metaclass=ABCMeta):
@@ -67,3 +90,349 @@ class JsonEncoder(BaseJsonEncoder):
             return o.as_json_compatible()
 
         return super(JsonEncoder, self).default(o)
+
+
+def json_default(o: Any) -> Any:
+    """
+    Converts objects that the JSON backend can't serialize natively.
+
+    Passed as the ``default`` hook to the JSON backend.  The backend
+    calls it again for any values nested in the result (e.g., the tryte
+    strings in a :py:class:`iota.Transaction`).
+    """
+    if isinstance(o, JsonSerializable):
+        return o.as_json_compatible()
+
+    raise TypeError(
+        'Object of type {cls} is not JSON serializable.'.format(
+            cls=type(o).__name__,
+        ),
+    )
+
+
+def get_json_backend() -> str:
+    """
+    Returns the name of the JSON backend in use.
+    """
+    return _backend
+
+
+def set_json_backend(name: str) -> None:
+    """
+    Selects the JSON backend used by :py:func:`dumps` and
+    :py:func:`loads`.
+
+    :param str name:
+        One of :py:data:`JSON_BACKENDS`.
+
+    :raise:
+        - :py:class:`ValueError` if the backend is unknown.
+        - :py:class:`ImportError` if the backend is not installed.
+    """
+    global _backend
+
+    if name not in JSON_BACKENDS:
+        raise with_context(
+            exc=ValueError(
+                'Unknown JSON backend {name!r}; '
+                'expected one of {backends!r}.'.format(
+                    backends=JSON_BACKENDS,
+                    name=name,
+                ),
+            ),
+
+            context={
+                'name': name,
+            },
+        )
+
+    if {'orjson': orjson, 'ujson': ujson}.get(name, json) is None:
+        raise with_context(
+            exc=ImportError(
+                'JSON backend {name!r} is not installed; '
+                'install it with ``pip install {name}``.'.format(
+                    name=name,
+                ),
+            ),
+
+            context={
+                'name': name,
+            },
+        )
+
+    _backend = name
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to UTF-8 encoded JSON, using the selected
+    backend.
+
+    Supports :py:class:`JsonSerializable` objects.
+    """
+    if _backend == 'orjson':
+        return orjson.dumps(obj, default=json_default)
+
+    if _backend == 'ujson':
+        return ujson.dumps(
+            obj,
+            default=json_default,
+            ensure_ascii=False,
+        ).encode('utf-8')
+
+    return JsonEncoder().encode(obj).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserializes JSON, using the selected backend.
+
+    :param Union[bytes, str] data:
+        JSON document.  ``bytes`` are decoded as UTF-8 by the backend
+        itself, without creating an intermediate ``str``.
+
+    :raise:
+        - :py:class:`ValueError` if ``data`` is not valid JSON.
+    """
+    if _backend == 'orjson':
+        return orjson.loads(data)
+
+    if _backend == 'ujson':
+        return ujson.loads(data)
+
+    return json.loads(data)
+
+
+_backend: str = next(
+    name
+    for name, module in zip(JSON_BACKENDS, (orjson, ujson, json))
+    if module is not None
+)
+
+
+class JsonArrayStreamDecoder(object):
+    """
+    Incrementally decodes a JSON object, extracting the members of one
+    of its array values as they arrive.
+
+    Used to process very large node responses (e.g., ``getTrytes``)
+    without holding the entire document in memory.  Values for other
+    keys are parsed and discarded.
+
+    Example::
+
+        decoder = JsonArrayStreamDecoder('hashes')
+
+        for chunk in chunks:
+            for value in decoder.feed(chunk):
+                ...
+
+        decoder.close()
+
+    :param str key:
+        Key of the array to extract.
+    """
+    _WHITESPACE = ' \t\n\r'
+    _DELIMITERS = _WHITESPACE + ',:]}'
+
+    # Parser states.
+    _START = 'start'
+    _KEY = 'key'
+    _COLON = 'colon'
+    _VALUE = 'value'
+    _ARRAY_START = 'array_start'
+    _ARRAY_MEMBER = 'array_member'
+    _ARRAY_NEXT = 'array_next'
+    _END = 'end'
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+        self._buffer = ''
+        self._current_key: Optional[str] = None
+
+        # Chunks received while waiting for the rest of an incomplete
+        # value.  They are only joined (and the value parsed again) once
+        # a delimiter arrives, so that values spread across many chunks
+        # don't take quadratic time.
+        self._pending: List[str] = []
+        self._incomplete = False
+        self._decoder = JSONDecoder()
+        self._state = self._START
+        self._utf8 = getincrementaldecoder('utf-8')()
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Whether the entire JSON object has been decoded.
+        """
+        return self._state == self._END
+
+    def feed(self, data: Union[bytes, str]) -> List[Any]:
+        """
+        Decodes the next chunk of the JSON document.
+
+        :param Union[bytes, str] data:
+            Next chunk of the document.  ``bytes`` may end partway
+            through a UTF-8 sequence.
+
+        :return:
+            Array members that were completed by this chunk.
+
+        :raise:
+            - :py:class:`ValueError` if the document is not a JSON
+              object.
+        """
+        if isinstance(data, bytes):
+            data = self._utf8.decode(data)
+
+        # A value is only complete once it is followed by a delimiter.
+        if self._incomplete and not any(d in data for d in self._DELIMITERS):
+            self._pending.append(data)
+            return []
+
+        buffer = ''.join([self._buffer] + self._pending + [data])
+        self._pending = []
+        self._incomplete = False
+
+        values = []
+        pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in self._WHITESPACE:
+                pos += 1
+
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+
+            if self._state == self._START:
+                self._expect(char, '{', pos)
+                self._state = self._KEY
+                pos += 1
+
+            elif self._state == self._KEY:
+                if char == '}':
+                    self._state = self._END
+                    pos += 1
+                elif char == ',':
+                    pos += 1
+                else:
+                    self._expect(char, '"', pos)
+
+                    decoded = self._decode(buffer, pos)
+                    if decoded is None:
+                        self._incomplete = True
+                        break
+
+                    self._current_key, pos = decoded
+                    self._state = self._COLON
+
+            elif self._state == self._COLON:
+                self._expect(char, ':', pos)
+                self._state = self._VALUE
+                pos += 1
+
+            elif self._state == self._VALUE:
+                if self._current_key == self.key and char == '[':
+                    self._state = self._ARRAY_START
+                    pos += 1
+                else:
+                    decoded = self._decode(buffer, pos)
+                    if decoded is None:
+                        self._incomplete = True
+                        break
+
+                    _, pos = decoded
+                    self._state = self._KEY
+
+            elif self._state == self._ARRAY_START:
+                if char == ']':
+                    self._state = self._KEY
+                    pos += 1
+                else:
+                    self._state = self._ARRAY_MEMBER
+
+            elif self._state == self._ARRAY_MEMBER:
+                decoded = self._decode(buffer, pos)
+                if decoded is None:
+                    self._incomplete = True
+                    break
+
+                value, pos = decoded
+                values.append(value)
+                self._state = self._ARRAY_NEXT
+
+            elif self._state == self._ARRAY_NEXT:
+                if char == ']':
+                    self._state = self._KEY
+                else:
+                    self._expect(char, ',', pos)
+                    self._state = self._ARRAY_MEMBER
+
+                pos += 1
+
+            else:
+                self._expect(char, None, pos)
+
+        self._buffer = buffer[pos:]
+        return values
+
+    def close(self) -> None:
+        """
+        Checks that the entire JSON document was received.
+
+        :raise:
+            - :py:class:`ValueError` if the document is incomplete.
+        """
+        if not self.is_complete:
+            raise with_context(
+                exc=ValueError('Incomplete JSON document.'),
+
+                context={
+                    'key': self.key,
+                    'state': self._state,
+                    'buffer': self._buffer[:100],
+                },
+            )
+
+    def _decode(self, buffer: str, pos: int) -> Optional[Tuple[Any, int]]:
+        """
+        Decodes the JSON value at ``pos``.
+
+        Returns ``None`` if the buffer doesn't contain the complete value
+        yet.  A value is only complete if it is followed by a delimiter;
+        otherwise a number such as ``12`` might be the beginning of
+        ``12.5``.
+        """
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except ValueError:
+            return None
+
+        if end >= len(buffer) or buffer[end] not in self._DELIMITERS:
+            return None
+
+        return value, end
+
+    def _expect(self, char: str, expected: Optional[str], pos: int) -> None:
+        """
+        Raises an exception if ``char`` is not the expected character.
+        """
+        if char != expected:
+            raise with_context(
+                exc=ValueError(
+                    'Unexpected character {char!r} in JSON document '
+                    '(expected {expected!r}).'.format(
+                        char=char,
+                        expected=expected,
+                    ),
+                ),
+
+                context={
+                    'key': self.key,
+                    'state': self._state,
+                    'position': pos,
+                },
+            )
@@ -0,0 +1,191 @@
+"""
+Runs coroutines on behalf of the synchronous API.
+
+The synchronous :py:class:`iota.Iota` and :py:class:`iota.StrictIota`
+classes are thin wrappers around their asynchronous counterparts.  Rather
+than spinning the caller's event loop for each call, they submit their
+coroutines to an :py:class:`EventLoopRunner`, which owns a single
+long-lived event loop in a dedicated thread.
+
+This means that:
+
+- Sync calls can be issued concurrently from many threads.
+- Sync calls work even if the calling thread is already running an
+  event loop (e.g., inside a Jupyter notebook).
+- Network clients stay bound to the same loop for their whole lifetime,
+  so connections are reused between calls.
+"""
+
+import asyncio
+from atexit import register
+from threading import Event, Lock, Thread, get_ident
+from typing import Any, Awaitable, Optional
+
+from iota.exceptions import with_context
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+__all__ = [
+    'EventLoopRunner',
+    'get_runner',
+]
+
+
+class EventLoopRunner(object):
+    """
+    Owns an event loop running in a background thread and executes
+    coroutines on it.
+
+    :param bool use_uvloop:
+        Whether to run the loop using
+        `uvloop <https://pypi.org/project/uvloop/>`_.
+        Requires the ``uvloop`` package to be installed.
+    """
+
+    def __init__(self, use_uvloop: bool = False) -> None:
+        if use_uvloop and uvloop is None:
+            raise with_context(
+                exc=ImportError(
+                    'uvloop is not installed; '
+                    'install it with ``pip install uvloop``.',
+                ),
+
+                context={
+                    'use_uvloop': use_uvloop,
+                },
+            )
+
+        self.use_uvloop = use_uvloop
+
+        self._lock = Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._thread_id: Optional[int] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the runner's event loop, starting it if necessary.
+        """
+        self.start()
+        return self._loop
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Whether the background thread is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """
+        Starts the background thread, if it is not running already.
+        """
+        with self._lock:
+            if self.is_running:
+                return
+
+            if self.use_uvloop:
+                loop = uvloop.new_event_loop()
+            else:
+                loop = asyncio.new_event_loop()
+
+            started = Event()
+
+            def run_forever() -> None:
+                self._thread_id = get_ident()
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                    loop.close()
+
+            self._loop = loop
+            self._thread = Thread(
+                target=run_forever,
+                name='iota-event-loop',
+                daemon=True,
+            )
+            self._thread.start()
+            started.wait()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread and closes its event loop.
+
+        The runner can be started again afterwards, but any objects that
+        were bound to the old loop (e.g., network clients) can no longer
+        be used.
+        """
+        with self._lock:
+            if not self.is_running:
+                return
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+            self._loop = None
+            self._thread = None
+            self._thread_id = None
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Runs a coroutine on the background loop, and blocks until it
+        completes.
+
+        Safe to call from any thread except the runner's own.
+
+        :param Awaitable coro:
+            Coroutine to run.
+
+        :param Optional[float] timeout:
+            Max number of seconds to wait for the result.
+            If ``None``, waits indefinitely.
+
+        :return:
+            Result of the coroutine.
+        """
+        loop = self.loop
+
+        if get_ident() == self._thread_id:
+            # Blocking here would wait forever for a result that only
+            # this thread can produce.
+            coro.close()
+
+            raise with_context(
+                exc=RuntimeError(
+                    'Synchronous API methods cannot be called from '
+                    'coroutines running on the same runner; '
+                    'await the async API instead.',
+                ),
+
+                context={
+                    'runner': self,
+                },
+            )
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+_runner: Optional[EventLoopRunner] = None
+_runner_lock = Lock()
+
+
+def get_runner() -> EventLoopRunner:
+    """
+    Returns the default runner, shared by all synchronous API instances.
+    """
+    global _runner
+
+    with _runner_lock:
+        if _runner is None:
+            _runner = EventLoopRunner()
+            register(_runner.stop)
+
+        return _runner
@@ -5,3 +5,4 @@ from .creation import *
 from .types import *
 from .utils import *
 from .validator import *
+from .table import *
@@ -1,9 +1,10 @@
 from operator import attrgetter
-from typing import Iterable, Iterator, List, MutableSequence, \
-    Optional, Sequence, TypeVar, Type
+from typing import Any, Callable, Iterable, Iterator, List, \
+    MutableSequence, Optional, Sequence, TypeVar, Type
 
 from iota.codecs import TrytesDecodeError
 from iota.crypto import Curl, HASH_LENGTH
+from iota.crypto.batch_curl import MIN_LANES, curl_hash_many
 from iota.json import JsonSerializable
 from iota.transaction.types import BundleHash, Fragment, Nonce, \
     TransactionHash, TransactionTrytes
@@ -12,6 +13,7 @@ from iota.types import Address, Tag, TryteString, TrytesCompatible
 
 __all__ = [
     'Bundle',
+    'LazyTransaction',
     'Transaction',
 ]
 
@@ -599,6 +601,210 @@ class Transaction(JsonSerializable):
         return self._legacy_tag or self.tag
 
 
+class _LazyField(object):
+    """
+    Descriptor for a :py:class:`LazyTransaction` field that is decoded
+    from the raw transaction trytes on first access.
+
+    The decoded value is memoized in the slot named ``slot``.
+    """
+
+    def __init__(
+            self,
+            slot: str,
+            start: int,
+            stop: int,
+            decode: Callable[[TryteString], Any],
+    ) -> None:
+        self.slot = slot
+        self.start = start
+        self.stop = stop
+        self.decode = decode
+
+    def __get__(self, instance: Optional['LazyTransaction'], owner: type):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.decode(instance._trytes[self.start:self.stop])
+            setattr(instance, self.slot, value)
+            return value
+
+    def __set__(self, instance: 'LazyTransaction', value: Any) -> None:
+        setattr(instance, self.slot, value)
+        instance._modified = True
+
+
+def _int_from_trytes(trytes: TryteString) -> int:
+    return int_from_trits(trytes.as_trits())
+
+
+class LazyTransaction(Transaction):
+    """
+    A :py:class:`Transaction` that is backed by its raw trytes, and only
+    decodes the fields that are actually used.
+
+    Each field is parsed the first time it is accessed, then memoized.
+    The transaction hash is only computed when :py:attr:`hash` is read,
+    unless it was provided to the initializer.
+
+    This is much faster than :py:meth:`Transaction.from_tryte_string`
+    when only a few fields are needed (e.g., to sort transactions into
+    bundles).
+
+    .. note::
+        Decoded fields are stored in ``__slots__``, but because
+        :py:class:`Transaction` does not define ``__slots__``, instances
+        still have a ``__dict__``.  The savings come from not decoding
+        (and not storing) the fields that are never accessed, not from
+        a smaller object layout.
+
+    :param TrytesCompatible trytes:
+        Raw trytes.  Should be exactly 2673 trytes long.
+
+    :param Optional[TransactionHash] hash_:
+        The transaction hash, if available.
+
+        If not provided, it will be computed from the transaction trytes
+        the first time it is needed.
+    """
+    __slots__ = (
+        '_trytes',
+        '_modified',
+        '_hash',
+        '_signature_message_fragment',
+        '_address',
+        '_value',
+        '_legacy_tag_',
+        '_timestamp',
+        '_current_index',
+        '_last_index',
+        '_bundle_hash',
+        '_trunk_transaction_hash',
+        '_branch_transaction_hash',
+        '_tag',
+        '_attachment_timestamp',
+        '_attachment_timestamp_lower_bound',
+        '_attachment_timestamp_upper_bound',
+        '_nonce',
+        'is_confirmed',
+    )
+
+    signature_message_fragment = _LazyField(
+        '_signature_message_fragment', 0, 2187, Fragment)
+    address = _LazyField('_address', 2187, 2268, Address)
+    value = _LazyField('_value', 2268, 2295, _int_from_trytes)
+    _legacy_tag = _LazyField('_legacy_tag_', 2295, 2322, Tag)
+    timestamp = _LazyField('_timestamp', 2322, 2331, _int_from_trytes)
+    current_index = _LazyField('_current_index', 2331, 2340, _int_from_trytes)
+    last_index = _LazyField('_last_index', 2340, 2349, _int_from_trytes)
+    bundle_hash = _LazyField('_bundle_hash', 2349, 2430, BundleHash)
+
+    trunk_transaction_hash = _LazyField(
+        '_trunk_transaction_hash', 2430, 2511, TransactionHash)
+
+    branch_transaction_hash = _LazyField(
+        '_branch_transaction_hash', 2511, 2592, TransactionHash)
+
+    tag = _LazyField('_tag', 2592, 2619, Tag)
+
+    attachment_timestamp = _LazyField(
+        '_attachment_timestamp', 2619, 2628, _int_from_trytes)
+
+    attachment_timestamp_lower_bound = _LazyField(
+        '_attachment_timestamp_lower_bound', 2628, 2637, _int_from_trytes)
+
+    attachment_timestamp_upper_bound = _LazyField(
+        '_attachment_timestamp_upper_bound', 2637, 2646, _int_from_trytes)
+
+    nonce = _LazyField('_nonce', 2646, 2673, Nonce)
+
+    @classmethod
+    def from_tryte_string(
+            cls: Type[T],
+            trytes: TrytesCompatible,
+            hash_: Optional[TransactionHash] = None
+    ) -> T:
+        """
+        Creates a LazyTransaction object from a sequence of trytes.
+
+        :param TrytesCompatible trytes:
+            Raw trytes.  Should be exactly 2673 trytes long.
+
+        :param Optional[TransactionHash] hash_:
+            The transaction hash, if available.
+
+            If not provided, it will be computed from the transaction
+            trytes the first time it is needed.
+
+        :return:
+            :py:class:`LazyTransaction` object.
+        """
+        return cls(trytes, hash_)
+
+    # noinspection PyMissingConstructor
+    def __init__(
+            self,
+            trytes: TrytesCompatible,
+            hash_: Optional[TransactionHash] = None
+    ) -> None:
+        # Fields are decoded on demand, so we intentionally do not call
+        # ``Transaction.__init__`` here.
+        self._trytes: TransactionTrytes = (
+            trytes
+            if type(trytes) is TransactionTrytes
+            else TransactionTrytes(trytes)
+        )
+
+        self._modified = False
+
+        if hash_:
+            self._hash = hash_
+
+        self.is_confirmed: Optional[bool] = None
+
+    @property
+    def hash(self) -> TransactionHash:
+        """
+        The transaction hash, used to uniquely identify the transaction on the
+        Tangle.
+
+        Computed from the raw transaction trytes the first time it is
+        accessed, unless it was provided to the initializer.
+
+        :type: :py:class:`TransactionHash`
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            hash_trits: MutableSequence[int] = [0] * HASH_LENGTH
+
+            sponge = Curl()
+            sponge.absorb(self._trytes.as_trits())
+            sponge.squeeze(hash_trits)
+
+            self._hash = TransactionHash.from_trits(hash_trits)
+            return self._hash
+
+    @hash.setter
+    def hash(self, value: TransactionHash) -> None:
+        self._hash = value
+
+    def as_tryte_string(self) -> TransactionTrytes:
+        """
+        Returns a TryteString representation of the transaction.
+
+        :return:
+            :py:class:`TryteString` object.
+        """
+        if self._modified:
+            return super(LazyTransaction, self).as_tryte_string()
+
+        return TransactionTrytes(self._trytes)
+
+
 B = TypeVar('B', bound='Bundle')
 
 
@@ -634,6 +840,11 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
         :py:meth:`Transaction.from_tryte_string` on the iterbale elements and
         constructing the bundle from the created transactions.
 
+        If there are at least :py:data:`iota.crypto.batch_curl.MIN_LANES`
+        transactions, their hashes are computed in a single batch (see
+        :py:func:`iota.crypto.batch_curl.curl_hash_many`), which is
+        much faster than hashing each transaction separately.
+
         :param Iterable[TryteString] trytes:
             List of raw transaction trytes.
 
@@ -650,7 +861,16 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
             ])
 
         """
-        return cls(map(Transaction.from_tryte_string, trytes))
+        tryte_strings = [TransactionTrytes(t) for t in trytes]
+
+        if len(tryte_strings) < MIN_LANES:
+            return cls(map(Transaction.from_tryte_string, tryte_strings))
+
+        return cls(map(
+            Transaction.from_tryte_string,
+            tryte_strings,
+            curl_hash_many(tryte_strings, TransactionHash),
+        ))
 
     def __init__(
             self,
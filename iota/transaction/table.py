@@ -0,0 +1,502 @@
+"""
+Columnar storage for large numbers of transactions.
+
+A :py:class:`TransactionTable` keeps the raw trytes of every transaction
+in a single NumPy array, and decodes the most frequently used fields
+into one array per field (a "column").  Filtering, sorting and grouping
+thousands of transactions then becomes a handful of vectorized
+operations, instead of a Python loop over :py:class:`Transaction`
+objects.
+
+Requires `NumPy <https://numpy.org/>`_.
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Union
+
+from iota.crypto.batch_curl import curl_hash_many
+from iota.exceptions import with_context
+from iota.transaction.base import Bundle, LazyTransaction
+from iota.transaction.types import TransactionHash, TransactionTrytes
+from iota.types import TryteString, TrytesCompatible
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = [
+    'TransactionTable',
+]
+
+_TRYTE_ALPHABET = b'9ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+_HASH_LEN = TransactionHash.LEN
+_TRYTES_LEN = TransactionTrytes.LEN
+
+_BYTES_COLUMNS = {
+    # Column name: (start, stop)
+    'address': (2187, 2268),
+    'bundle_hash': (2349, 2430),
+    'legacy_tag': (2295, 2322),
+    'tag': (2592, 2619),
+    'trunk_transaction_hash': (2430, 2511),
+    'branch_transaction_hash': (2511, 2592),
+}
+"""
+Fixed-width fields that are stored as ``bytes`` (ASCII trytes).
+"""
+
+_INT_COLUMNS = {
+    # Column name: (start, stop)
+    'value': (2268, 2295),
+    'timestamp': (2322, 2331),
+    'current_index': (2331, 2340),
+    'last_index': (2340, 2349),
+    'attachment_timestamp': (2619, 2628),
+    'attachment_timestamp_lower_bound': (2628, 2637),
+    'attachment_timestamp_upper_bound': (2637, 2646),
+}
+"""
+Numeric fields that are stored as signed 64-bit integers.
+"""
+
+_MAX_INT_TRYTES = 12
+"""
+Max number of significant trytes that fit in a signed 64-bit integer
+(27 ** 12 < 2 ** 63).
+"""
+
+
+def _build_tryte_values() -> 'np.ndarray':
+    """
+    Returns a 256-entry array that maps each ASCII tryte to its balanced
+    ternary value (-13..13).
+    """
+    table = np.zeros(256, dtype=np.int8)
+
+    for i, char in enumerate(_TRYTE_ALPHABET):
+        table[char] = i if i <= 13 else i - 27
+
+    return table
+
+
+_TRYTE_VALUES = None if np is None else _build_tryte_values()
+
+
+class TransactionTable(object):
+    """
+    Columnar container for a large number of transactions.
+
+    Each decoded field is exposed as a NumPy array with one entry per
+    transaction:
+
+    - Integer columns (``int64``): ``value``, ``timestamp``,
+      ``current_index``, ``last_index``, ``attachment_timestamp``,
+      ``attachment_timestamp_lower_bound`` and
+      ``attachment_timestamp_upper_bound``.
+    - Fixed-width ``bytes`` columns (ASCII trytes): ``hash``,
+      ``address``, ``bundle_hash``, ``legacy_tag``, ``tag``,
+      ``trunk_transaction_hash`` and ``branch_transaction_hash``.
+
+    Individual transactions are only turned into
+    :py:class:`LazyTransaction` objects when they are accessed.
+
+    :param Sequence[TrytesCompatible] trytes:
+        Raw transaction trytes (e.g., the ``trytes`` from a
+        ``getTrytes`` response).
+
+    :param Optional[Sequence[TrytesCompatible]] hashes:
+        The transaction hashes, in the same order as ``trytes``, if
+        available.
+
+        If not provided, they will be computed from the transaction
+        trytes the first time they are needed.
+    """
+
+    @classmethod
+    def from_tryte_strings(
+            cls,
+            trytes: Iterable[TrytesCompatible],
+            hashes: Optional[Iterable[TrytesCompatible]] = None,
+    ) -> 'TransactionTable':
+        """
+        Creates a TransactionTable from a sequence of tryte values.
+
+        :param Iterable[TrytesCompatible] trytes:
+            Raw transaction trytes.
+
+        :param Optional[Iterable[TrytesCompatible]] hashes:
+            The transaction hashes, if available.
+
+        :return:
+            :py:class:`TransactionTable` object.
+
+        Example usage::
+
+            from iota import Iota, TransactionTable
+
+            api = Iota('https://nodes.devnet.iota.org:443')
+
+            response = api.get_trytes(hashes)
+            table = TransactionTable.from_tryte_strings(
+                response['trytes'],
+                hashes,
+            )
+
+            # Incoming transfers only.
+            incoming = table.filter(table.value > 0)
+        """
+        return cls(
+            list(trytes),
+            None if hashes is None else list(hashes),
+        )
+
+    def __init__(
+            self,
+            trytes: Sequence[TrytesCompatible],
+            hashes: Optional[Sequence[TrytesCompatible]] = None,
+    ) -> None:
+        if np is None:
+            raise with_context(
+                exc=ImportError(
+                    'TransactionTable requires NumPy; '
+                    'install it with ``pip install numpy``.',
+                ),
+
+                context={
+                    'trytes': trytes,
+                },
+            )
+
+        if hashes is not None and len(hashes) != len(trytes):
+            raise with_context(
+                exc=ValueError(
+                    'Expected {expected} hashes, got {actual}.'.format(
+                        actual=len(hashes),
+                        expected=len(trytes),
+                    ),
+                ),
+
+                context={
+                    'hashes': hashes,
+                    'trytes': trytes,
+                },
+            )
+
+        self._trytes = self._to_array(trytes, _TRYTES_LEN)
+        self._hash = (
+            None if hashes is None else self._to_array(hashes, _HASH_LEN)
+        )
+
+        self._columns: Dict[str, 'np.ndarray'] = {}
+        self._decode_columns()
+
+    @classmethod
+    def _from_arrays(
+            cls,
+            trytes: 'np.ndarray',
+            hashes: Optional['np.ndarray'],
+            columns: Dict[str, 'np.ndarray'],
+    ) -> 'TransactionTable':
+        """
+        Creates a TransactionTable from already-decoded arrays.
+        """
+        table: TransactionTable = cls.__new__(cls)
+        table._trytes = trytes
+        table._hash = hashes
+        table._columns = columns
+        return table
+
+    @staticmethod
+    def _to_array(
+            values: Sequence[TrytesCompatible],
+            length: int,
+    ) -> 'np.ndarray':
+        """
+        Converts a sequence of tryte values into a 2D array of ASCII
+        trytes, padded with 9s to ``length`` trytes.
+        """
+        raw = [
+            bytes(value) if isinstance(value, (TryteString, bytearray))
+            else value.encode('ascii') if isinstance(value, str)
+            else value
+            for value in values
+        ]
+
+        for i, value in enumerate(raw):
+            if not isinstance(value, bytes) or len(value) > length:
+                raise with_context(
+                    exc=ValueError(
+                        'Value #{i} is not a sequence of at most '
+                        '{length} trytes.'.format(i=i, length=length),
+                    ),
+
+                    context={
+                        'value': values[i],
+                    },
+                )
+
+        joined = b''.join(raw)
+
+        if joined.translate(None, _TRYTE_ALPHABET):
+            row = next(
+                i for i, value in enumerate(raw)
+                if value.translate(None, _TRYTE_ALPHABET)
+            )
+
+            raise with_context(
+                exc=ValueError(
+                    'Value #{i} contains non-tryte characters.'.format(
+                        i=row,
+                    ),
+                ),
+
+                context={
+                    'value': values[row],
+                },
+            )
+
+        if len(joined) == len(raw) * length:
+            # Usual case; no padding needed.
+            matrix = np.frombuffer(joined, dtype=np.uint8)
+            return matrix.reshape(len(raw), length)
+
+        matrix = np.full((len(raw), length), ord('9'), dtype=np.uint8)
+
+        for i, value in enumerate(raw):
+            matrix[i, :len(value)] = np.frombuffer(value, dtype=np.uint8)
+
+        return matrix
+
+    def _decode_columns(self) -> None:
+        """
+        Decodes the integer and fixed-width columns from the raw trytes.
+        """
+        for name, (start, stop) in _INT_COLUMNS.items():
+            digits = _TRYTE_VALUES[self._trytes[:, start:stop]].astype(np.int64)
+
+            if (digits[:, _MAX_INT_TRYTES:] != 0).any():
+                raise with_context(
+                    exc=ValueError(
+                        '``{name}`` does not fit in a 64-bit '
+                        'integer.'.format(name=name),
+                    ),
+
+                    context={
+                        'column': name,
+                    },
+                )
+
+            # Trytes are little-endian: the first tryte is the least
+            # significant one.
+            column = np.zeros(len(self._trytes), dtype=np.int64)
+            for i in reversed(range(min(stop - start, _MAX_INT_TRYTES))):
+                column = column * 27 + digits[:, i]
+
+            self._columns[name] = column
+
+        for name, (start, stop) in _BYTES_COLUMNS.items():
+            self._columns[name] = (
+                np.ascontiguousarray(self._trytes[:, start:stop])
+                .view('S{}'.format(stop - start))
+                .ravel()
+            )
+
+    def __len__(self) -> int:
+        return len(self._trytes)
+
+    def __iter__(self) -> Iterator[LazyTransaction]:
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(
+            self,
+            item: Union[int, slice, Sequence[int], 'np.ndarray'],
+    ) -> Union[LazyTransaction, 'TransactionTable']:
+        """
+        Returns a single transaction (if ``item`` is an integer), or a
+        new table containing the selected rows (if ``item`` is a slice,
+        a sequence of indices or a boolean mask).
+        """
+        if isinstance(item, (int, np.integer)):
+            return LazyTransaction(
+                TransactionTrytes(self._trytes[item].tobytes()),
+                None if self._hash is None
+                else TransactionHash(self._hash[item].tobytes()),
+            )
+
+        if not isinstance(item, slice):
+            item = np.asarray(item)
+
+        return self._from_arrays(
+            trytes=self._trytes[item],
+            hashes=None if self._hash is None else self._hash[item],
+
+            columns={
+                name: column[item]
+                for name, column in self._columns.items()
+            },
+        )
+
+    def __getattr__(self, name: str) -> 'np.ndarray':
+        # Only called if regular attribute lookup fails.
+        try:
+            return self.__dict__['_columns'][name]
+        except KeyError:
+            raise AttributeError(
+                '{cls!r} object has no attribute {name!r}'.format(
+                    cls=type(self).__name__,
+                    name=name,
+                ),
+            ) from None
+
+    @property
+    def hash(self) -> 'np.ndarray':
+        """
+        Transaction hashes, as ``bytes``.
+
+        If they were not provided to the initializer, they are computed
+        (in a single batch) the first time this property is accessed.
+        """
+        if self._hash is None:
+            hashes = curl_hash_many(
+                (TransactionTrytes(row.tobytes()) for row in self._trytes),
+                TransactionHash,
+            )
+
+            self._hash = self._to_array(hashes, _HASH_LEN)
+
+        return (
+            np.ascontiguousarray(self._hash)
+            .view('S{}'.format(_HASH_LEN))
+            .ravel()
+        )
+
+    @property
+    def is_tail(self) -> 'np.ndarray':
+        """
+        Boolean mask of tail transactions.
+        """
+        return self._columns['current_index'] == 0
+
+    @property
+    def trytes(self) -> 'np.ndarray':
+        """
+        Raw transaction trytes, as ``bytes``.
+        """
+        return (
+            np.ascontiguousarray(self._trytes)
+            .view('S{}'.format(_TRYTES_LEN))
+            .ravel()
+        )
+
+    def filter(self, mask: 'np.ndarray') -> 'TransactionTable':
+        """
+        Returns a new table containing only the rows where ``mask`` is
+        ``True``.
+
+        :param np.ndarray mask:
+            Boolean array with one entry per transaction, usually built
+            from the table's columns.
+
+        Example usage::
+
+            # Non-zero transactions to/from an address.
+            table.filter(
+                (table.address == bytes(address.address))
+                & (table.value != 0)
+            )
+        """
+        mask = np.asarray(mask, dtype=bool)
+
+        if mask.shape != (len(self),):
+            raise with_context(
+                exc=ValueError(
+                    'Mask must have shape {expected}, not {actual}.'.format(
+                        actual=mask.shape,
+                        expected=(len(self),),
+                    ),
+                ),
+
+                context={
+                    'mask': mask,
+                },
+            )
+
+        return self[mask]
+
+    def sort(self, *columns: str, reverse: bool = False) -> 'TransactionTable':
+        """
+        Returns a new table, sorted by the specified columns.
+
+        The sort is stable, and the first column is the primary sort
+        key.
+
+        :param str columns:
+            Names of the columns to sort by.
+
+        :param bool reverse:
+            Whether to sort in descending order.
+        """
+        if not columns:
+            raise with_context(
+                exc=ValueError('At least one column is required.'),
+
+                context={
+                    'columns': columns,
+                },
+            )
+
+        # :py:func:`numpy.lexsort` uses the *last* key as the primary
+        # sort key.
+        keys = [getattr(self, name) for name in reversed(columns)]
+
+        if reverse:
+            # Sort ascending with equal rows in reverse order, then flip
+            # the result, so that the sort is still stable.
+            order = np.lexsort([-np.arange(len(self))] + keys)[::-1]
+        else:
+            order = np.lexsort(keys)
+
+        return self[order]
+
+    def group_by_bundle(self) -> Iterator['TransactionTable']:
+        """
+        Groups the transactions by bundle hash.
+
+        Yields one table per bundle, in the order that each bundle hash
+        first appears in the table.  Within each group, transactions
+        are sorted by ``current_index``.
+        """
+        bundle_hashes = self._columns['bundle_hash']
+
+        _, first, inverse = np.unique(
+            bundle_hashes,
+            return_index=True,
+            return_inverse=True,
+        )
+
+        # Re-number groups in order of appearance, then sort by group
+        # and index within group.
+        group_order = np.argsort(np.argsort(first, kind='stable'))
+        groups = group_order[inverse.ravel()]
+
+        order = np.lexsort((self._columns['current_index'], groups))
+        boundaries = np.flatnonzero(np.diff(groups[order])) + 1
+
+        for indices in np.split(order, boundaries):
+            if len(indices):
+                yield self[indices]
+
+    def iter_bundles(self) -> Iterator[Bundle]:
+        """
+        Yields a :py:class:`Bundle` for each bundle hash in the table.
+
+        Bundles are only built as they are consumed, and each one
+        contains :py:class:`LazyTransaction` objects.
+
+        .. note::
+            The bundles are not validated, and will be incomplete if the
+            table does not contain all of their transactions.
+        """
+        for group in self.group_by_bundle():
+            yield Bundle(group)
@@ -4,15 +4,16 @@ from itertools import chain
 from math import ceil
 from random import SystemRandom
 from typing import Any, AnyStr, Generator, Iterable, Iterator, List, \
-    MutableSequence, Optional, Type, TypeVar, Union, Dict
+    MutableSequence, Optional, Tuple, Type, TypeVar, Union, Dict
 from warnings import warn
 
-from iota import AsciiTrytesCodec, TRITS_PER_TRYTE
+from iota import AsciiTrytesCodec, T5B1Codec, TRITS_PER_TRYTE
+from iota.codecs import _ORDINALS_BY_TRITS, _TRITS_BY_ORDINAL
 from iota.crypto import HASH_LENGTH
 from iota.crypto.kerl import Kerl
 from iota.exceptions import with_context
 from iota.json import JsonSerializable
-from iota.trits import int_from_trits, trits_from_int
+from iota.trits import int_from_trits
 
 __all__ = [
     'Address',
@@ -29,6 +30,28 @@ TrytesCompatible = Union[AnyStr, bytearray, 'TryteString']
 T = TypeVar('T', bound='TryteString')
 
 
+def _build_tryte_tables() -> Tuple[bytes, List[Optional[int]]]:
+    """
+    Precomputes lookup tables used to convert ASCII trytes into
+    integers.
+
+    Tables for converting trytes into trits are shared with
+    :py:mod:`iota.codecs`.
+    """
+    alphabet = bytes(AsciiTrytesCodec.alphabet.values())
+
+    integers: List[Optional[int]] = [None] * 256
+
+    for value, ordinal in AsciiTrytesCodec.alphabet.items():
+        # Values greater than 13 overflow, e.g., 14 => -13.
+        integers[ordinal] = (value - 27) if value > 13 else value
+
+    return alphabet, integers
+
+
+_TRYTE_ALPHABET, _INTEGERS_BY_ORDINAL = _build_tryte_tables()
+
+
 class TryteString(JsonSerializable):
     """
     A string representation of a sequence of trytes.
@@ -224,15 +247,24 @@ class TryteString(JsonSerializable):
         chars = bytearray()
 
         for t in trytes:
-            converted = int_from_trits(t)
+            ordinal = _ORDINALS_BY_TRITS.get(tuple(t))
+
+            if ordinal is None:
+                # Not a canonical tryte (e.g., fewer than 3 trits); do it
+                # the hard way.
+                converted = int_from_trits(t)
+
+                # :py:meth:`_tryte_from_int`
+                if converted < 0:
+                    converted += 27
 
-            # :py:meth:`_tryte_from_int`
-            if converted < 0:
-                converted += 27
+                ordinal = AsciiTrytesCodec.alphabet[converted]
 
-            chars.append(AsciiTrytesCodec.alphabet[converted])
+            chars.append(ordinal)
 
-        return cls(chars, *args, **kwargs)
+        # ``chars`` only contains valid trytes, so there's no need to
+        # check them again.
+        return cls(TryteString._from_trusted(chars), *args, **kwargs)
 
     @classmethod
     def from_trits(cls: Type[T],
@@ -274,14 +306,113 @@ class TryteString(JsonSerializable):
             # Pad the trits so that it is cleanly divisible into trytes.
             trits += [0] * (3 - (len(trits) % 3))
 
+        # Group the trits into (t0, t1, t2) tuples.
+        iterator = iter(trits)
+
         return cls.from_trytes(
-            # http://stackoverflow.com/a/1751478/
-            (trits[i:i + 3] for i in range(0, len(trits), 3)),
+            zip(iterator, iterator, iterator),
+
+            *args,
+            **kwargs
+        )
+
+    @classmethod
+    def from_packed(cls: Type[T],
+                    packed: Union[bytes, bytearray],
+                    length: Optional[int] = None,
+                    *args: Any,
+                    **kwargs: Any) -> T:
+        """
+        Creates a TryteString from trits that were packed into bytes by
+        :py:meth:`to_packed`.
+
+        :param Union[bytes,bytearray] packed:
+            Packed trits.
+
+        :param Optional[int] length:
+            Number of trytes that were packed.
+
+            The packed format does not store the number of trytes (the
+            last byte may contain padding that looks like an extra ``9``
+            tryte), so the length is needed to restore the original
+            value exactly.
+
+            Defaults to the ``LEN`` of the class; required for classes
+            that do not define ``LEN``.
+
+        :param args:
+            Additional positional arguments to pass to the initializer.
+
+        :param kwargs:
+            Additional keyword arguments to pass to the initializer.
+
+        :return:
+            :py:class:`TryteString` object.
+
+        :raises TypeError:
+            if ``length`` is not provided, and the class doesn't have a
+            ``LEN`` attribute.
+
+        Example usage::
+
+            from iota import TransactionTrytes, TryteString
+
+            packed = txn_trytes.to_packed()
+
+            # ... store or send ``packed`` ...
+
+            txn_trytes = TransactionTrytes.from_packed(packed)
+
+            # Other tryte sequences need their length to be stored as
+            # well.
+            trytes = TryteString.from_packed(packed, length)
 
+        References:
+
+        - :py:class:`iota.codecs.T5B1Codec`
+        """
+        if length is None:
+            length = getattr(cls, 'LEN', None)
+
+            if length is None:
+                raise TypeError(
+                    '{class_name} does not define a length property; '
+                    '``length`` is required.'.format(
+                        class_name=cls.__name__,
+                    ),
+                )
+
+        trytes = encode(packed, T5B1Codec.name)
+
+        if len(trytes) > length and not trytes[length:].strip(b'9'):
+            trytes = trytes[:length]
+
+        # The codec only outputs valid trytes, so there's no need to
+        # check them again.
+        return cls(
+            TryteString._from_trusted(bytearray(trytes)),
             *args,
             **kwargs
         )
 
+    @classmethod
+    def _from_trusted(cls: Type[T], trytes: bytearray) -> T:
+        """
+        Creates a TryteString from a bytearray that is known to contain
+        only valid trytes (e.g., the result of slicing or hashing another
+        TryteString), without checking it again.
+
+        The bytearray is used as-is (it is not copied).
+
+        .. important::
+            Only use this with types that do not have any attributes
+            other than their trytes (e.g., not :py:class:`Address`),
+            and make sure ``trytes`` already has the correct length.
+        """
+        instance = cls.__new__(cls)
+        instance._trytes = trytes
+        return instance
+
     def __init__(self, trytes: TrytesCompatible, pad: Optional[int] = None) -> None:
         """
         :param TrytesCompatible trytes:
@@ -346,21 +477,28 @@ class TryteString(JsonSerializable):
             if not isinstance(trytes, bytearray):
                 trytes = bytearray(trytes)
 
-            for i, ordinal in enumerate(trytes):
-                if ordinal not in AsciiTrytesCodec.index:
-                    raise with_context(
-                        exc=ValueError(
-                            'Invalid character {char!r} at position {i} '
-                            '(expected A-Z or 9).'.format(
-                                char=chr(ordinal),
-                                i=i,
-                            ),
+            # Check every character in one go, by deleting all of the
+            # valid ones and checking that nothing is left over.
+            if trytes.translate(None, _TRYTE_ALPHABET):
+                i, ordinal = next(
+                    (i, ordinal)
+                    for i, ordinal in enumerate(trytes)
+                    if ordinal not in AsciiTrytesCodec.index
+                )
+
+                raise with_context(
+                    exc=ValueError(
+                        'Invalid character {char!r} at position {i} '
+                        '(expected A-Z or 9).'.format(
+                            char=chr(ordinal),
+                            i=i,
                         ),
+                    ),
 
-                        context={
-                            'trytes': trytes,
-                        },
-                    )
+                    context={
+                        'trytes': trytes,
+                    },
+                )
 
         if pad:
             trytes += b'9' * max(0, pad - len(trytes))
@@ -436,16 +574,13 @@ class TryteString(JsonSerializable):
             )
 
     def __getitem__(self, item: Union[int, slice]) -> T:
-        new_trytes = bytearray()
-
         sliced = self._trytes[item]
 
         if isinstance(sliced, int):
-            new_trytes.append(sliced)
-        else:
-            new_trytes.extend(sliced)
+            sliced = bytearray((sliced,))
 
-        return TryteString(new_trytes)
+        # Slicing a bytearray always creates a copy.
+        return TryteString._from_trusted(sliced)
 
     def __setitem__(self,
                     item: Union[int, slice],
@@ -472,7 +607,7 @@ class TryteString(JsonSerializable):
 
     def __add__(self, other: TrytesCompatible) -> T:
         if isinstance(other, TryteString):
-            return TryteString(self._trytes + other._trytes)
+            return TryteString._from_trusted(self._trytes + other._trytes)
         elif isinstance(other, str):
             return TryteString(self._trytes + other.encode('ascii'))
         elif isinstance(other, (bytes, bytearray)):
@@ -721,10 +856,7 @@ class TryteString(JsonSerializable):
             tryte_ints = trytes.as_integers()
 
         """
-        return [
-            self._normalize(AsciiTrytesCodec.index[c])
-            for c in self._trytes
-        ]
+        return list(map(_INTEGERS_BY_ORDINAL.__getitem__, self._trytes))
 
     def as_trytes(self) -> List[List[int]]:
         """
@@ -750,10 +882,7 @@ class TryteString(JsonSerializable):
             tryte_list = trytes.as_trytes()
 
         """
-        return [
-            trits_from_int(n, pad=3)
-            for n in self.as_integers()
-        ]
+        return [list(_TRITS_BY_ORDINAL[c]) for c in self._trytes]
 
     def as_trits(self) -> List[int]:
         """
@@ -782,7 +911,39 @@ class TryteString(JsonSerializable):
 
         """
         # http://stackoverflow.com/a/952952/5568265#comment4204394_952952
-        return list(chain.from_iterable(self.as_trytes()))
+        return list(chain.from_iterable(
+            map(_TRITS_BY_ORDINAL.__getitem__, self._trytes),
+        ))
+
+    def to_packed(self) -> bytes:
+        """
+        Packs the trytes into a compact binary format, with 5 trits per
+        byte.
+
+        This takes 3 bytes for every 5 trytes, which is 40% less than
+        storing the trytes as ASCII.  Use :py:meth:`from_packed` to
+        convert the result back into a TryteString.
+
+        The result does not include the number of trytes; unless the
+        type has a fixed length (e.g., :py:class:`TransactionTrytes`),
+        you need to store the length along with the packed value.
+
+        :return:
+            ``bytes``
+
+        Example usage::
+
+            from iota import TryteString
+
+            trytes = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+
+            packed = trytes.to_packed()
+
+        References:
+
+        - :py:class:`iota.codecs.T5B1Codec`
+        """
+        return self.encode(codec=T5B1Codec.name)
 
     def _repr_pretty_(self, p, cycle):
         """
@@ -1,8 +1,13 @@
+import asyncio
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from iota.adapter import HttpAdapter, MockAdapter
-from iota.adapter.wrappers import RoutingWrapper
-from test import async_test
+from iota import Iota, TransactionHash
+from iota.adapter import BadApiResponse, HttpAdapter, MockAdapter
+from iota.adapter.wrappers import BatchingWrapper, CachingWrapper, \
+  PoolWrapper, RoutingWrapper
+from test import async_test, mock
 
 
 class RoutingWrapperTestCase(TestCase):
@@ -88,3 +93,530 @@ class RoutingWrapperTestCase(TestCase):
       wrapper2.get_adapter('echo'),
       wrapper1.get_adapter('alpha'),
     )
+
+
+class CachingWrapperTestCase(TestCase):
+  def setUp(self):
+    super(CachingWrapperTestCase, self).setUp()
+
+    self.adapter = MockAdapter()
+
+    self.hash1 = 'A' * 81
+    self.hash2 = 'B' * 81
+    self.trytes1 = 'C' * 2673
+    self.trytes2 = 'D' * 2673
+
+  @async_test
+  async def test_get_trytes(self):
+    """
+    Only transactions that aren't cached are requested from the node.
+    """
+    wrapper = CachingWrapper(self.adapter)
+
+    self.adapter.seed_response('getTrytes', {
+      'trytes': [self.trytes1],
+      'duration': 3,
+    })
+    self.adapter.seed_response('getTrytes', {
+      'trytes': [self.trytes2],
+    })
+
+    self.assertDictEqual(
+      await wrapper.send_request({
+        'command': 'getTrytes',
+        'hashes': [self.hash1],
+      }),
+
+      {'trytes': [self.trytes1], 'duration': 3},
+    )
+
+    self.assertListEqual(
+      (await wrapper.send_request({
+        'command': 'getTrytes',
+        'hashes': [self.hash2, self.hash1],
+      }))['trytes'],
+
+      [self.trytes2, self.trytes1],
+    )
+
+    self.assertListEqual(
+      self.adapter.requests,
+
+      [
+        {'command': 'getTrytes', 'hashes': [self.hash1]},
+        {'command': 'getTrytes', 'hashes': [self.hash2]},
+      ],
+    )
+
+    self.assertEqual(wrapper.hits, 1)
+    self.assertEqual(wrapper.misses, 2)
+
+  @async_test
+  async def test_get_trytes_unknown_transaction(self):
+    """
+    Transactions that the node doesn't know about are not cached.
+    """
+    wrapper = CachingWrapper(self.adapter)
+
+    self.adapter.seed_response('getTrytes', {'trytes': ['9' * 2673]})
+    self.adapter.seed_response('getTrytes', {'trytes': [self.trytes1]})
+
+    for _ in range(2):
+      await wrapper.send_request({
+        'command': 'getTrytes',
+        'hashes': [self.hash1],
+      })
+
+    self.assertEqual(len(self.adapter.requests), 2)
+
+  @async_test
+  async def test_get_trytes_lru(self):
+    """
+    The least recently used transactions are evicted from memory.
+    """
+    wrapper = CachingWrapper(self.adapter, max_size=1)
+
+    self.adapter.seed_response('getTrytes', {
+      'trytes': [self.trytes1, self.trytes2],
+    })
+    self.adapter.seed_response('getTrytes', {'trytes': [self.trytes1]})
+
+    for hashes in ([self.hash1, self.hash2], [self.hash2], [self.hash1]):
+      await wrapper.send_request({'command': 'getTrytes', 'hashes': hashes})
+
+    self.assertListEqual(
+      [request['hashes'] for request in self.adapter.requests],
+      [[self.hash1, self.hash2], [self.hash1]],
+    )
+
+  @async_test
+  async def test_get_trytes_persistent(self):
+    """
+    Transactions are persisted to disk.
+    """
+    with TemporaryDirectory() as tmp:
+      path = join(tmp, 'transactions.db')
+
+      self.adapter.seed_response('getTrytes', {'trytes': [self.trytes1]})
+
+      wrapper = CachingWrapper(self.adapter, path=path)
+      await wrapper.send_request({
+        'command': 'getTrytes',
+        'hashes': [self.hash1],
+      })
+      wrapper.close()
+
+      wrapper = CachingWrapper(self.adapter, path=path)
+      self.assertListEqual(
+        (await wrapper.send_request({
+          'command': 'getTrytes',
+          'hashes': [self.hash1],
+        }))['trytes'],
+
+        [self.trytes1],
+      )
+
+      wrapper.invalidate_trytes([self.hash1])
+      self.adapter.seed_response('getTrytes', {'trytes': [self.trytes1]})
+      await wrapper.send_request({
+        'command': 'getTrytes',
+        'hashes': [self.hash1],
+      })
+      wrapper.close()
+
+    self.assertEqual(len(self.adapter.requests), 2)
+
+  def test_get_trytes_persistent_sync_api(self):
+    """
+    Using an on-disk cache with the synchronous API, which sends
+    requests from a different thread.
+    """
+    with TemporaryDirectory() as tmp:
+      self.adapter.seed_response('getTrytes', {'trytes': [self.trytes1]})
+
+      wrapper = CachingWrapper(
+        self.adapter,
+        path=join(tmp, 'transactions.db'),
+      )
+      api = Iota(wrapper)
+
+      for _ in range(2):
+        response = api.get_trytes([TransactionHash(self.hash1)])
+        self.assertEqual(str(response['trytes'][0]), self.trytes1)
+
+      wrapper.close()
+
+    self.assertEqual(len(self.adapter.requests), 1)
+    self.assertEqual(wrapper.hits, 1)
+
+  @async_test
+  async def test_ttl(self):
+    """
+    Responses to some commands are cached for a short time.
+    """
+    wrapper = CachingWrapper(self.adapter, ttls={'getNodeInfo': 10})
+
+    self.adapter.seed_response('getNodeInfo', {'id': 'info1'})
+    self.adapter.seed_response('getNodeInfo', {'id': 'info2'})
+
+    with mock.patch('iota.adapter.wrappers.monotonic', return_value=0):
+      await wrapper.send_request({'command': 'getNodeInfo'})
+
+    with mock.patch('iota.adapter.wrappers.monotonic', return_value=5):
+      self.assertDictEqual(
+        await wrapper.send_request({'command': 'getNodeInfo'}),
+        {'id': 'info1'},
+      )
+
+    with mock.patch('iota.adapter.wrappers.monotonic', return_value=11):
+      self.assertDictEqual(
+        await wrapper.send_request({'command': 'getNodeInfo'}),
+        {'id': 'info2'},
+      )
+
+  @async_test
+  async def test_ttl_expired_responses_discarded(self):
+    """
+    Expired responses are discarded when a new response is cached.
+    """
+    wrapper = CachingWrapper(self.adapter, ttls={'getBalances': 10})
+
+    for i in range(2):
+      self.adapter.seed_response('getBalances', {'balances': [i]})
+
+    with mock.patch('iota.adapter.wrappers.monotonic', return_value=0):
+      await wrapper.send_request({
+        'command': 'getBalances',
+        'addresses': [self.hash1],
+      })
+
+    with mock.patch('iota.adapter.wrappers.monotonic', return_value=11):
+      await wrapper.send_request({
+        'command': 'getBalances',
+        'addresses': [self.hash2],
+      })
+
+    self.assertEqual(len(wrapper._responses), 1)
+
+  @async_test
+  async def test_invalidate(self):
+    """
+    Discarding cached responses, explicitly or after a transaction is
+    broadcast.
+    """
+    wrapper = CachingWrapper(self.adapter)
+
+    for i in range(3):
+      self.adapter.seed_response('getBalances', {'balances': [i]})
+    self.adapter.seed_response('broadcastTransactions', {})
+
+    request = {'command': 'getBalances', 'addresses': [self.hash1]}
+
+    self.assertEqual((await wrapper.send_request(request))['balances'], [0])
+    self.assertEqual((await wrapper.send_request(request))['balances'], [0])
+
+    wrapper.invalidate('getBalances')
+    self.assertEqual((await wrapper.send_request(request))['balances'], [1])
+
+    await wrapper.send_request({
+      'command': 'broadcastTransactions',
+      'trytes': [self.trytes1],
+    })
+    self.assertEqual((await wrapper.send_request(request))['balances'], [2])
+
+
+class SlowAdapter(MockAdapter):
+  """
+  Mock adapter that takes a while to respond.
+  """
+  def __init__(self, delay):
+    super(SlowAdapter, self).__init__()
+
+    self.delay = delay
+
+  async def send_request(self, payload, **kwargs):
+    await asyncio.sleep(self.delay)
+    return await super(SlowAdapter, self).send_request(payload, **kwargs)
+
+
+class PoolWrapperTestCase(TestCase):
+  def setUp(self):
+    super(PoolWrapperTestCase, self).setUp()
+
+    self.adapter1 = MockAdapter()
+    self.adapter2 = MockAdapter()
+
+  @async_test
+  async def test_fastest_node(self):
+    """
+    Requests are sent to the node with the lowest latency.
+    """
+    wrapper = PoolWrapper([self.adapter1, self.adapter2])
+    wrapper.nodes[0].latency = 0.5
+    wrapper.nodes[1].latency = 0.1
+
+    self.adapter2.seed_response('getNodeInfo', {'id': 'node2'})
+
+    self.assertDictEqual(
+      await wrapper.send_request({'command': 'getNodeInfo'}),
+      {'id': 'node2'},
+    )
+
+    self.assertListEqual(self.adapter1.requests, [])
+
+  @async_test
+  async def test_failover(self):
+    """
+    Read-only requests are retried on the next node if a node fails;
+    failing nodes are ejected.
+    """
+    wrapper = PoolWrapper([self.adapter1, self.adapter2], max_failures=2)
+
+    for _ in range(3):
+      self.adapter2.seed_response('getNodeInfo', {'id': 'node2'})
+
+    with mock.patch.object(
+        self.adapter1,
+        'send_request',
+        mock.AsyncMock(side_effect=ConnectionError()),
+    ) as mocked_send:
+      for _ in range(3):
+        self.assertDictEqual(
+          await wrapper.send_request({'command': 'getNodeInfo'}),
+          {'id': 'node2'},
+        )
+
+    # The first node was ejected after two failures.
+    self.assertEqual(mocked_send.call_count, 2)
+    self.assertIsNotNone(wrapper.nodes[0].ejected_until)
+
+  @async_test
+  async def test_no_failover(self):
+    """
+    Requests that change state are not retried on other nodes, and
+    error responses are returned as-is.
+    """
+    wrapper = PoolWrapper([self.adapter1, self.adapter2])
+
+    with mock.patch.object(
+        self.adapter1,
+        'send_request',
+        mock.AsyncMock(side_effect=ConnectionError()),
+    ):
+      with self.assertRaises(ConnectionError):
+        await wrapper.send_request({'command': 'broadcastTransactions'})
+
+    self.adapter1.seed_response('getNodeInfo', {'error': 'Nope.'})
+
+    with self.assertRaises(BadApiResponse):
+      await wrapper.send_request({'command': 'getNodeInfo'})
+
+    self.assertListEqual(self.adapter2.requests, [])
+
+  @async_test
+  async def test_probe_ejected_node(self):
+    """
+    Ejected nodes get another chance after a while.
+    """
+    wrapper = PoolWrapper([self.adapter1, self.adapter2])
+    wrapper.nodes[0].failures = 3
+    wrapper.nodes[0].ejected_until = 0
+
+    self.adapter1.seed_response('getNodeInfo', {'id': 'node1'})
+
+    self.assertDictEqual(
+      await wrapper.send_request({'command': 'getNodeInfo'}),
+      {'id': 'node1'},
+    )
+
+    self.assertEqual(wrapper.nodes[0].failures, 0)
+    self.assertIsNone(wrapper.nodes[0].ejected_until)
+
+  @async_test
+  async def test_hedged_request(self):
+    """
+    A duplicate request is sent to another node if the first one takes
+    longer than usual.
+    """
+    slow_adapter = SlowAdapter(delay=5)
+    wrapper = PoolWrapper([slow_adapter, self.adapter2])
+
+    # The slow node usually responds very quickly.
+    wrapper.nodes[0].samples.extend([0.01] * 10)
+    wrapper.nodes[0].latency = 0.01
+    wrapper.nodes[0].failures = 2
+    wrapper.nodes[1].latency = 0.1
+
+    slow_adapter.seed_response('getNodeInfo', {'id': 'node1'})
+    self.adapter2.seed_response('getNodeInfo', {'id': 'node2'})
+
+    self.assertDictEqual(
+      await asyncio.wait_for(
+        wrapper.send_request({'command': 'getNodeInfo'}),
+        timeout=2,
+      ),
+
+      {'id': 'node2'},
+    )
+
+    # The cancelled request does not affect the slow node's stats.
+    self.assertEqual(wrapper.nodes[0].latency, 0.01)
+    self.assertEqual(len(wrapper.nodes[0].samples), 10)
+    self.assertEqual(wrapper.nodes[0].failures, 2)
+
+  def test_no_adapters(self):
+    """
+    The pool needs at least one node.
+    """
+    with self.assertRaises(ValueError):
+      PoolWrapper([])
+
+
+class BatchingWrapperTestCase(TestCase):
+  def setUp(self):
+    super(BatchingWrapperTestCase, self).setUp()
+
+    self.adapter = MockAdapter()
+
+  @async_test
+  async def test_batching(self):
+    """
+    Concurrent requests for the same command are combined.
+    """
+    wrapper = BatchingWrapper(self.adapter)
+
+    self.adapter.seed_response('getTrytes', {
+      'trytes': ['AAA', 'BBB', 'CCC'],
+      'duration': 4,
+    })
+
+    responses = await asyncio.gather(
+      wrapper.send_request({'command': 'getTrytes', 'hashes': ['A', 'B']}),
+      wrapper.send_request({'command': 'getTrytes', 'hashes': ['C', 'A']}),
+      wrapper.send_request({'command': 'getTrytes', 'hashes': ['B']}),
+    )
+
+    self.assertListEqual(
+      responses,
+
+      [
+        {'trytes': ['AAA', 'BBB'], 'duration': 4},
+        {'trytes': ['CCC', 'AAA'], 'duration': 4},
+        {'trytes': ['BBB'], 'duration': 4},
+      ],
+    )
+
+    self.assertListEqual(
+      self.adapter.requests,
+      [{'command': 'getTrytes', 'hashes': ['A', 'B', 'C']}],
+    )
+
+  @async_test
+  async def test_batching_different_parameters(self):
+    """
+    Requests with different parameters are not combined.
+    """
+    wrapper = BatchingWrapper(self.adapter)
+
+    self.adapter.seed_response('getBalances', {'balances': [1]})
+    self.adapter.seed_response('getBalances', {'balances': [2]})
+
+    responses = await asyncio.gather(
+      wrapper.send_request({
+        'command': 'getBalances',
+        'addresses': ['A'],
+      }),
+
+      wrapper.send_request({
+        'command': 'getBalances',
+        'addresses': ['B'],
+        'tips': ['T'],
+      }),
+    )
+
+    self.assertListEqual(
+      [response['balances'] for response in responses],
+      [[1], [2]],
+    )
+
+  @async_test
+  async def test_max_items(self):
+    """
+    The buffer is sent as soon as it is full.
+    """
+    wrapper = BatchingWrapper(self.adapter, max_items=2)
+
+    self.adapter.seed_response('wereAddressesSpentFrom', {
+      'states': [True, False],
+    })
+    self.adapter.seed_response('wereAddressesSpentFrom', {
+      'states': [True],
+    })
+
+    responses = await asyncio.gather(*(
+      wrapper.send_request({
+        'command': 'wereAddressesSpentFrom',
+        'addresses': [address],
+      })
+      for address in 'ABC'
+    ))
+
+    self.assertListEqual(
+      [response['states'] for response in responses],
+      [[True], [False], [True]],
+    )
+
+    self.assertEqual(len(self.adapter.requests), 2)
+
+  @async_test
+  async def test_shared_request(self):
+    """
+    Identical requests in flight at the same time share a response.
+    """
+    wrapper = BatchingWrapper(self.adapter)
+
+    self.adapter.seed_response('getNodeInfo', {'id': 'node'})
+
+    responses = await asyncio.gather(
+      wrapper.send_request({'command': 'getNodeInfo'}),
+      wrapper.send_request({'command': 'getNodeInfo'}),
+    )
+
+    self.assertListEqual(responses, [{'id': 'node'}, {'id': 'node'}])
+    self.assertIsNot(responses[0], responses[1])
+    self.assertEqual(len(self.adapter.requests), 1)
+
+  @async_test
+  async def test_error(self):
+    """
+    Errors are passed to every request in the batch.
+    """
+    wrapper = BatchingWrapper(self.adapter)
+
+    self.adapter.seed_response('getTrytes', {'error': 'Nope.'})
+
+    responses = await asyncio.gather(
+      wrapper.send_request({'command': 'getTrytes', 'hashes': ['A']}),
+      wrapper.send_request({'command': 'getTrytes', 'hashes': ['B']}),
+      return_exceptions=True,
+    )
+
+    for response in responses:
+      self.assertIsInstance(response, BadApiResponse)
+
+  @async_test
+  async def test_passthrough(self):
+    """
+    Other commands are sent as-is.
+    """
+    wrapper = BatchingWrapper(self.adapter)
+
+    self.adapter.seed_response('broadcastTransactions', {})
+    self.adapter.seed_response('broadcastTransactions', {})
+
+    await asyncio.gather(
+      wrapper.send_request({'command': 'broadcastTransactions'}),
+      wrapper.send_request({'command': 'broadcastTransactions'}),
+    )
+
+    self.assertEqual(len(self.adapter.requests), 2)
@@ -1,10 +1,11 @@
+import gzip
 import json
 import socket
 from typing import Text
 from unittest import TestCase
 
 import httpx
-from iota import BadApiResponse, InvalidUri, TryteString
+from iota import BadApiResponse, InvalidUri, Iota, TryteString
 from iota.adapter import API_VERSION, HttpAdapter, MockAdapter, \
   resolve_adapter, async_return
 from test import mock, async_test
@@ -150,10 +151,13 @@ class HttpAdapterTestCase(TestCase):
         'X-IOTA-API-Version': API_VERSION,
       },
 
-      payload = json.dumps(payload),
+      payload = mock.ANY,
       url     = adapter.node_url,
     )
 
+    _, kwargs = mocked_sender.call_args
+    self.assertEqual(json.loads(kwargs['payload']), payload)
+
   @async_test
   async def test_error_response(self):
     """
@@ -314,7 +318,7 @@ class HttpAdapterTestCase(TestCase):
     # mock for returning dummy response
     mocked_request = mock.Mock(
       return_value=async_return(
-        mock.Mock(text='{ "dummy": "payload"}', status_code=200)
+        mock.Mock(content=b'{ "dummy": "payload"}', status_code=200)
       )
     )
 
@@ -331,7 +335,7 @@ class HttpAdapterTestCase(TestCase):
     # mock for returning dummy response
     mocked_request = mock.Mock(
       return_value=async_return(
-        mock.Mock(text='{ "dummy": "payload"}', status_code=200)
+        mock.Mock(content=b'{ "dummy": "payload"}', status_code=200)
       )
     )
 
@@ -351,7 +355,7 @@ class HttpAdapterTestCase(TestCase):
     # mock for returning dummy response
     mocked_request = mock.Mock(
       return_value=async_return(
-        mock.Mock(text='{ "dummy": "payload"}', status_code=200)
+        mock.Mock(content=b'{ "dummy": "payload"}', status_code=200)
       )
     )
 
@@ -371,7 +375,7 @@ class HttpAdapterTestCase(TestCase):
     # mock for returning dummy response
     mocked_request = mock.Mock(
       return_value=async_return(
-        mock.Mock(text='{ "dummy": "payload"}', status_code=200)
+        mock.Mock(content=b'{ "dummy": "payload"}', status_code=200)
       )
     )
 
@@ -412,7 +416,19 @@ class HttpAdapterTestCase(TestCase):
     mocked_sender.assert_called_once_with(
       url = adapter.node_url,
 
-      payload = json.dumps({
+      payload = mock.ANY,
+
+      headers = {
+        'Content-type':       'application/json',
+        'X-IOTA-API-Version': API_VERSION,
+      },
+    )
+
+    _, kwargs = mocked_sender.call_args
+    self.assertEqual(
+      json.loads(kwargs['payload']),
+
+      {
         'command': 'helloWorld',
 
         # Tryte sequences are converted to strings for transport.
@@ -420,10 +436,190 @@ class HttpAdapterTestCase(TestCase):
           'RBTC9D9DCDQAEASBYBCCKBFA',
           'CCPCBDVC9DTCEAKDXC9D9DEARCWCPCBDVCTCEAHDWCTCEAKDCDFD9DSCSA',
         ],
-      }),
-
-      headers = {
-        'Content-type':       'application/json',
-        'X-IOTA-API-Version': API_VERSION,
       },
     )
+
+  @async_test
+  async def test_compression(self):
+    """
+    Large request bodies are compressed, if enabled.
+    """
+    adapter = HttpAdapter('http://localhost:14265', compression=True)
+
+    mocked_sender = mock.Mock(
+      return_value=async_return(create_http_response('{}')),
+    )
+
+    payload = {'command': 'getTrytes', 'hashes': ['A' * 81] * 20}
+
+    with mock.patch.object(adapter, '_send_http_request', mocked_sender):
+      await adapter.send_request(payload)
+      await adapter.send_request({'command': 'getNodeInfo'})
+
+    large_request, small_request = mocked_sender.call_args_list
+
+    self.assertEqual(
+      json.loads(gzip.decompress(large_request[1]['payload'])),
+      payload,
+    )
+    self.assertEqual(
+      large_request[1]['headers']['Content-Encoding'],
+      'gzip',
+    )
+
+    self.assertEqual(
+      json.loads(small_request[1]['payload']),
+      {'command': 'getNodeInfo'},
+    )
+    self.assertNotIn('Content-Encoding', small_request[1]['headers'])
+
+  def test_connection_options(self):
+    """
+    Configuring the connection pool.
+    """
+    with mock.patch('iota.adapter.AsyncClient') as mocked_client:
+      HttpAdapter('http://localhost:14265', max_connections=5, http2=True)
+
+    _, kwargs = mocked_client.call_args
+
+    self.assertTrue(kwargs['http2'])
+    self.assertEqual(kwargs['limits'].max_connections, 5)
+    self.assertEqual(kwargs['limits'].max_keepalive_connections, 20)
+
+  @async_test
+  async def test_shared_client(self):
+    """
+    Adapters for the same node can share a connection pool.
+    """
+    adapter1 = HttpAdapter('http://localhost:14265', shared=True)
+    adapter2 = HttpAdapter('http://localhost:14265/', shared=True)
+    adapter3 = HttpAdapter(
+      'http://localhost:14265',
+      shared=True,
+      max_connections=1,
+    )
+    adapter4 = HttpAdapter('http://127.0.0.1:14265', shared=True)
+
+    self.assertIs(adapter1.client, adapter2.client)
+    self.assertIsNot(adapter1.client, adapter3.client)
+    self.assertIsNot(adapter1.client, adapter4.client)
+
+    # Closing an adapter does not close the shared pool.
+    await adapter1.aclose()
+    self.assertFalse(adapter2.client.is_closed)
+
+    await HttpAdapter.aclose_shared_clients()
+    self.assertTrue(adapter2.client.is_closed)
+
+  @async_test
+  async def test_aclose(self):
+    """
+    Closing the adapter closes its connection pool, unless it was passed
+    in.
+    """
+    async with HttpAdapter('http://localhost:14265') as adapter:
+      pass
+
+    self.assertTrue(adapter.client.is_closed)
+
+    client = httpx.AsyncClient()
+    await HttpAdapter('http://localhost:14265', client=client).aclose()
+    self.assertFalse(client.is_closed)
+    await client.aclose()
+
+  @async_test
+  async def test_stream_request(self):
+    """
+    Streaming the members of an array in the response.
+    """
+    body = json.dumps({
+      'hashes': ['A' * 81, 'B' * 81, 'C' * 81],
+      'duration': 42,
+    }).encode('utf-8')
+
+    async def chunks():
+      for i in range(0, len(body), 50):
+        yield body[i:i + 50]
+
+    requests = []
+
+    def handler(request):
+      requests.append(request)
+      return httpx.Response(200, content=chunks())
+
+    adapter = HttpAdapter(
+      'http://localhost:14265',
+      client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    batches = [
+      values
+      async for values in adapter.stream_request(
+        {'command': 'findTransactions', 'bundles': ['D' * 81]},
+        'hashes',
+      )
+    ]
+
+    self.assertListEqual(
+      [value for values in batches for value in values],
+      ['A' * 81, 'B' * 81, 'C' * 81],
+    )
+
+    # The members were yielded as they arrived.
+    self.assertGreater(len(batches), 1)
+
+    self.assertEqual(
+      json.loads(requests[0].content),
+      {'command': 'findTransactions', 'bundles': ['D' * 81]},
+    )
+
+  @async_test
+  async def test_stream_request_error_response(self):
+    """
+    Streaming a request that the node rejects.
+    """
+    adapter = HttpAdapter(
+      'http://localhost:14265',
+
+      client=httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(400, json={'error': 'Invalid hashes'}),
+      )),
+    )
+
+    with self.assertRaises(BadApiResponse) as context:
+      async for _ in adapter.stream_request({'command': 'getTrytes'}, 'trytes'):
+        pass
+
+    self.assertEqual(
+      str(context.exception),
+      '400 response from node: Invalid hashes',
+    )
+
+  @async_test
+  async def test_stream_request_incomplete_response(self):
+    """
+    The response is cut off before the end of the JSON document.
+    """
+    adapter = HttpAdapter(
+      'http://localhost:14265',
+
+      client=httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=b'{"trytes": ["AB'),
+      )),
+    )
+
+    with self.assertRaises(BadApiResponse):
+      async for _ in adapter.stream_request({'command': 'getTrytes'}, 'trytes'):
+        pass
+
+  def test_api_close(self):
+    """
+    Closing the API instance closes the adapter.
+    """
+    adapter = HttpAdapter('http://localhost:14265')
+
+    with Iota(adapter):
+      pass
+
+    self.assertTrue(adapter.client.is_closed)
+
@@ -1,8 +1,10 @@
-from codecs import decode, encode
+from codecs import decode, encode, getincrementaldecoder, \
+  getincrementalencoder, getreader, getwriter
+from io import BytesIO
 from unittest import TestCase
 from warnings import catch_warnings, simplefilter as simple_filter
 
-from iota.codecs import AsciiTrytesCodec, TrytesDecodeError
+from iota.codecs import AsciiTrytesCodec, T5B1Codec, TrytesDecodeError
 
 
 class AsciiTrytesCodecTestCase(TestCase):
@@ -112,6 +114,27 @@ class AsciiTrytesCodecTestCase(TestCase):
       b'??\xd2\x80??\xc3??',
     )
 
+  def test_round_trip_all_bytes(self):
+    """
+    Encoding and decoding every possible byte value.
+    """
+    bytes_ = bytes(range(256))
+
+    trytes = encode(bytes_, AsciiTrytesCodec.name)
+
+    self.assertEqual(len(trytes), 512)
+    self.assertEqual(trytes[:6], b'99A9B9')
+    self.assertEqual(decode(trytes, AsciiTrytesCodec.name), bytes_)
+
+  def test_decode_memoryview(self):
+    """
+    Decoding trytes from a memoryview.
+    """
+    self.assertEqual(
+      decode(memoryview(b'RBTC9D9DCDQAEASBYBCCKBFA'), AsciiTrytesCodec.name),
+      b'Hello, IOTA!',
+    )
+
   def test_compat_name(self):
     """
     A warning is raised when using the codec's old name.
@@ -128,3 +151,171 @@ class AsciiTrytesCodecTestCase(TestCase):
     self.assertEqual(len(warnings), 1)
     self.assertEqual(warnings[0].category, DeprecationWarning)
     self.assertIn('codec will be removed', str(warnings[0].message))
+
+
+class AsciiTrytesIncrementalCodecTestCase(TestCase):
+  def setUp(self):
+    super(AsciiTrytesIncrementalCodecTestCase, self).setUp()
+
+    self.bytes_ = bytes(range(256)) * 4
+    self.trytes = encode(self.bytes_, AsciiTrytesCodec.name)
+
+  def test_incremental_encoder(self):
+    """
+    Encoding bytes in chunks.
+    """
+    encoder = getincrementalencoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(
+      b''.join(
+        encoder.encode(self.bytes_[i:i + 7])
+        for i in range(0, len(self.bytes_), 7)
+      ) + encoder.encode(b'', final=True),
+
+      self.trytes,
+    )
+
+  def test_incremental_decoder(self):
+    """
+    Decoding trytes in chunks that split pairs of trytes.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(
+      b''.join(
+        decoder.decode(self.trytes[i:i + 7])
+        for i in range(0, len(self.trytes), 7)
+      ) + decoder.decode(b'', final=True),
+
+      self.bytes_,
+    )
+
+  def test_incremental_decoder_odd_length_errors_strict(self):
+    """
+    The final chunk ends in the middle of a pair of trytes.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(decoder.decode(b'RBT'), b'H')
+
+    with self.assertRaises(TrytesDecodeError):
+      decoder.decode(b'', final=True)
+
+  def test_incremental_decoder_odd_length_errors_replace(self):
+    """
+    The final chunk ends in the middle of a pair of trytes, with
+    errors='replace'.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)('replace')
+
+    self.assertEqual(decoder.decode(b'RBT'), b'H')
+    self.assertEqual(decoder.decode(b'', final=True), b'?')
+
+  def test_stream_writer(self):
+    """
+    Writing bytes to a stream as trytes.
+    """
+    stream = BytesIO()
+    writer = getwriter(AsciiTrytesCodec.name)(stream)
+
+    writer.write(self.bytes_[:100])
+    writer.write(self.bytes_[100:])
+
+    self.assertEqual(stream.getvalue(), self.trytes)
+
+  def test_stream_reader(self):
+    """
+    Reading trytes from a stream as bytes, in chunks that split pairs
+    of trytes.
+    """
+    reader = getreader(AsciiTrytesCodec.name)(BytesIO(self.trytes))
+
+    self.assertEqual(
+      b''.join(iter(lambda: reader.read(33), b'')),
+      self.bytes_,
+    )
+
+  def test_stream_reader_odd_length_errors_strict(self):
+    """
+    The stream ends with an incomplete pair of trytes.
+    """
+    reader = getreader(AsciiTrytesCodec.name)(BytesIO(self.trytes + b'A'))
+
+    with self.assertRaises(TrytesDecodeError):
+      b''.join(iter(lambda: reader.read(33), b''))
+
+    reader = getreader(AsciiTrytesCodec.name)(BytesIO(self.trytes + b'A'))
+
+    with self.assertRaises(TrytesDecodeError):
+      reader.read()
+
+  def test_stream_reader_odd_length_errors_replace(self):
+    """
+    The stream ends with an incomplete pair of trytes, and the reader
+    replaces it.
+    """
+    reader = getreader(AsciiTrytesCodec.name)(
+      BytesIO(self.trytes + b'A'),
+      'replace',
+    )
+
+    self.assertEqual(
+      b''.join(iter(lambda: reader.read(33), b'')),
+      self.bytes_ + b'?',
+    )
+
+
+class T5B1CodecTestCase(TestCase):
+  def test_round_trip(self):
+    """
+    Packing trytes into bytes and unpacking them again.
+    """
+    trytes = b'9ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    packed = decode(trytes, T5B1Codec.name)
+
+    # 27 trytes = 81 trits = 17 bytes (last byte padded).
+    self.assertEqual(len(packed), 17)
+
+    # The padding trits make up an extra ``9`` tryte.
+    self.assertEqual(encode(packed, T5B1Codec.name), trytes + b'9')
+
+  def test_round_trip_all_bytes(self):
+    """
+    Every valid byte value survives a round trip.
+    """
+    packed = bytes(list(range(122)) + list(range(135, 256)))
+
+    self.assertEqual(
+      decode(encode(packed, T5B1Codec.name), T5B1Codec.name),
+      packed,
+    )
+
+  def test_empty(self):
+    """
+    Packing and unpacking an empty sequence.
+    """
+    self.assertEqual(encode(b'', T5B1Codec.name), b'')
+    self.assertEqual(decode(b'', T5B1Codec.name), b'')
+
+  def test_decode_error_invalid_tryte(self):
+    """
+    Attempting to pack a value that is not a tryte.
+    """
+    with self.assertRaises(TrytesDecodeError):
+      decode(b'not valid', T5B1Codec.name)
+
+  def test_encode_error_invalid_byte(self):
+    """
+    Attempting to unpack a byte that is outside the range of 5 trits.
+    """
+    with self.assertRaises(ValueError):
+      encode(b'\x7a', T5B1Codec.name)
+
+  def test_encode_error_invalid_padding(self):
+    """
+    Attempting to unpack a value with non-zero padding trits.
+    """
+    # A single byte holds 5 trits, so the last 2 are padding.
+    with self.assertRaises(ValueError):
+      encode(b'\x79', T5B1Codec.name)
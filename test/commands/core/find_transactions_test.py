@@ -593,4 +593,95 @@ class FindTransactionsCommandTestCase(TestCase):
       self.assertEqual(
         response,
         'You found me!'
-      )
\ No newline at end of file
+      )
+
+  @async_test
+  async def test_chunking(self):
+    """
+    Each oversized search term is split into chunks; results from every
+    chunk are combined.
+    """
+    self.adapter.api_limits = {'maxRequestsList': 101}
+
+    addresses = ['A' * 81] * 102
+    bundles = ['B' * 81] * 102
+
+    for i in range(4):
+      self.adapter.seed_response('findTransactions', {
+        'hashes': ['ABCD'[i] * 81],
+      })
+
+    response = await FindTransactionsCommand(self.adapter)(
+      addresses=addresses,
+      bundles=bundles,
+      tags=['C' * 27],
+    )
+
+    self.assertEqual(len(response['hashes']), 4)
+
+    self.assertListEqual(
+      [
+        (len(request['addresses']), len(request['bundles']), request['tags'])
+        for request in self.adapter.requests
+      ],
+
+      [
+        (101, 101, ['C' * 27]),
+        (101, 1, ['C' * 27]),
+        (1, 101, ['C' * 27]),
+        (1, 1, ['C' * 27]),
+      ],
+    )
+
+  @async_test
+  async def test_stream_chunking_duplicates(self):
+    """
+    Streaming results from chunks that overlap; each transaction is only
+    yielded once.
+    """
+    self.adapter.api_limits = {'maxRequestsList': 1000}
+
+    self.adapter.seed_response('findTransactions', {
+      'hashes': ['A' * 81, 'B' * 81],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': ['B' * 81, 'C' * 81],
+    })
+
+    hashes = [
+      hash_
+      async for hash_ in FindTransactionsCommand(self.adapter).stream(
+        approvees=['A' * 81] * 1500,
+      )
+    ]
+
+    self.assertEqual(len(self.adapter.requests), 2)
+
+    self.assertListEqual(
+      [str(hash_) for hash_ in hashes],
+      ['A' * 81, 'B' * 81, 'C' * 81],
+    )
+
+  @async_test
+  async def test_chunking_duplicates(self):
+    """
+    Transactions that match more than one chunk are only returned once.
+    """
+    self.adapter.api_limits = {'maxRequestsList': 101}
+
+    self.adapter.seed_response('findTransactions', {
+      'hashes': ['A' * 81, 'B' * 81],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': ['B' * 81, 'C' * 81],
+    })
+
+    response = await FindTransactionsCommand(self.adapter)(
+      addresses=['A' * 81] * 102,
+    )
+
+    self.assertListEqual(
+      [str(hash_) for hash_ in response['hashes']],
+      ['A' * 81, 'B' * 81, 'C' * 81],
+    )
+
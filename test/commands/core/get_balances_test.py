@@ -270,6 +270,41 @@ class GetBalancesCommandTestCase(TestCase):
                 'You found me!'
             )
 
+    @async_test
+    async def test_chunking(self):
+        """
+        Addresses are split into chunks; the remaining chunks use the
+        same tips as the first one.
+        """
+        self.adapter.api_limits = {'maxRequestsList': 101}
+
+        addresses = [
+            Address(TryteString.random(81)) for _ in range(202)
+        ]
+
+        self.adapter.seed_response('getBalances', {
+            'balances': [1] * 101,
+            'milestoneIndex': 42,
+            'references': ['A' * 81],
+        })
+        self.adapter.seed_response('getBalances', {
+            'balances': [2] * 101,
+            'milestoneIndex': 42,
+            'references': ['A' * 81],
+        })
+
+        response = await GetBalancesCommand(self.adapter)(
+            addresses=addresses,
+        )
+
+        self.assertListEqual(response['balances'], [1] * 101 + [2] * 101)
+        self.assertEqual(response['milestoneIndex'], 42)
+
+        self.assertListEqual(
+            [request.get('tips') for request in self.adapter.requests],
+            [None, ['A' * 81]],
+        )
+
     @async_test
     async def test_wireup_async(self):
         """
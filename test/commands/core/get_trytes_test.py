@@ -5,7 +5,10 @@ from filters.test import BaseFilterTestCase
 
 from iota import Iota, TransactionHash, TryteString, AsyncIota
 from iota.adapter import MockAdapter, async_return
+from iota.commands import FilterCommand
 from iota.commands.core.get_trytes import GetTrytesCommand
+from iota.commands.extended.get_transaction_objects import \
+  GetTransactionObjectsCommand
 from iota.filters import Trytes
 from test import patch, MagicMock, async_test
 
@@ -275,4 +278,194 @@ class GetTrytesCommandTestCase(TestCase):
       self.assertEqual(
         response,
         'You found me!'
-      )
\ No newline at end of file
+      )
+
+  @async_test
+  async def test_chunking(self):
+    """
+    Requests that exceed the node's limits are split into chunks.
+    """
+    hashes = [TransactionHash(TryteString.random(81)) for _ in range(250)]
+
+    self.adapter.seed_response('getNodeAPIConfiguration', {
+      'maxGetTrytes': 100,
+      'maxRequestsList': 1000,
+    })
+
+    for i in range(3):
+      self.adapter.seed_response('getTrytes', {
+        'trytes': ['T' * 2673] * (50 if i == 2 else 100),
+        'duration': i,
+      })
+
+    response = await GetTrytesCommand(self.adapter)(hashes=hashes)
+
+    self.assertEqual(len(response['trytes']), 250)
+
+    self.assertListEqual(
+      [request['command'] for request in self.adapter.requests],
+      ['getNodeAPIConfiguration', 'getTrytes', 'getTrytes', 'getTrytes'],
+    )
+
+    self.assertListEqual(
+      [request['hashes'] for request in self.adapter.requests[1:]],
+      [hashes[0:100], hashes[100:200], hashes[200:250]],
+    )
+
+    # The limits are only fetched once.
+    for _ in range(2):
+      self.adapter.seed_response('getTrytes', {
+        'trytes': ['T' * 2673] * 100,
+      })
+
+    await GetTrytesCommand(self.adapter)(hashes=hashes[0:150])
+
+    self.assertListEqual(
+      [request['command'] for request in self.adapter.requests[4:]],
+      ['getTrytes', 'getTrytes'],
+    )
+
+  @async_test
+  async def test_chunking_small_request(self):
+    """
+    Small requests are sent without checking the node's limits.
+    """
+    self.adapter.seed_response('getTrytes', {'trytes': []})
+
+    await GetTrytesCommand(self.adapter)(hashes=[TransactionHash('A' * 81)])
+
+    self.assertListEqual(
+      [request['command'] for request in self.adapter.requests],
+      ['getTrytes'],
+    )
+    self.assertIsNone(self.adapter.api_limits)
+
+  @async_test
+  async def test_chunking_default_limits(self):
+    """
+    If the node does not report its limits, the defaults are used.
+    """
+    self.adapter.seed_response('getNodeAPIConfiguration', {
+      'error': 'Command [getNodeAPIConfiguration] is unknown',
+    })
+    self.adapter.seed_response('getTrytes', {'trytes': []})
+
+    await GetTrytesCommand(self.adapter)(
+      hashes=[TransactionHash('A' * 81)] * 101,
+    )
+
+    self.assertEqual(self.adapter.api_limits['maxGetTrytes'], 10000)
+    self.assertEqual(len(self.adapter.requests[-1]['hashes']), 101)
+
+  @async_test
+  async def test_stream(self):
+    """
+    Streaming the trytes, one chunk at a time.
+    """
+    hashes = [TransactionHash(TryteString.random(81)) for _ in range(150)]
+
+    self.adapter.seed_response('getNodeAPIConfiguration', {
+      'maxGetTrytes': 100,
+    })
+
+    self.adapter.seed_response('getTrytes', {'trytes': ['A' * 2673] * 100})
+    self.adapter.seed_response('getTrytes', {'trytes': ['B' * 2673] * 50})
+
+    command = GetTrytesCommand(self.adapter)
+    trytes = []
+
+    async for value in command.stream(hashes=hashes):
+      self.assertIsInstance(value, TryteString)
+      trytes.append(value)
+
+      # Chunks are requested one at a time.
+      self.assertEqual(
+        len(self.adapter.requests),
+        2 if len(trytes) <= 100 else 3,
+      )
+
+    self.assertListEqual(
+      trytes,
+      [TryteString('A' * 2673)] * 100 + [TryteString('B' * 2673)] * 50,
+    )
+
+    with self.assertRaises(RuntimeError):
+      async for _ in command.stream(hashes=hashes):
+        pass
+
+  def test_filters_cached(self):
+    """
+    Filters are built once per command class.
+    """
+    command = GetTrytesCommand(self.adapter)
+
+    self.assertIs(
+      command._get_filter('request'),
+      GetTrytesCommand(self.adapter)._get_filter('request'),
+    )
+
+    self.assertIsNot(
+      command._get_filter('request'),
+      command._get_filter('response'),
+    )
+
+  def test_trusted(self):
+    """
+    Configuring whether typed values are validated.
+    """
+    self.assertFalse(GetTrytesCommand(self.adapter).is_trusted())
+    self.assertTrue(GetTrytesCommand(self.adapter, trusted=True).is_trusted())
+
+    self.adapter.set_trusted(True)
+    self.assertTrue(GetTrytesCommand(self.adapter).is_trusted())
+    self.assertFalse(
+      GetTrytesCommand(self.adapter, trusted=False).is_trusted(),
+    )
+
+    with self.assertRaises(ValueError):
+      self.adapter.set_trusted('yes')
+
+  @async_test
+  async def test_trusted_request(self):
+    """
+    Sending a request with trusted values.
+    """
+    hashes = [TransactionHash(b'A' * 81), TransactionHash(b'B' * 81)]
+
+    self.adapter.seed_response('getTrytes', {'trytes': []})
+
+    await GetTrytesCommand(self.adapter, trusted=True)(hashes=hashes)
+
+    self.assertListEqual(
+      self.adapter.requests[0]['hashes'],
+      ['A' * 81, 'B' * 81],
+    )
+
+  @async_test
+  async def test_nested_commands_trusted(self):
+    """
+    Commands called by other commands are trusted by default.
+    """
+    results = []
+    is_trusted = FilterCommand.is_trusted
+
+    def record_is_trusted(command):
+      result = is_trusted(command)
+      results.append((type(command), result))
+      return result
+
+    self.adapter.seed_response('getTrytes', {'trytes': ['9' * 2673]})
+
+    with patch.object(FilterCommand, 'is_trusted', record_is_trusted):
+      await GetTransactionObjectsCommand(self.adapter)(
+        hashes=[TransactionHash(b'A' * 81)],
+      )
+
+    self.assertListEqual(
+      results,
+      [(GetTransactionObjectsCommand, False), (GetTrytesCommand, True)],
+    )
+
+    # The nested context does not leak outside of the command.
+    self.assertFalse(GetTrytesCommand(self.adapter).is_trusted())
+
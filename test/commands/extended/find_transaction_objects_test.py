@@ -1,9 +1,9 @@
 from unittest import TestCase
 
-from iota import Iota, AsyncIota, MockAdapter, Transaction
+from iota import Iota, AsyncIota, MockAdapter, Transaction, TransactionHash
 from iota.commands.extended import FindTransactionObjectsCommand
 from iota.adapter import async_return
-from test import patch, MagicMock, mock, async_test
+from test import patch, MagicMock, async_test
 
 
 class FindTransactionObjectsCommandTestCase(TestCase):
@@ -137,33 +137,68 @@ class FindTransactionObjectsCommandTestCase(TestCase):
         A transaction is found with the inputs. A transaction object is
         returned
         """
-        with mock.patch(
-            'iota.commands.core.find_transactions.FindTransactionsCommand.'
-            '_execute',
-            mock.Mock(return_value=async_return({'hashes': [self.transaction_hash, ]})),
-        ):
-            with mock.patch(
-                'iota.commands.core.get_trytes.GetTrytesCommand._execute',
-                mock.Mock(return_value=async_return({'trytes': [self.trytes, ]})),
-            ):
-                response = await self.command(addresses=[self.address])
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [self.transaction_hash],
+        })
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.trytes],
+        })
+
+        response = await self.command(addresses=[self.address])
 
         self.assertEqual(len(response['transactions']), 1)
         transaction = response['transactions'][0]
         self.assertIsInstance(transaction, Transaction)
         self.assertEqual(transaction.address, self.address)
 
+    @async_test
+    async def test_transactions_found_in_batches(self):
+        """
+        Trytes are fetched in batches, as transaction hashes arrive.
+        """
+        self.command.batch_size = 1
+
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [self.transaction_hash, b'B' * 81],
+        })
+
+        self.adapter.seed_response('getTrytes', {'trytes': [self.trytes]})
+        self.adapter.seed_response('getTrytes', {'trytes': [self.trytes]})
+
+        response = await self.command(addresses=[self.address])
+
+        self.assertEqual(len(response['transactions']), 2)
+
+        # Each transaction keeps the hash that it was requested with.
+        self.assertListEqual(
+            [txn.hash for txn in response['transactions']],
+            [
+                TransactionHash(self.transaction_hash),
+                TransactionHash(b'B' * 81),
+            ],
+        )
+
+        self.assertListEqual(
+            [request['command'] for request in self.adapter.requests],
+            ['findTransactions', 'getTrytes', 'getTrytes'],
+        )
+
+        self.assertListEqual(
+            self.adapter.requests[1]['hashes'],
+            [self.transaction_hash.decode('ascii')],
+        )
+
     @async_test
     async def test_no_transactions_fround(self):
         """
         No transaction is found with the inputs. An empty list is returned
         """
-        with mock.patch(
-            'iota.commands.core.find_transactions.FindTransactionsCommand.'
-            '_execute',
-            mock.Mock(return_value=async_return({'hashes': []})),
-        ):
-            response = await self.command(addresses=[self.address])
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+
+        response = await self.command(addresses=[self.address])
 
         self.assertDictEqual(
             response,
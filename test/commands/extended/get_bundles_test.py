@@ -4,7 +4,7 @@ import filters as f
 from filters.test import BaseFilterTestCase
 
 from iota import Address, BadApiResponse, Bundle, \
-    Iota, AsyncIota, TransactionHash, TransactionTrytes
+    Iota, AsyncIota, Transaction, TransactionHash, TransactionTrytes
 from iota.adapter import MockAdapter, async_return
 from iota.commands.extended.get_bundles import GetBundlesCommand
 from iota.filters import Trytes
@@ -382,6 +382,12 @@ class GetBundlesCommandTestCase(TestCase):
             'trytes': [self.spam_trytes],
         })
 
+        # The node doesn't find the bundle transactions in one batch, so
+        # they are fetched one at a time.
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+
         response = await self.command(transactions = [self.tx_hash])
 
         self.maxDiff = None
@@ -407,6 +413,10 @@ class GetBundlesCommandTestCase(TestCase):
                 'trytes': [self.spam_trytes],
             })
 
+            self.adapter.seed_response('findTransactions', {
+                'hashes': [],
+            })
+
         response = await self.command(transactions = [self.tx_hash, self.tx_hash])
 
         self.maxDiff = None
@@ -422,6 +432,119 @@ class GetBundlesCommandTestCase(TestCase):
             original_bundle.as_json_compatible(),
         )
 
+    @async_test
+    async def test_multiple_tails(self):
+        """
+        Get several bundles at once; every bundle is advanced one
+        transaction per request.
+        """
+        spam_hash = Bundle.from_tryte_strings([self.spam_trytes])[0].hash
+        bundle = Bundle.from_tryte_strings(self.bundle_trytes)
+
+        # Transactions are identified by the hashes that were requested.
+        expected = Bundle([
+            Transaction.from_tryte_string(self.bundle_trytes[0], self.tx_hash),
+            Transaction.from_tryte_string(
+                self.bundle_trytes[1],
+                bundle[0].trunk_transaction_hash,
+            ),
+        ])
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.bundle_trytes[0], self.spam_trytes],
+        })
+
+        # The spam bundle only has one transaction, so only the first
+        # bundle is advanced.
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.bundle_trytes[1]],
+        })
+
+        # The trunk of the head transaction belongs to a different
+        # bundle, which ends the traversal.
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.spam_trytes],
+        })
+
+        response = await self.command(
+            transactions = [self.tx_hash, spam_hash, self.tx_hash],
+        )
+
+        self.assertListEqual(
+            [b.as_json_compatible() for b in response['bundles']],
+
+            [
+                expected.as_json_compatible(),
+                Bundle.from_tryte_strings([self.spam_trytes])
+                    .as_json_compatible(),
+                expected.as_json_compatible(),
+            ],
+        )
+
+        self.assertListEqual(
+            self.adapter.requests,
+
+            [
+                {
+                    'command': 'getTrytes',
+                    'hashes': [self.tx_hash, spam_hash],
+                },
+
+                {
+                    'command': 'getTrytes',
+                    'hashes': [bundle[0].trunk_transaction_hash],
+                },
+
+                {
+                    'command': 'getTrytes',
+                    'hashes': [bundle[1].trunk_transaction_hash],
+                },
+            ],
+        )
+
+    @async_test
+    async def test_multiple_tails_chunked(self):
+        """
+        Requests are split into chunks.
+        """
+        spam_hash = Bundle.from_tryte_strings([self.spam_trytes])[0].hash
+
+        self.command.chunk_size = 1
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.bundle_trytes[0]],
+        })
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.spam_trytes],
+        })
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.bundle_trytes[1]],
+        })
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.spam_trytes],
+        })
+
+        response = await self.command(transactions = [self.tx_hash, spam_hash])
+
+        self.assertEqual(len(response['bundles']), 2)
+
+        self.assertListEqual(
+            [request['hashes'] for request in self.adapter.requests[0:2]],
+            [[self.tx_hash], [spam_hash]],
+        )
+
+    @async_test
+    async def test_multiple_tails_missing_transaction(self):
+        """
+        One of the bundles is not visible on the Tangle.
+        """
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [self.bundle_trytes[0], TransactionTrytes('')],
+        })
+
+        with self.assertRaises(BadApiResponse):
+            await self.command(transactions = [self.tx_hash, 'A' * 81])
+
     @async_test
     async def test_validator_error(self):
         """
@@ -440,5 +563,9 @@ class GetBundlesCommandTestCase(TestCase):
             'trytes': [self.spam_trytes],
         })
 
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+
         with self.assertRaises(BadApiResponse):
             response = await self.command(transactions = [self.tx_hash])
\ No newline at end of file
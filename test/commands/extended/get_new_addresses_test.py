@@ -1,3 +1,5 @@
+import asyncio
+from threading import Event
 from unittest import TestCase
 
 import filters as f
@@ -32,6 +34,7 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
       'count':          1,
       'securityLevel':  2,
       'checksum':       False,
+      'workers':        4,
     }
 
     filter_ = self._filter(request)
@@ -57,6 +60,7 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
         'count':          None,
         'securityLevel':  AddressGenerator.DEFAULT_SECURITY_LEVEL,
         'checksum':       False,
+        'workers':        None,
       },
     )
 
@@ -88,6 +92,7 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
         'count':          8,
         'securityLevel':  2,
         'checksum':       False,
+        'workers':        None,
       },
     )
 
@@ -325,6 +330,22 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
     )
 
 
+  def test_fail_workers_too_small(self):
+    """
+    ``workers`` is less than 0.
+    """
+    self.assertFilterErrors(
+      {
+        'workers':  -1,
+        'seed':     Seed(self.seed),
+      },
+
+      {
+        'workers': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+
 class GetNewAddressesCommandTestCase(TestCase):
   def setUp(self):
     super(GetNewAddressesCommandTestCase, self).setUp()
@@ -423,6 +444,24 @@ class GetNewAddressesCommandTestCase(TestCase):
     # No API requests were made.
     self.assertListEqual(self.adapter.requests, [])
 
+  @async_test
+  async def test_get_addresses_offline_workers(self):
+    """
+    Generate addresses in worker processes.
+    """
+    response =\
+      await self.command(
+        count   = 2,
+        index   = 0,
+        seed    = self.seed,
+        workers = 2,
+      )
+
+    self.assertDictEqual(
+      response,
+      {'addresses': [self.addy_1, self.addy_2]},
+    )
+
   @async_test
   async def test_security_level(self):
     """
@@ -577,6 +616,90 @@ class GetNewAddressesCommandTestCase(TestCase):
       ],
     )
 
+  @async_test
+  async def test_get_addresses_online_cancelled(self):
+    """
+    The command is cancelled while the next address is being generated.
+    """
+    started = Event()
+    release = Event()
+    closed = []
+
+    def slow_iterator(*args, **kwargs):
+      try:
+        started.set()
+        release.wait(timeout=5)
+        yield self.addy_1
+      finally:
+        closed.append(True)
+
+    with patch.object(
+        AddressGenerator,
+        'create_iterator',
+        side_effect=slow_iterator,
+    ):
+      task = asyncio.ensure_future(self.command(index=0, seed=self.seed))
+
+      await asyncio.get_event_loop().run_in_executor(None, started.wait, 5)
+      task.cancel()
+      asyncio.get_event_loop().call_later(0.05, release.set)
+
+      # The iterator is closed once the address has been generated,
+      # instead of while it is still running.
+      with self.assertRaises(asyncio.CancelledError):
+        await task
+
+    self.assertListEqual(closed, [True])
+
+  @async_test
+  async def test_get_addresses_online_scan_window(self):
+    """
+    Generate address in online mode, checking a window of addresses at
+    a time.
+    """
+    self.adapter.set_scan_window(2)
+
+    # Pretend that ``self.addy1`` has a transaction, but
+    # ``self.addy2`` is not used.
+    tx_hash = (
+      'TESTVALUE9DONTUSEINPRODUCTION99999ITQLQN'
+      'LPPG9YNAARMKNKYQO9GSCSBIOTGMLJUFLZWSY9999'
+    )
+
+    self.adapter.seed_response('wereAddressesSpentFrom', {
+      'states': [False, False],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': [tx_hash],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': [],
+    })
+
+    response = await self.command(index=0, seed=self.seed)
+
+    self.assertDictEqual(response, {'addresses': [self.addy_2]})
+
+    # No trytes are needed to tell which address each transaction
+    # belongs to.
+    self.assertCountEqual(
+      self.adapter.requests,
+      [
+        {
+          'command': 'wereAddressesSpentFrom',
+          'addresses': [self.addy_1, self.addy_2],
+        },
+        {
+          'command': 'findTransactions',
+          'addresses': [self.addy_1],
+        },
+        {
+          'command': 'findTransactions',
+          'addresses': [self.addy_2],
+        },
+      ],
+    )
+
   @async_test
   async def test_new_address_checksum(self):
     """
@@ -386,7 +386,9 @@ class IsPromotableCommandTestCase(TestCase):
         # Note that self.trytes2 will have the original and
         # therefore invalid (too old) timestamp
         tx = Transaction.from_tryte_string(self.trytes1)
-        tx.attachment_timestamp = get_current_ms()
+        # The attachment timestamp must be strictly in the past, even if
+        # the command runs within the same millisecond.
+        tx.attachment_timestamp = get_current_ms() - 1
         self.trytes1 = tx.as_tryte_string()
 
         self.adapter.seed_response('checkConsistency', {
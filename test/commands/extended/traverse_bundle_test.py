@@ -121,6 +121,100 @@ class TraverseBundleCommandTestCase(TestCase):
         self.adapter = MockAdapter()
         self.command = TraverseBundleCommand(self.adapter)
 
+        # Bundle with multiple transactions.
+        self.bundle = Bundle.from_tryte_strings([
+            TransactionTrytes(
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999WUQXEGBVIECGIWO9IGSYKWWPYCIVUJJGSJPWGIAFJPYSF9NSQOHWAHS9P'
+                b'9PWQHOBXNNQIF9IRHVQXKPZW999999999999999999999999999XZUIENOTTBKJMDP'
+                b'RXWGQYG9PWGTHNLFMVD99A99999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
+                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXBGUEHHGAIWWQ'
+                b'BCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJLEDAMYVRGABAWBY9'
+                b'999MYIYBTGIOQYYZFJBLIAWMPSZEFFTXUZPCDIXSLLQDQSFYGQSQOGSPKCZNLVSZ9L'
+                b'MCUWVNGEN9EJEW9999XZUIENOTTBKJMDPRXWGQYG9PWGTXUO9AXMP9FLMDRMADLRPW'
+                b'CZCJBROYCDRJMYU9HDYJM9NDBFUPIZVTR'
+            ),
+
+            # Well, it was bound to happen sooner or later... the ASCII
+            # representation of this tryte sequence contains a very naughty
+            # phrase.  But I don't feel like doing another POW, so... enjoy.
+            TransactionTrytes(
+                b'NBTCPCFDEACCPCBDVC9DTCQAJ9RBTC9D9DCDQAEAKDCDFD9DSCFAJ9VBCDJDTCQAJ9'
+                b'ZBMDYBCCKB99999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999999999999999999'
+                b'999999999999999999999999999999999999999999999999999SYRABNN9JD9PNDL'
+                b'IKUNCECUELTOHNLFMVD99999999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
+                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXFSEWUNJOEGNU'
+                b'I9QOCRFMYSIFAZLJHKZBPQZZYFG9ORYCRDX9TOMJPFCRB9R9KPUUGFPVOWYXFIWEW9'
+                b'999BGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
+                b'EDAMYVRGABAWBY9999SYRABNN9JD9PNDLIKUNCECUELTOQZPSBDILVHJQVCEOICFAD'
+                b'YKZVGMOAXJRQNTCKMHGTAUMPGJJMX9LNF'
+            ),
+        ])
+
     def test_wireup(self):
         """
         Verify that the command is wired up correctly. (sync)
@@ -238,98 +332,7 @@ class TraverseBundleCommandTestCase(TestCase):
         """
         Getting a bundle that contains multiple transactions.
         """
-        bundle = Bundle.from_tryte_strings([
-            TransactionTrytes(
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999WUQXEGBVIECGIWO9IGSYKWWPYCIVUJJGSJPWGIAFJPYSF9NSQOHWAHS9P'
-                b'9PWQHOBXNNQIF9IRHVQXKPZW999999999999999999999999999XZUIENOTTBKJMDP'
-                b'RXWGQYG9PWGTHNLFMVD99A99999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
-                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXBGUEHHGAIWWQ'
-                b'BCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJLEDAMYVRGABAWBY9'
-                b'999MYIYBTGIOQYYZFJBLIAWMPSZEFFTXUZPCDIXSLLQDQSFYGQSQOGSPKCZNLVSZ9L'
-                b'MCUWVNGEN9EJEW9999XZUIENOTTBKJMDPRXWGQYG9PWGTXUO9AXMP9FLMDRMADLRPW'
-                b'CZCJBROYCDRJMYU9HDYJM9NDBFUPIZVTR'
-            ),
-
-            # Well, it was bound to happen sooner or later... the ASCII
-            # representation of this tryte sequence contains a very naughty
-            # phrase.  But I don't feel like doing another POW, so... enjoy.
-            TransactionTrytes(
-                b'NBTCPCFDEACCPCBDVC9DTCQAJ9RBTC9D9DCDQAEAKDCDFD9DSCFAJ9VBCDJDTCQAJ9'
-                b'ZBMDYBCCKB99999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999999999999999999'
-                b'999999999999999999999999999999999999999999999999999SYRABNN9JD9PNDL'
-                b'IKUNCECUELTOHNLFMVD99999999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
-                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXFSEWUNJOEGNU'
-                b'I9QOCRFMYSIFAZLJHKZBPQZZYFG9ORYCRDX9TOMJPFCRB9R9KPUUGFPVOWYXFIWEW9'
-                b'999BGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
-                b'EDAMYVRGABAWBY9999SYRABNN9JD9PNDLIKUNCECUELTOQZPSBDILVHJQVCEOICFAD'
-                b'YKZVGMOAXJRQNTCKMHGTAUMPGJJMX9LNF'
-            ),
-        ])
+        bundle = self.bundle
 
         for txn in bundle:
             self.adapter.seed_response('getTrytes', {
@@ -382,6 +385,12 @@ class TraverseBundleCommandTestCase(TestCase):
             ],
         })
 
+        # The node doesn't find the bundle transactions in one batch, so
+        # they are fetched one at a time.
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+
         response = await self.command(
             transaction =
                 TransactionHash(
@@ -395,6 +404,101 @@ class TraverseBundleCommandTestCase(TestCase):
             bundle.as_json_compatible(),
         )
 
+    def create_linked_bundle(self) -> Bundle:
+        """
+        Returns a copy of :py:attr:`bundle` where the tail transaction's
+        trunk references the next transaction in the bundle.
+        """
+        tail_trytes = self.bundle[0].as_tryte_string()
+        next_txn = self.bundle[1]
+
+        return Bundle([
+            Transaction.from_tryte_string(
+                tail_trytes[0:2430] +
+                next_txn.hash +
+                tail_trytes[2511:]
+            ),
+
+            next_txn,
+        ])
+
+    @async_test
+    async def test_multiple_transactions_batch(self):
+        """
+        Getting a bundle that contains multiple transactions, when the
+        node returns every transaction in the bundle at once.
+        """
+        bundle = self.create_linked_bundle()
+        tail = bundle.tail_transaction
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [tail.as_tryte_string()],
+        })
+
+        # The transactions can be returned in any order.
+        transactions = list(reversed(bundle.transactions))
+
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [txn.hash for txn in transactions],
+        })
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [txn.as_tryte_string() for txn in transactions],
+        })
+
+        response = await self.command(transaction=tail.hash)
+
+        self.assertListEqual(
+            response['bundles'][0].as_json_compatible(),
+            bundle.as_json_compatible(),
+        )
+
+        self.assertListEqual(
+            [request['command'] for request in self.adapter.requests],
+            ['getTrytes', 'findTransactions', 'getTrytes'],
+        )
+
+    @async_test
+    async def test_multiple_transactions_incomplete_batch(self):
+        """
+        Getting a bundle that contains multiple transactions, when the
+        node is missing some of the transactions in the bundle.
+        """
+        bundle = self.create_linked_bundle()
+        tail = bundle.tail_transaction
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [tail.as_tryte_string()],
+        })
+
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [tail.hash],
+        })
+
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [tail.as_tryte_string()],
+        })
+
+        # The missing transaction is fetched separately.
+        self.adapter.seed_response('getTrytes', {
+            'trytes': [bundle[1].as_tryte_string()],
+        })
+
+        response = await self.command(transaction=tail.hash)
+
+        self.assertListEqual(
+            response['bundles'][0].as_json_compatible(),
+            bundle.as_json_compatible(),
+        )
+
+        self.assertDictEqual(
+            self.adapter.requests[-1],
+            {
+                'command': 'getTrytes',
+                'hashes': [tail.trunk_transaction_hash],
+            },
+        )
+
     @async_test
     async def test_non_tail_transaction(self):
         """
@@ -1,10 +1,12 @@
 from unittest import TestCase
 from iota.commands.extended.utils import iter_used_addresses, \
-    get_bundles_from_transaction_hashes
+    get_bundles_from_transaction_hashes, scan_addresses
 from iota.adapter import MockAdapter, async_return
 from iota.crypto.types import Seed
 from test import mock, async_test, MagicMock
-from iota import TransactionTrytes, TransactionHash, Bundle, BadApiResponse
+from iota import Address, TransactionTrytes, TransactionHash, Bundle, \
+    BadApiResponse
+from iota.crypto.addresses import AddressGenerator
 
 
 class IterUsedAddressesTestCase(TestCase):
@@ -245,6 +247,153 @@ class IterUsedAddressesTestCase(TestCase):
         )
 
 
+class ScanAddressesTestCase(TestCase):
+    def setUp(self):
+        super(ScanAddressesTestCase, self).setUp()
+
+        self.adapter = MockAdapter()
+        self.adapter.set_scan_window(3)
+
+        self.seed = Seed(trytes='S' * 81)
+        self.addresses = [Address(c * 81) for c in 'ABCDEF']
+
+        # To speed up the tests, we will mock the address generator.
+        def get_addresses(ag, start, count=1, step=1):
+            return self.addresses[start:start + count]
+        self.mock_get_addresses = get_addresses
+
+    @async_test
+    async def test_iter_used_addresses(self):
+        """
+        Used addresses are found one window at a time.
+        Address 0: Was spent from
+        Address 1: Has a transaction
+        Address 2: Is not used. Should not be returned
+        """
+        self.adapter.seed_response('wereAddressesSpentFrom', {
+            'states': [True, False, False],
+        })
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+        self.adapter.seed_response('findTransactions', {
+            'hashes': ['T' * 81],
+        })
+        self.adapter.seed_response('findTransactions', {
+            'hashes': [],
+        })
+
+        with mock.patch(
+                'iota.crypto.addresses.AddressGenerator.get_addresses',
+                self.mock_get_addresses,
+        ):
+            used = [
+                (address, hashes) async for address, hashes
+                in iter_used_addresses(self.adapter, self.seed, 0)
+            ]
+
+        self.assertListEqual(
+            used,
+            [
+                (self.addresses[0], []),
+                (self.addresses[1], [TransactionHash('T' * 81)]),
+            ],
+        )
+
+        # Each address is sent separately, so that no trytes are needed
+        # to tell which address each transaction belongs to.
+        self.assertListEqual(
+            self.adapter.requests,
+            [
+                {
+                    'command': 'wereAddressesSpentFrom',
+                    'addresses': self.addresses[0:3],
+                },
+                {
+                    'command': 'findTransactions',
+                    'addresses': [self.addresses[0]],
+                },
+                {
+                    'command': 'findTransactions',
+                    'addresses': [self.addresses[1]],
+                },
+                {
+                    'command': 'findTransactions',
+                    'addresses': [self.addresses[2]],
+                },
+            ]
+        )
+
+    @async_test
+    async def test_window_grows(self):
+        """
+        The window grows when requests are slower than address
+        generation.
+        """
+        # Every address in the first window was spent from.
+        self.adapter.seed_response('wereAddressesSpentFrom', {
+            'states': [True, True, True],
+        })
+
+        # The second window doubles in size; only address 3 is used.
+        self.adapter.seed_response('wereAddressesSpentFrom', {
+            'states': [True, False, False],
+        })
+
+        for _ in range(6):
+            self.adapter.seed_response('findTransactions', {
+                'hashes': [],
+            })
+
+        with mock.patch(
+                'iota.crypto.addresses.AddressGenerator.get_addresses',
+                self.mock_get_addresses,
+        ), mock.patch(
+                'iota.commands.extended.utils.monotonic',
+                # Address generation takes 1s, requests take 2s.
+                side_effect=[0, 1, 1, 3, 3, 4, 4, 6],
+        ):
+            scanned = [
+                (address, spent) async for address, _, spent
+                in scan_addresses(
+                    self.adapter,
+                    AddressGenerator(self.seed),
+                    0,
+                    3,
+                )
+            ]
+
+        self.assertListEqual(
+            scanned,
+            [
+                (self.addresses[0], True),
+                (self.addresses[1], True),
+                (self.addresses[2], True),
+                (self.addresses[3], True),
+                (self.addresses[4], False),
+            ],
+        )
+
+        self.assertDictEqual(
+            self.adapter.requests[4],
+            {
+                'command': 'wereAddressesSpentFrom',
+                'addresses': self.addresses[3:6],
+            },
+        )
+
+
+    def test_invalid_scan_window(self):
+        """
+        The scan window must be a positive integer.
+        """
+        with self.assertRaises(ValueError):
+            self.adapter.set_scan_window(0)
+
+        self.adapter.set_scan_window(None)
+        self.assertIsNone(self.adapter.scan_window)
+
+
 class GetBundlesFromTransactionHashesTestCase(TestCase):
     def setUp(self) -> None:
         # Need two valid bundles
@@ -1,7 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+from tempfile import TemporaryDirectory
+from threading import Event
 from unittest import TestCase
+from unittest.mock import patch
 
 from iota import Address
-from iota.crypto.addresses import AddressGenerator
+from iota.crypto.addresses import AddressGenerator, MemoryAddressCache, \
+  SqliteAddressCache
+from iota.crypto.signing import get_worker_pool, map_index_range
 from iota.crypto.types import Seed
 
 
@@ -295,3 +302,281 @@ class AddressGeneratorTestCase(TestCase):
         b'WIKQRCIOD',
       ),
     )
+
+  def test_get_addresses_workers(self):
+    """
+    Spreading address generation across worker processes.
+    """
+    ag = AddressGenerator(self.seed_2)
+
+    self.assertListEqual(
+      AddressGenerator(self.seed_2, workers=2).get_addresses(
+        start=0,
+        count=3,
+      ),
+
+      ag.get_addresses(start=0, count=3),
+    )
+
+  def test_get_addresses_workers_pool_reused(self):
+    """
+    Worker processes are started once, and reused for later requests.
+    """
+    ag = AddressGenerator(self.seed_2, workers=2)
+    ag.get_addresses(start=0, count=2)
+
+    with patch(
+        'iota.crypto.signing.ProcessPoolExecutor',
+        side_effect=AssertionError('Worker pool should be reused.'),
+    ):
+      self.assertListEqual(
+        ag.get_addresses(start=2, count=2),
+        AddressGenerator(self.seed_2).get_addresses(start=2, count=2),
+      )
+
+    self.assertIs(get_worker_pool(2), get_worker_pool(2))
+
+  def test_get_addresses_executor(self):
+    """
+    Spreading address generation across an existing executor.
+    """
+    with ThreadPoolExecutor(2) as executor:
+      ag = AddressGenerator(self.seed_1, executor=executor)
+
+      self.assertListEqual(
+        ag.get_addresses(start=1, count=3, step=-1),
+
+        [
+          Address(
+            b'PNLOTLFSALMICK9PSW9ZWLE9KJAKPKGJZQJDAFMO'
+            b'VLHXMJCJXFPVHOTTOYDIAUAYELXKZWZUITCQBIQKY',
+          ),
+
+          Address(
+            b'DLEIS9XU9V9T9OURAKDUSQWBQEYFGJLRPRVEWKN9'
+            b'SSUGIHBEIPBPEWISSAURGTQKWKWNHXGCBQTWNOGIY',
+          ),
+        ],
+      )
+
+  def test_generator_prefetch(self):
+    """
+    Creating a generator that prepares addresses in the background.
+    """
+    ag = AddressGenerator(self.seed_2)
+
+    generator = ag.create_iterator(start=1, step=2, prefetch=2)
+
+    self.assertListEqual(
+      [next(generator), next(generator)],
+      ag.get_addresses(start=1, count=2, step=2),
+    )
+
+    generator.close()
+
+
+class AddressCacheTestCase(TestCase):
+  def setUp(self):
+    super(AddressCacheTestCase, self).setUp()
+
+    self.seed =\
+      Seed(
+        b'TESTVALUE9DONTUSEINPRODUCTION99999DCZGVE'
+        b'JIZEKEGEEHYE9DOHCHLHMGAFDGEEQFUDVGGDGHRDR',
+      )
+
+    self.addresses = AddressGenerator(self.seed).get_addresses(0, 3)
+
+  def test_cache_hit(self):
+    """
+    Addresses are generated once, then retrieved from the cache.
+    """
+    cache = MemoryAddressCache()
+
+    ag = AddressGenerator(self.seed, cache=cache)
+    self.assertListEqual(ag.get_addresses(0, 3), self.addresses)
+    self.assertEqual(len(cache), 3)
+
+    with patch.object(
+        AddressGenerator,
+        '_generate_address',
+        side_effect=AssertionError('Address should be cached.'),
+    ):
+      self.assertListEqual(ag.get_addresses(0, 3), self.addresses)
+
+      # Checksums are added on the way out.
+      self.assertListEqual(
+        AddressGenerator(self.seed, checksum=True, cache=cache)
+          .get_addresses(1, 2),
+
+        [a.with_valid_checksum() for a in self.addresses[1:]],
+      )
+
+  def test_cache_key(self):
+    """
+    Addresses are cached per seed, index and security level.
+    """
+    cache = MemoryAddressCache()
+    cache.set(self.seed, self.addresses[0])
+
+    self.assertEqual(cache.get(self.seed, 0, 2), self.addresses[0])
+    self.assertIsNone(cache.get(self.seed, 0, 1))
+    self.assertIsNone(cache.get(self.seed, 1, 2))
+    self.assertIsNone(cache.get(Seed(b'9' * 81), 0, 2))
+
+  def test_cache_lru(self):
+    """
+    The memory cache evicts the least recently used addresses.
+    """
+    cache = MemoryAddressCache(max_size=2)
+    cache.set(self.seed, self.addresses[0])
+    cache.set(self.seed, self.addresses[1])
+
+    # Touch the first address, so that the second one gets evicted.
+    cache.get(self.seed, 0, 2)
+    cache.set(self.seed, self.addresses[2])
+
+    self.assertEqual(len(cache), 2)
+    self.assertIsNotNone(cache.get(self.seed, 0, 2))
+    self.assertIsNone(cache.get(self.seed, 1, 2))
+
+  def test_cache_stores_no_checksum(self):
+    """
+    Addresses are cached without checksum.
+    """
+    cache = MemoryAddressCache()
+
+    generated = AddressGenerator(self.seed, checksum=True, cache=cache)\
+      .get_addresses(0)
+
+    self.assertIsNotNone(generated[0].checksum)
+    self.assertIsNone(cache.get(self.seed, 0, 2).checksum)
+
+  def test_sqlite_cache(self):
+    """
+    Addresses cached in SQLite persist across cache instances.
+    """
+    with TemporaryDirectory() as tmp:
+      path = join(tmp, 'addresses.db')
+
+      cache = SqliteAddressCache(path)
+      AddressGenerator(self.seed, cache=cache).precompute(0, 3)
+      cache.close()
+
+      cache = SqliteAddressCache(path)
+
+      self.assertListEqual(
+        list(cache.get_many(self.seed, range(4), 2).values()),
+        self.addresses,
+      )
+
+      cached = cache.get(self.seed, 2, 2)
+      self.assertEqual(cached.key_index, 2)
+      self.assertEqual(cached.security_level, 2)
+
+      cache.clear()
+      self.assertIsNone(cache.get(self.seed, 2, 2))
+      cache.close()
+
+  def test_concurrent_generation(self):
+    """
+    Generating an address does not block threads that are generating
+    other addresses.
+    """
+    cache = MemoryAddressCache()
+    other_seed = Seed(b'9' * 81)
+    other_done = Event()
+    waited = []
+
+    generate_address = AddressGenerator._generate_address
+
+    def slow_generate_address(generator, key_iterator):
+      # Wait until the other thread has generated its address.
+      if generator.seed == self.seed:
+        waited.append(other_done.wait(timeout=5))
+
+      return generate_address(generator, key_iterator)
+
+    def first_address(seed):
+      address = next(AddressGenerator(seed, cache=cache).create_iterator())
+
+      if seed == other_seed:
+        other_done.set()
+
+      return address
+
+    with patch.object(
+        AddressGenerator,
+        '_generate_address',
+        slow_generate_address,
+    ):
+      with ThreadPoolExecutor(2) as executor:
+        future = executor.submit(first_address, self.seed)
+        other_future = executor.submit(first_address, other_seed)
+
+        self.assertEqual(future.result(), self.addresses[0])
+        other_future.result()
+
+    self.assertListEqual(waited, [True])
+    self.assertEqual(len(cache), 2)
+
+  def test_parallel_partial_hit(self):
+    """
+    Only addresses missing from the cache are generated in parallel.
+    """
+    cache = MemoryAddressCache()
+    cache.set(self.seed, self.addresses[1])
+
+    with ThreadPoolExecutor(2) as executor:
+      ag = AddressGenerator(self.seed, executor=executor, cache=cache)
+
+      with patch(
+          'iota.crypto.addresses.map_index_range',
+          wraps=map_index_range,
+      ) as mock_map:
+        self.assertListEqual(ag.get_addresses(0, 3), self.addresses)
+
+      self.assertListEqual(
+        [c[0][1:3] for c in mock_map.call_args_list],
+        [(0, 1), (2, 1)],
+      )
+
+    self.assertEqual(len(cache), 3)
+
+  def test_prefetch_uses_cache(self):
+    """
+    Prefetching iterators consult the cache, too.
+    """
+    cache = MemoryAddressCache()
+    cache.set(self.seed, self.addresses[0])
+
+    generator = AddressGenerator(self.seed, cache=cache)\
+      .create_iterator(prefetch=2)
+
+    self.assertListEqual(
+      [next(generator), next(generator), next(generator)],
+      self.addresses,
+    )
+
+    generator.close()
+
+    self.assertEqual(len(cache), 3)
+
+  def test_default_cache(self):
+    """
+    Setting a cache for every generator.
+    """
+    cache = MemoryAddressCache()
+
+    with patch.object(AddressGenerator, 'cache', cache):
+      AddressGenerator(self.seed).get_addresses(0, 2)
+
+    self.assertEqual(len(cache), 2)
+    self.assertIsNone(AddressGenerator(self.seed).cache)
+
+  def test_precompute_no_cache(self):
+    """
+    Precomputing addresses requires a cache.
+    """
+    with self.assertRaises(ValueError):
+      AddressGenerator(self.seed).precompute(0, 3)
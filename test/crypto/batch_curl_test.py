@@ -0,0 +1,140 @@
+from unittest import TestCase
+
+from iota import TransactionHash, TryteString
+from iota.crypto.batch_curl import BatchCurl, curl_hash_many
+from iota.crypto.pycurl import Curl
+
+
+def curl_hash(trytes: TryteString) -> TryteString:
+    """
+    Computes the hash of a tryte sequence using the scalar sponge.
+    """
+    sponge = Curl()
+    sponge.absorb(trytes.as_trits())
+
+    trits_out = []
+    sponge.squeeze(trits_out)
+
+    return TryteString.from_trits(trits_out)
+
+
+class BatchCurlTestCase(TestCase):
+    def test_happy_path(self):
+        """
+        Each lane produces the same hash as a separate Curl sponge.
+        """
+        inputs = [
+            TryteString(
+                b'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+                b'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+            ),
+
+            TryteString(b'9' * 81),
+            TryteString.random(81),
+        ]
+
+        sponge = BatchCurl(len(inputs))
+        sponge.absorb(inputs)
+
+        hashes = sponge.squeeze()
+
+        self.assertEqual(
+            hashes[0],
+
+            b'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+            b'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+        )
+
+        self.assertEqual(
+            [TryteString(h) for h in hashes],
+            [curl_hash(t) for t in inputs],
+        )
+
+    def test_length_greater_than_243(self):
+        """
+        The inputs are longer than 1 hash (and get padded).
+        """
+        input_ = TryteString(
+            b'G9JYBOMPUXHYHKSNRNMMSSZCSHOFYOYNZRSZMAAYWDYEIMVVOGKPJB'
+            b'VBM9TDPULSFUNMTVXRKFIDOHUXXVYDLFSZYZTWQYTE9SPYYWYTXJYQ'
+            b'9IFGYOLZXWZBKWZN9QOOTBQMWMUBLEWUEEASRHRTNIQWJQNDWRYLCA'
+        )
+
+        sponge = BatchCurl(2)
+        sponge.absorb([input_, TryteString.random(len(input_))])
+
+        self.assertEqual(
+            sponge.squeeze()[0],
+
+            b'RWCBOLRFANOAYQWXXTFQJYQFAUTEEBSZWTIRSSDR'
+            b'EYGCNFRLHQVDZXYXSJKCQFQLJMMRHYAZKRRLQZDKR',
+        )
+
+    def test_wrong_number_of_inputs(self):
+        """
+        The number of inputs must match the number of lanes.
+        """
+        sponge = BatchCurl(2)
+
+        with self.assertRaises(ValueError):
+            sponge.absorb([TryteString(b'9' * 81)])
+
+    def test_different_lengths(self):
+        """
+        Every lane must absorb the same number of trytes.
+        """
+        sponge = BatchCurl(2)
+
+        with self.assertRaises(ValueError):
+            sponge.absorb([TryteString(b'9' * 81), TryteString(b'9' * 162)])
+
+    def test_invalid_lanes(self):
+        """
+        A sponge needs at least one lane.
+        """
+        with self.assertRaises(ValueError):
+            BatchCurl(0)
+
+
+class CurlHashManyTestCase(TestCase):
+    def test_mixed_lengths(self):
+        """
+        Inputs of different lengths are hashed correctly, and returned
+        in the original order.
+        """
+        inputs = [
+            TryteString.random(81),
+            TryteString.random(200),
+            TryteString.random(81),
+            TryteString.random(2673),
+        ]
+
+        hashes = curl_hash_many(inputs, TransactionHash)
+
+        self.assertEqual(hashes, [curl_hash(t) for t in inputs])
+
+        for hash_ in hashes:
+            self.assertIsInstance(hash_, TransactionHash)
+
+    def test_mixed_lengths_same_padded_length(self):
+        """
+        Inputs with different lengths that pad to the same length share
+        a sponge.
+        """
+        inputs = [
+            TryteString(b'A'),
+            TryteString(b'AB'),
+            TryteString.random(80),
+            TryteString.random(81),
+        ]
+
+        self.assertEqual(
+            curl_hash_many(inputs),
+            [curl_hash(t) for t in inputs],
+        )
+
+    def test_empty(self):
+        """
+        Hashing an empty list of inputs.
+        """
+        self.assertEqual(curl_hash_many([]), [])
@@ -7,7 +7,7 @@ from sha3 import keccak_384
 
 from iota.crypto.kerl import Kerl
 from iota.crypto.kerl.conv import convertToBytes, convertToTrits, \
-  trits_to_trytes, trytes_to_trits
+  trits_to_bytes, trits_to_int, trits_to_trytes, trytes_to_trits
 
 
 class TestKerl(TestCase):
@@ -243,3 +243,97 @@ class TestKerl(TestCase):
                       trytes = trytes_out,
                     ),
                 )
+
+
+class TestKerlIntegers(TestCase):
+    """
+    Covers the entry points that skip trit conversions.
+    """
+    def setUp(self):
+        super(TestKerlIntegers, self).setUp()
+
+        self.trits = [randrange(-1, 2) for _ in range(486)]
+
+        kerl = Kerl()
+        kerl.absorb(list(self.trits))
+        self.expected = []
+        kerl.squeeze(self.expected, length=486)
+
+    def test_absorb_int(self):
+        """
+        Absorbing integers instead of trits.
+        """
+        kerl = Kerl()
+        # The last trit of each hash is ignored.
+        kerl.absorb_int(trits_to_int(self.trits[0:243]))
+        kerl.absorb_int(trits_to_int(self.trits[243:486]))
+
+        self.assertEqual(
+          [kerl.squeeze_int(), kerl.squeeze_int()],
+
+          [
+            trits_to_int(self.expected[0:243]),
+            trits_to_int(self.expected[243:486]),
+          ],
+        )
+
+    def test_bytes(self):
+        """
+        Absorbing and squeezing bytes instead of trits.
+        """
+        trits = list(self.trits)
+        trits[242] = 0
+        trits[485] = 0
+
+        kerl = Kerl()
+        kerl.absorb_bytes(
+          trits_to_bytes(trits[0:243]) + trits_to_bytes(trits[243:486]),
+        )
+
+        self.assertEqual(
+          kerl.squeeze_bytes(96),
+
+          trits_to_bytes(self.expected[0:243])
+          + trits_to_bytes(self.expected[243:486]),
+        )
+
+    def test_absorb_bytes_invalid_length(self):
+        """
+        Only whole hashes can be absorbed.
+        """
+        with self.assertRaises(ValueError):
+            Kerl().absorb_bytes(b'\x00' * 47)
+
+    def test_squeeze_bytes_invalid_length(self):
+        """
+        Only whole hashes can be squeezed.
+        """
+        with self.assertRaises(ValueError):
+            Kerl().squeeze_bytes(50)
+
+    def test_hash_chain(self):
+        """
+        Hashing a value several times in a row.
+        """
+        trits = list(self.trits[0:243])
+        for _ in range(5):
+            kerl = Kerl()
+            kerl.absorb(trits)
+            kerl.squeeze(trits)
+
+        self.assertEqual(
+          Kerl.hash_chain(trits_to_int(self.trits[0:243]), 5),
+          trits_to_int(trits),
+        )
+
+        self.assertEqual(
+          Kerl.hash_chain(trits_to_bytes(self.trits[0:242]), 5),
+          trits_to_int(trits),
+        )
+
+    def test_hash_chain_zero_iterations(self):
+        """
+        Hashing a value zero times leaves it unchanged.
+        """
+        value = trits_to_int(self.trits[0:243])
+        self.assertEqual(Kerl.hash_chain(value, 0), value)
@@ -0,0 +1,189 @@
+from threading import Thread
+from time import sleep
+from unittest import TestCase, skipIf
+
+from iota import Transaction, TransactionHash, TransactionTrytes, TryteString
+from iota.crypto.pearl_diver import PearlDiver
+from iota.crypto.pycurl import Curl
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def curl_hash(trytes: TryteString) -> TransactionHash:
+    """
+    Computes the hash of a transaction using the scalar sponge.
+    """
+    sponge = Curl()
+    sponge.absorb(trytes.as_trits())
+
+    trits_out = []
+    sponge.squeeze(trits_out)
+
+    return TransactionHash.from_trits(trits_out)
+
+
+class PearlDiverTestCase(TestCase):
+    def setUp(self):
+        super(PearlDiverTestCase, self).setUp()
+
+        self.trytes = TransactionTrytes(TryteString.random(2673))
+        self.trunk = TransactionHash(TryteString.random(81))
+        self.branch = TransactionHash(TryteString.random(81))
+
+    def assertValidNonce(self, trytes, nonce, hash_, mwm):
+        """
+        The nonce produces the expected hash, which ends with ``mwm``
+        zero trits.
+        """
+        self.assertEqual(curl_hash(trytes[0:2646] + nonce), hash_)
+        self.assertEqual(hash_.as_trits()[-mwm:], [0] * mwm)
+
+    def test_search_python(self):
+        """
+        Searching for a nonce using the pure-Python backend.
+        """
+        nonce, hash_ = PearlDiver(workers=0, backend='python').search(
+            self.trytes,
+            7,
+        )
+
+        self.assertValidNonce(self.trytes, nonce, hash_, 7)
+
+    @skipIf(np is None, 'NumPy is not installed.')
+    def test_search_numpy(self):
+        """
+        Searching for a nonce using the NumPy backend.
+        """
+        nonce, hash_ = PearlDiver(workers=0, backend='numpy').search(
+            self.trytes,
+            9,
+        )
+
+        self.assertValidNonce(self.trytes, nonce, hash_, 9)
+
+    def test_search_workers(self):
+        """
+        Spreading the search across worker processes.
+        """
+        diver = PearlDiver(workers=2)
+
+        try:
+            nonce, hash_ = diver.search(self.trytes, 7)
+        finally:
+            diver.close()
+
+        self.assertValidNonce(self.trytes, nonce, hash_, 7)
+
+    def test_attach_to_tangle(self):
+        """
+        Attaching a bundle chains the transactions together.
+        """
+        head = TransactionTrytes(TryteString.random(2673))
+        tail = TransactionTrytes(TryteString.random(2673))
+
+        attached = PearlDiver(workers=0).attach_to_tangle(
+            self.trunk,
+            self.branch,
+            [head, tail],
+            5,
+        )
+
+        # Transactions are returned in reverse order.
+        txn_tail, txn_head = [
+            Transaction.from_tryte_string(t) for t in attached
+        ]
+
+        self.assertEqual(txn_head.trunk_transaction_hash, self.trunk)
+        self.assertEqual(txn_head.branch_transaction_hash, self.branch)
+
+        self.assertEqual(txn_tail.trunk_transaction_hash, txn_head.hash)
+        self.assertEqual(txn_tail.branch_transaction_hash, self.trunk)
+
+        for txn, original in ((txn_head, head), (txn_tail, tail)):
+            self.assertEqual(txn.hash.as_trits()[-5:], [0] * 5)
+            self.assertEqual(txn.address, original[2187:2268])
+            self.assertEqual(txn.attachment_timestamp_lower_bound, 0)
+            self.assertEqual(
+                txn.attachment_timestamp_upper_bound,
+                (3 ** 27 - 1) // 2,
+            )
+            self.assertGreater(txn.attachment_timestamp, 0)
+
+    def test_interrupt(self):
+        """
+        Interrupting a search that would never finish.
+        """
+        diver = PearlDiver(workers=0)
+        result = []
+
+        thread = Thread(
+            target=lambda: result.append(
+                diver.attach_to_tangle(
+                    self.trunk,
+                    self.branch,
+                    [self.trytes],
+                    243,
+                ),
+            ),
+
+            daemon=True,
+        )
+
+        thread.start()
+
+        # Only a running search can be interrupted.
+        while not diver.is_searching:
+            sleep(0.01)
+
+        diver.interrupt()
+        thread.join(timeout=30)
+
+        self.assertFalse(diver.is_searching)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(result, [[]])
+
+    def test_interrupt_before_search(self):
+        """
+        An interrupt has no effect if no search is running.
+        """
+        diver = PearlDiver(workers=0)
+
+        self.assertFalse(diver.is_searching)
+        diver.interrupt()
+
+        self.assertIsNotNone(diver.search(self.trytes, 3))
+
+    def test_context_manager(self):
+        """
+        The worker processes are shut down when leaving the context.
+        """
+        with PearlDiver(workers=1) as diver:
+            diver.search(self.trytes, 3)
+            self.assertIsNotNone(diver._executor)
+
+        self.assertIsNone(diver._executor)
+
+    def test_invalid_min_weight_magnitude(self):
+        """
+        ``min_weight_magnitude`` can't be longer than a hash.
+        """
+        with self.assertRaises(ValueError):
+            PearlDiver(workers=0).search(self.trytes, 244)
+
+    def test_invalid_workers(self):
+        """
+        ``workers`` can't be negative.
+        """
+        with self.assertRaises(ValueError):
+            PearlDiver(workers=-1)
+
+    def test_invalid_backend(self):
+        """
+        Specifying a backend that doesn't exist.
+        """
+        with self.assertRaises(ValueError):
+            PearlDiver(backend='fortran')
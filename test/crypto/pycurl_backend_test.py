@@ -0,0 +1,142 @@
+from array import array
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from iota import TryteString
+from iota.crypto import pycurl
+from iota.crypto.pycurl import BACKEND_ENV_VAR, Curl, HASH_LENGTH
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CurlBackendTestCase(TestCase):
+    """
+    Covers backend selection for :py:class:`iota.crypto.pycurl.Curl`.
+    """
+
+    def setUp(self):
+        super(CurlBackendTestCase, self).setUp()
+
+        self.input_ = TryteString(
+            b'G9JYBOMPUXHYHKSNRNMMSSZCSHOFYOYNZRSZMAAYWDYEIMVVOGKPJB'
+            b'VBM9TDPULSFUNMTVXRKFIDOHUXXVYDLFSZYZTWQYTE9SPYYWYTXJYQ'
+            b'9IFGYOLZXWZBKWZN9QOOTBQMWMUBLEWUEEASRHRTNIQWJQNDWRYLCA'
+        ).as_trits()
+
+        self.expected = (
+            'RWCBOLRFANOAYQWXXTFQJYQFAUTEEBSZWTIRSSDR'
+            'EYGCNFRLHQVDZXYXSJKCQFQLJMMRHYAZKRRLQZDKR'
+        )
+
+    def test_default_backend(self):
+        """
+        The pure-Python backend is used by default.
+        """
+        with patch.dict('os.environ', clear=True):
+            self.assertEqual(Curl().backend, 'python')
+
+    def test_invalid_backend(self):
+        """
+        Specifying a backend that doesn't exist.
+        """
+        with self.assertRaises(ValueError):
+            Curl(backend='fortran')
+
+    def test_backend_from_environment(self):
+        """
+        The default backend can be selected via an environment variable.
+        """
+        with patch.dict('os.environ', {BACKEND_ENV_VAR: 'fortran'}):
+            with self.assertRaises(ValueError):
+                Curl()
+
+    def test_python_backend_array(self):
+        """
+        The pure-Python backend accepts arrays and memoryviews.
+        """
+        curl = Curl(backend='python')
+        curl.absorb(array('b', self.input_))
+
+        trits_out = array('b', [0] * HASH_LENGTH)
+        curl.squeeze(memoryview(trits_out))
+
+        self.assertEqual(
+            str(TryteString.from_trits(list(trits_out))),
+            self.expected,
+        )
+
+    @patch.object(pycurl, 'np', None)
+    def test_numpy_backend_unavailable(self):
+        """
+        Selecting the NumPy backend when NumPy is not installed.
+        """
+        with self.assertRaises(ImportError):
+            Curl(backend='numpy')
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class CurlNumpyBackendTestCase(TestCase):
+    """
+    Covers the NumPy backend of :py:class:`iota.crypto.pycurl.Curl`.
+    """
+
+    def test_same_as_python_backend(self):
+        """
+        Both backends produce the same hashes.
+        """
+        trits = TryteString.random(2673).as_trits()
+
+        hashes = []
+        for backend in ('python', 'numpy'):
+            curl = Curl(backend=backend)
+            curl.absorb(list(trits))
+
+            trits_out = []
+            curl.squeeze(trits_out, length=HASH_LENGTH * 2)
+            hashes.append(trits_out)
+
+        self.assertEqual(hashes[0], hashes[1])
+
+        for trit in hashes[1]:
+            self.assertIs(type(trit), int)
+
+    def test_backend_from_environment(self):
+        """
+        Selecting the NumPy backend via an environment variable.
+        """
+        with patch.dict('os.environ', {BACKEND_ENV_VAR: 'numpy'}):
+            self.assertEqual(Curl().backend, 'numpy')
+
+    def test_numpy_arrays(self):
+        """
+        Absorbing from and squeezing into NumPy arrays.
+        """
+        trits = TryteString.random(200).as_trits()
+
+        curl = Curl(backend='python')
+        curl.absorb(list(trits))
+        expected = []
+        curl.squeeze(expected)
+
+        curl = Curl(backend='numpy')
+        # Length is not a multiple of 243; the remainder is padded with
+        # zeros.
+        curl.absorb(np.array(trits, dtype=np.int8))
+
+        trits_out = np.zeros(HASH_LENGTH, dtype=np.int8)
+        curl.squeeze(trits_out)
+
+        self.assertEqual(trits_out.tolist(), expected)
+
+    def test_squeeze_array_too_short(self):
+        """
+        Arrays can't be extended, so they must be long enough to hold the
+        squeezed trits.
+        """
+        curl = Curl(backend='numpy')
+
+        with self.assertRaises(ValueError):
+            curl.squeeze(np.zeros(HASH_LENGTH, dtype=np.int8), length=HASH_LENGTH * 2)
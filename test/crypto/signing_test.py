@@ -340,6 +340,21 @@ class KeyGeneratorTestCase(TestCase):
       ],
     )
 
+  def test_get_keys_workers(self):
+    """
+    Spreading key generation across worker processes.
+    """
+    kg = KeyGenerator(
+      seed =
+        b'TESTVALUE9DONTUSEINPRODUCTION99999DCZGVE'
+        b'JIZEKEGEEHYE9DOHCHLHMGAFDGEEQFUDVGGDGHRDR',
+    )
+
+    self.assertListEqual(
+      kg.get_keys(start=0, count=3, workers=2),
+      kg.get_keys(start=0, count=3),
+    )
+
   def test_get_keys_error_start_too_small(self):
     """
     Providing a negative ``start`` value to ``get_keys``.
@@ -1,8 +1,11 @@
+from unittest import TestCase
+
 import filters as f
 from filters.test import BaseFilterTestCase
 
-from iota import Address, TransactionHash, TryteString
-from iota.filters import AddressNoChecksum, GeneratedAddress, NodeUri, Trytes
+from iota import Address, TransactionHash, TransactionTrytes, TryteString
+from iota.filters import AddressNoChecksum, GeneratedAddress, NodeUri, \
+  StringifiedTrytesArray, Trytes, TrytesArray, is_trusted, trusted_values
 
 
 class GeneratedAddressTestCase(BaseFilterTestCase):
@@ -260,3 +263,178 @@ class AddressNoChecksumTestCase(BaseFilterTestCase):
     self.assertFilterErrors(
       self.address_with_bad_checksum,
       [AddressNoChecksum.ADDRESS_BAD_CHECKSUM])
+
+  def test_pass_with_checksum_trusted(self):
+    """
+    In trusted mode, Address objects with a valid checksum pass.
+    """
+    with trusted_values():
+      self.assertFilterPasses(self.address_with_checksum, self.address)
+
+  def test_fail_bad_checksum_trusted(self):
+    """
+    In trusted mode, checksums are still verified.
+    """
+    with trusted_values():
+      self.assertFilterErrors(
+        self.address_with_bad_checksum,
+        [AddressNoChecksum.ADDRESS_BAD_CHECKSUM])
+
+
+class StringifiedTrytesArrayTestCase(BaseFilterTestCase):
+  filter_type = lambda self: StringifiedTrytesArray(TransactionHash)
+
+  def setUp(self):
+    super(StringifiedTrytesArrayTestCase, self).setUp()
+
+    self.hashes = [
+      TransactionHash(b'A' * 81),
+      TransactionHash(b'B' * 81),
+    ]
+
+  def test_pass_none(self):
+    """
+    ``None`` always passes this filter.
+    """
+    self.assertFilterPasses(None)
+
+  def test_pass_typed_values(self):
+    """
+    Typed values are converted to strings.
+    """
+    self.assertFilterPasses(self.hashes, ['A' * 81, 'B' * 81])
+
+    with trusted_values():
+      self.assertFilterPasses(self.hashes, ['A' * 81, 'B' * 81])
+
+  def test_pass_mixed_values_trusted(self):
+    """
+    In trusted mode, values that don't have the expected type are still
+    validated.
+    """
+    with trusted_values():
+      self.assertFilterPasses(
+        [self.hashes[0], b'B' * 81],
+        ['A' * 81, 'B' * 81],
+      )
+
+  def test_fail_contents_invalid_trusted(self):
+    """
+    In trusted mode, invalid values that don't have the expected type
+    still fail.
+    """
+    with trusted_values():
+      self.assertFilterErrors(
+        [self.hashes[0], b'not valid; tryte sequence'],
+
+        {
+          '1': [Trytes.CODE_NOT_TRYTES],
+        },
+      )
+
+
+class TrytesArrayTestCase(BaseFilterTestCase):
+  filter_type = lambda self: TrytesArray(TransactionHash)
+
+  def test_pass_none(self):
+    """
+    ``None`` always passes this filter.
+    """
+    self.assertFilterPasses(None)
+
+  def test_pass_empty(self):
+    """
+    Incoming value is an empty array.
+    """
+    self.assertFilterPasses([])
+
+  def test_pass_strings(self):
+    """
+    Incoming value is an array of strings, as decoded from JSON.
+    """
+    runner = self._filter(['A' * 81, 'B' * 80])
+
+    self.assertFilterPasses(
+      runner,
+      [TransactionHash(b'A' * 81), TransactionHash(b'B' * 80)],
+    )
+
+    for value in runner.cleaned_data:
+      self.assertIsInstance(value, TransactionHash)
+
+    # Short values are padded, the same as the TransactionHash
+    # initializer does.
+    self.assertEqual(runner.cleaned_data[1], TransactionHash(b'B' * 80 + b'9'))
+
+  def test_pass_tryte_string(self):
+    """
+    Converting to a generic TryteString, which has no length limit.
+    """
+    self.filter_type = TrytesArray
+
+    runner = self._filter(['A' * 2673])
+
+    self.assertFilterPasses(runner, [TryteString(b'A' * 2673)])
+    self.assertIs(type(runner.cleaned_data[0]), TryteString)
+
+  def test_pass_mixed_types(self):
+    """
+    Items that are not strings are converted one at a time.
+    """
+    self.assertFilterPasses(
+      ['A' * 81, b'B' * 81, TryteString(b'C' * 81)],
+
+      [
+        TransactionHash(b'A' * 81),
+        TransactionHash(b'B' * 81),
+        TransactionHash(b'C' * 81),
+      ],
+    )
+
+  def test_fail_contents_invalid(self):
+    """
+    Incoming value contains invalid tryte strings.
+    """
+    self.assertFilterErrors(
+      ['A' * 81, 'not valid; tryte sequence', 'A' * 82, '\u00e9'],
+
+      {
+        '1': [Trytes.CODE_NOT_TRYTES],
+        '2': [Trytes.CODE_WRONG_FORMAT],
+        '3': [Trytes.CODE_NOT_TRYTES],
+      },
+    )
+
+  def test_fail_too_long(self):
+    """
+    Incoming value contains a tryte string that is too long for the
+    result type.
+    """
+    self.filter_type = lambda: TrytesArray(TransactionTrytes)
+
+    self.assertFilterErrors(
+      ['A' * 2674],
+
+      {
+        '0': [Trytes.CODE_WRONG_FORMAT],
+      },
+    )
+
+
+class TrustedValuesTestCase(TestCase):
+  def test_trusted_values(self):
+    """
+    Enabling and disabling trusted mode.
+    """
+    self.assertFalse(is_trusted())
+
+    with trusted_values():
+      self.assertTrue(is_trusted())
+
+      with trusted_values(False):
+        self.assertFalse(is_trusted())
+
+      self.assertTrue(is_trusted())
+
+    self.assertFalse(is_trusted())
+
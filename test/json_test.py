@@ -0,0 +1,208 @@
+import json
+from unittest import TestCase
+
+from iota import Address, TryteString
+from iota.json import JSON_BACKENDS, JsonArrayStreamDecoder, dumps, \
+    get_json_backend, loads, orjson, set_json_backend, ujson
+from test import mock
+
+INSTALLED_BACKENDS = [
+    name
+    for name, module in zip(JSON_BACKENDS, (orjson, ujson, json))
+    if module is not None
+]
+
+
+class JsonBackendTestCase(TestCase):
+    def setUp(self):
+        super(JsonBackendTestCase, self).setUp()
+
+        self.addCleanup(set_json_backend, get_json_backend())
+
+    def test_default_backend(self):
+        """
+        The fastest installed backend is selected by default.
+        """
+        self.assertEqual(get_json_backend(), INSTALLED_BACKENDS[0])
+
+    def test_dumps(self):
+        """
+        Serializing objects that contain tryte sequences.
+        """
+        payload = {
+            'command': 'attachToTangle',
+            'trytes': [TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')],
+            'address': Address(b'A' * 81, balance=42),
+            'minWeightMagnitude': 14,
+        }
+
+        for name in INSTALLED_BACKENDS:
+            with self.subTest(backend=name):
+                set_json_backend(name)
+
+                body = dumps(payload)
+
+                self.assertIsInstance(body, bytes)
+                self.assertDictEqual(
+                    json.loads(body),
+
+                    {
+                        'command': 'attachToTangle',
+                        'trytes': ['RBTC9D9DCDQAEASBYBCCKBFA'],
+                        'address': payload['address'].as_json_compatible(),
+                        'minWeightMagnitude': 14,
+                    },
+                )
+
+    def test_dumps_error_not_serializable(self):
+        """
+        Attempting to serialize an unsupported object.
+        """
+        for name in INSTALLED_BACKENDS:
+            with self.subTest(backend=name):
+                set_json_backend(name)
+
+                with self.assertRaises(TypeError):
+                    dumps({'foo': object()})
+
+    def test_loads(self):
+        """
+        Deserializing bytes and strings.
+        """
+        for name in INSTALLED_BACKENDS:
+            with self.subTest(backend=name):
+                set_json_backend(name)
+
+                self.assertDictEqual(
+                    loads('{"message": "Hello, IOTA!"}'.encode('utf-8')),
+                    {'message': 'Hello, IOTA!'},
+                )
+
+                self.assertListEqual(loads('[1, 2]'), [1, 2])
+
+    def test_loads_error_invalid_json(self):
+        """
+        Attempting to deserialize invalid JSON.
+        """
+        for name in INSTALLED_BACKENDS:
+            with self.subTest(backend=name):
+                set_json_backend(name)
+
+                with self.assertRaises(ValueError):
+                    loads(b'EHLO iotatoken.com')
+
+    def test_set_backend_error_unknown(self):
+        """
+        Selecting a backend that doesn't exist.
+        """
+        with self.assertRaises(ValueError):
+            set_json_backend('simplejson')
+
+    def test_set_backend_error_not_installed(self):
+        """
+        Selecting a backend that is not installed.
+        """
+        missing = [
+            name for name in JSON_BACKENDS if name not in INSTALLED_BACKENDS
+        ]
+
+        if not missing:
+            self.skipTest('All JSON backends are installed.')
+
+        with self.assertRaises(ImportError):
+            set_json_backend(missing[0])
+
+
+class JsonArrayStreamDecoderTestCase(TestCase):
+    def setUp(self):
+        super(JsonArrayStreamDecoderTestCase, self).setUp()
+
+        self.document = json.dumps({
+            'duration': 12,
+            'nested': {'hashes': ['X'], 'other': [1, {'a': ']'}]},
+            'hashes': ['A' * 81, 'caf\u00e9', 123, -4.5e3, None, True],
+            'after': [1, 2],
+        }).encode('utf-8')
+
+    def test_feed_whole_document(self):
+        """
+        Decoding a document in a single chunk.
+        """
+        decoder = JsonArrayStreamDecoder('hashes')
+
+        self.assertListEqual(
+            decoder.feed(self.document),
+            ['A' * 81, 'caf\u00e9', 123, -4.5e3, None, True],
+        )
+
+        self.assertTrue(decoder.is_complete)
+        decoder.close()
+
+    def test_feed_chunks(self):
+        """
+        Decoding a document one byte at a time, including in the middle
+        of numbers and multi-byte characters.
+        """
+        decoder = JsonArrayStreamDecoder('hashes')
+        values = []
+
+        for i in range(len(self.document)):
+            values.extend(decoder.feed(self.document[i:i + 1]))
+
+        decoder.close()
+
+        self.assertListEqual(
+            values,
+            ['A' * 81, 'caf\u00e9', 123, -4.5e3, None, True],
+        )
+
+    def test_feed_long_value_in_chunks(self):
+        """
+        A value spread across many chunks is only parsed again once a
+        delimiter arrives.
+        """
+        decoder = JsonArrayStreamDecoder('trytes')
+        trytes = 'A' * 2673
+
+        self.assertListEqual(decoder.feed('{"trytes": ["'), [])
+
+        with mock.patch.object(
+                decoder,
+                '_decode',
+                wraps=decoder._decode,
+        ) as mock_decode:
+            for i in range(0, len(trytes), 10):
+                self.assertListEqual(decoder.feed(trytes[i:i + 10]), [])
+
+            self.assertListEqual(decoder.feed('", "B"]}'), [trytes, 'B'])
+
+        decoder.close()
+
+        # Each value is only parsed once, after its delimiter arrived.
+        self.assertEqual(mock_decode.call_count, 2)
+
+    def test_feed_key_missing(self):
+        """
+        The document does not contain the requested key.
+        """
+        decoder = JsonArrayStreamDecoder('trytes')
+
+        self.assertListEqual(decoder.feed(self.document), [])
+        decoder.close()
+
+    def test_feed_error_not_object(self):
+        """
+        The document is not a JSON object.
+        """
+        with self.assertRaises(ValueError):
+            JsonArrayStreamDecoder('hashes').feed(b'["A", "B"]')
+
+    def test_close_error_incomplete(self):
+        """
+        The document ends unexpectedly.
+        """
+        decoder = JsonArrayStreamDecoder('hashes')
+        self.assertListEqual(decoder.feed(b'{"hashes": ["A", "B'), ['A'])
+
+        with self.assertRaises(ValueError):
+            decoder.close()
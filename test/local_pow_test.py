@@ -1,6 +1,7 @@
 from iota import Iota, TryteString, TransactionHash, TransactionTrytes, \
     HttpAdapter, MockAdapter
 from iota.adapter.wrappers import RoutingWrapper
+from iota.crypto.pearl_diver import PearlDiver
 from unittest import TestCase
 import sys
 from unittest.mock import MagicMock, patch
@@ -161,4 +162,103 @@ class LocalPowTestCase(TestCase):
             # Result is the one returned by MockAdapter
             self.assertEqual(result['trytes'], self.bundle)
             # And not by mocked pow pkg
-            self.assertNotEqual(result['trytes'], self.ccurl_bundle)
\ No newline at end of file
+            self.assertNotEqual(result['trytes'], self.ccurl_bundle)
+    def test_builtin(self):
+        """
+        Test that ``local_pow='builtin'`` uses the built-in PoW engine,
+        even if the pow extension is installed.
+        """
+        with patch('pow.ccurl_interface.attach_to_tangle',
+                   MagicMock(return_value=self.ccurl_bundle)) as mocked_ccurl:
+            adapter = MockAdapter()
+            adapter.set_pearl_diver(PearlDiver(workers=0))
+
+            api = Iota(adapter, local_pow='builtin')
+            result = api.attach_to_tangle(
+                self.trunk,
+                self.branch,
+                self.bundle,
+                # Use a low value so that the test runs quickly.
+                5)
+            # Ccurl interface was not called
+            self.assertFalse(mocked_ccurl.called)
+            # Transactions are returned in reverse order, with the
+            # nonce filled in.
+            self.assertEqual(len(result['trytes']), 2)
+            self.assertEqual(
+                result['trytes'][0][0:2187],
+                self.bundle[1][0:2187],
+            )
+            self.assertTrue(result['trytes'][0][2646:2673])
+
+    def test_builtin_interrupt(self):
+        """
+        Test that interrupting is handled locally when using the
+        built-in PoW engine.
+        """
+        adapter = MockAdapter()
+        adapter.set_pearl_diver(MagicMock(is_searching=True))
+
+        api = Iota(adapter, local_pow='builtin')
+        api.interrupt_attaching_to_tangle()
+
+        self.assertTrue(adapter.get_pearl_diver().interrupt.called)
+        # The request was not sent to the node.
+        self.assertEqual(adapter.requests, [])
+
+    def test_builtin_interrupt_idle(self):
+        """
+        Test that interrupting has no effect when the built-in PoW
+        engine is not running.
+        """
+        adapter = MockAdapter()
+        adapter.set_pearl_diver(MagicMock(is_searching=False))
+
+        api = Iota(adapter, local_pow='builtin')
+        api.interrupt_attaching_to_tangle()
+
+        self.assertFalse(adapter.get_pearl_diver().interrupt.called)
+        self.assertEqual(adapter.requests, [])
+
+    def test_ccurl_interrupt(self):
+        """
+        Test that interrupting does not create a built-in PoW engine
+        when the pow extension is used.
+        """
+        adapter = MockAdapter()
+        adapter.seed_response('interruptAttachingToTangle', {})
+
+        api = Iota(adapter, local_pow=True)
+        api.interrupt_attaching_to_tangle()
+
+        self.assertIsNone(adapter.get_pearl_diver(create=False))
+
+    def test_invalid_local_pow(self):
+        """
+        Test that invalid ``local_pow`` values are rejected.
+        """
+        with self.assertRaises(ValueError):
+            Iota(MockAdapter(), local_pow='ccurl')
+
+    def test_falsy_local_pow(self):
+        """
+        Test that falsy ``local_pow`` values disable local PoW.
+        """
+        adapter = MockAdapter()
+        adapter.seed_response('attachToTangle', {
+            'trytes': self.bundle,
+        })
+
+        api = Iota(adapter, local_pow=None)
+        self.assertIs(adapter.local_pow, False)
+
+        result = api.attach_to_tangle(
+            self.trunk,
+            self.branch,
+            self.bundle,
+            self.mwm)
+        # The request was sent to the node.
+        self.assertEqual(result['trytes'], self.bundle)
+
+        api.set_local_pow(local_pow=0)
+        self.assertIs(adapter.local_pow, False)
@@ -0,0 +1,201 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from unittest import TestCase, skipIf
+
+from iota import Iota, StrictIota
+from iota.adapter import BadApiResponse, MockAdapter
+from iota.runner import EventLoopRunner, get_runner, uvloop
+from test import async_test
+
+
+class EventLoopRunnerTestCase(TestCase):
+    def setUp(self):
+        super(EventLoopRunnerTestCase, self).setUp()
+
+        self.runner = EventLoopRunner()
+        self.addCleanup(self.runner.stop)
+
+    def test_run(self):
+        """
+        Running a coroutine in the background thread.
+        """
+        async def get_thread_id():
+            return get_ident()
+
+        thread_id = self.runner.run(get_thread_id())
+
+        self.assertNotEqual(thread_id, get_ident())
+
+        # The same loop/thread is used for every call.
+        self.assertEqual(self.runner.run(get_thread_id()), thread_id)
+
+    def test_run_exception(self):
+        """
+        Exceptions raised by the coroutine are re-raised in the caller.
+        """
+        async def fail():
+            raise ValueError('fail')
+
+        with self.assertRaises(ValueError):
+            self.runner.run(fail())
+
+        # The runner is still usable afterwards.
+        self.assertEqual(self.runner.run(asyncio.sleep(0, 'ok')), 'ok')
+
+    def test_run_concurrently(self):
+        """
+        Submitting coroutines from several threads at once.
+        """
+        async def slow(value):
+            await asyncio.sleep(0.05)
+            return value
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(
+                lambda i: self.runner.run(slow(i)),
+                range(10),
+            ))
+
+        self.assertListEqual(results, list(range(10)))
+
+    @async_test
+    async def test_run_inside_event_loop(self):
+        """
+        Running a coroutine while the calling thread is already running
+        an event loop.
+        """
+        self.assertEqual(self.runner.run(asyncio.sleep(0, 'ok')), 'ok')
+
+    def test_run_from_runner_thread(self):
+        """
+        Calling :py:meth:`EventLoopRunner.run` from a coroutine running
+        on the same runner would deadlock.
+        """
+        async def nested():
+            self.runner.run(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            self.runner.run(nested())
+
+    def test_stop_and_restart(self):
+        """
+        Stopping the runner, then using it again.
+        """
+        self.runner.start()
+        self.assertTrue(self.runner.is_running)
+
+        self.runner.stop()
+        self.assertFalse(self.runner.is_running)
+
+        self.assertEqual(self.runner.run(asyncio.sleep(0, 'ok')), 'ok')
+        self.assertTrue(self.runner.is_running)
+
+    @skipIf(uvloop is not None, 'uvloop is installed.')
+    def test_uvloop_not_installed(self):
+        """
+        Requesting uvloop when it is not installed.
+        """
+        with self.assertRaises(ImportError):
+            EventLoopRunner(use_uvloop=True)
+
+    def test_default_runner(self):
+        """
+        Sync API instances share the default runner.
+        """
+        self.assertIs(get_runner(), get_runner())
+
+        adapter = MockAdapter()
+        adapter.seed_response('getNodeInfo', {'appName': 'IRI'})
+
+        api = StrictIota(adapter)
+        self.assertIsNone(api.runner)
+
+        api.get_node_info()
+        self.assertTrue(get_runner().is_running)
+
+
+class IotaMapTestCase(TestCase):
+    def setUp(self):
+        super(IotaMapTestCase, self).setUp()
+
+        self.adapter = MockAdapter()
+        self.api = Iota(self.adapter)
+
+        self.api.runner = EventLoopRunner()
+        self.addCleanup(self.api.runner.stop)
+
+    def test_map(self):
+        """
+        Calling an API method for each set of arguments.
+        """
+        for i in range(3):
+            self.adapter.seed_response('getNodeInfo', {'index': i})
+
+        results = self.api.map('get_node_info', [(), (), ()])
+
+        self.assertListEqual(
+            [result['index'] for result in results],
+            [0, 1, 2],
+        )
+
+    def test_map_argument_types(self):
+        """
+        Arguments can be dicts, tuples or single values.
+        """
+        for _ in range(3):
+            self.adapter.seed_response('getTrytes', {'trytes': []})
+
+        self.api.map(
+            self.api.get_trytes,
+            [
+                {'hashes': ['A' * 81]},
+                (['B' * 81],),
+                ['C' * 81],
+            ],
+        )
+
+        self.assertListEqual(
+            [request['hashes'] for request in self.adapter.requests],
+            [['A' * 81], ['B' * 81], ['C' * 81]],
+        )
+
+    def test_map_concurrency(self):
+        """
+        No more than ``concurrency`` calls run at the same time.
+        """
+        running = 0
+        max_running = 0
+
+        async def get_node_info(*args, **kwargs):
+            nonlocal running, max_running
+
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+            return {}
+
+        self.adapter.send_request = get_node_info
+
+        self.api.map('get_node_info', [()] * 10, concurrency=3)
+
+        self.assertEqual(max_running, 3)
+
+    def test_map_exception(self):
+        """
+        Exceptions raised by any call are re-raised.
+        """
+        self.adapter.seed_response('getNodeInfo', {})
+
+        with self.assertRaises(BadApiResponse):
+            # The second call has no seeded response.
+            self.api.map('get_node_info', [(), ()])
+
+    def test_map_error_concurrency(self):
+        """
+        ``concurrency`` must be positive.
+        """
+        with self.assertRaises(ValueError):
+            self.api.map('get_node_info', [()], concurrency=0)
@@ -1,7 +1,9 @@
 from unittest import TestCase
 
-from iota import Address, Bundle, BundleHash, Fragment, Hash, Nonce, Tag, \
-  Transaction, TransactionHash, TransactionTrytes
+from iota import Address, Bundle, BundleHash, Fragment, Hash, LazyTransaction, \
+  Nonce, Tag, Transaction, TransactionHash, TransactionTrytes, TryteString
+from iota.crypto.batch_curl import MIN_LANES
+from test import patch
 
 
 class BundleTestCase(TestCase):
@@ -369,6 +371,40 @@ They both licked their dry lips.
     # The only message that is treated differently is the invalid one.
     self.assertEqual(messages[0], '祝你好运�\x15')
 
+  def test_from_tryte_strings_small(self):
+    """
+    Small bundles are hashed one transaction at a time.
+    """
+    trytes = [
+      TransactionTrytes(TryteString.random(2673))
+        for _ in range(MIN_LANES - 1)
+    ]
+
+    with patch('iota.transaction.base.curl_hash_many') as mocked_hash_many:
+      bundle = Bundle.from_tryte_strings(trytes)
+
+    self.assertFalse(mocked_hash_many.called)
+    self.assertEqual(
+      sorted(str(txn.hash) for txn in bundle),
+      sorted(str(Transaction.from_tryte_string(t).hash) for t in trytes),
+    )
+
+  def test_from_tryte_strings_batched(self):
+    """
+    Larger bundles are hashed in a single batch.
+    """
+    trytes = [
+      TransactionTrytes(TryteString.random(2673))
+        for _ in range(MIN_LANES)
+    ]
+
+    bundle = Bundle.from_tryte_strings(trytes)
+
+    self.assertEqual(
+      sorted(str(txn.hash) for txn in bundle),
+      sorted(str(Transaction.from_tryte_string(t).hash) for t in trytes),
+    )
+
 
 class TransactionTestCase(TestCase):
   """
@@ -693,3 +729,105 @@ class TransactionTestCase(TestCase):
         b'EEVD99999999999999999999999999999'
       ),
     )
+
+
+class LazyTransactionTestCase(TestCase):
+  def setUp(self):
+    super(LazyTransactionTestCase, self).setUp()
+
+    self.transaction = Transaction(
+      hash_                             = None,
+      signature_message_fragment        = Fragment(b'HELLOIOTA'),
+      address                           = Address(b'TESTVALUE9DONTUSEINPRODUCTION'),
+      value                             = -42,
+      legacy_tag                        = Tag(b'LEGACY'),
+      timestamp                         = 1480690413,
+      current_index                     = 1,
+      last_index                        = 3,
+      bundle_hash                       = BundleHash(b'BUNDLE'),
+      trunk_transaction_hash            = TransactionHash(b'TRUNK'),
+      branch_transaction_hash           = TransactionHash(b'BRANCH'),
+      tag                               = Tag(b'TAG'),
+      attachment_timestamp              = 1480690414,
+      attachment_timestamp_lower_bound  = 1480690415,
+      attachment_timestamp_upper_bound  = 1480690416,
+      nonce                             = Nonce(b'NONCE'),
+    )
+
+    self.trytes = self.transaction.as_tryte_string()
+
+  def test_fields(self):
+    """
+    Decoding every field of a LazyTransaction.
+    """
+    expected = Transaction.from_tryte_string(self.trytes)
+    txn = LazyTransaction.from_tryte_string(self.trytes)
+
+    self.assertIsInstance(txn, Transaction)
+    self.assertDictEqual(txn.as_json_compatible(), expected.as_json_compatible())
+    self.assertFalse(txn.is_tail)
+    self.assertIsNone(txn.is_confirmed)
+
+    self.assertIsInstance(txn.bundle_hash, BundleHash)
+    self.assertIsInstance(txn.trunk_transaction_hash, TransactionHash)
+    self.assertEqual(txn.value, -42)
+
+  def test_fields_memoized(self):
+    """
+    Each field is only decoded once.
+    """
+    txn = LazyTransaction(self.trytes)
+
+    self.assertIs(txn.bundle_hash, txn.bundle_hash)
+    self.assertIs(txn.hash, txn.hash)
+
+  def test_hash_not_computed(self):
+    """
+    The hash is not computed unless it is accessed, and never if it was
+    provided.
+    """
+    txn_hash =\
+      TransactionHash(
+        b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'
+        b'DHTDZBVCAAIEZCQCXGEFYBXHNDJFZEBEVELA9HHEJ'
+      )
+
+    with patch('iota.transaction.base.Curl') as mocked_curl:
+      txn = LazyTransaction.from_tryte_string(self.trytes)
+      self.assertEqual(txn.current_index, 1)
+
+      txn = LazyTransaction.from_tryte_string(self.trytes, hash_=txn_hash)
+      self.assertIs(txn.hash, txn_hash)
+
+    mocked_curl.assert_not_called()
+
+  def test_hash_computed(self):
+    """
+    The hash is computed from the raw trytes when it is accessed.
+    """
+    self.assertEqual(
+      LazyTransaction(self.trytes).hash,
+      Transaction.from_tryte_string(self.trytes).hash,
+    )
+
+  def test_as_tryte_string(self):
+    """
+    Converting a LazyTransaction back into a TryteString.
+    """
+    txn = LazyTransaction(self.trytes)
+
+    self.assertEqual(txn.as_tryte_string(), self.trytes)
+
+    # Modified fields are reflected in the result.
+    txn.tag = Tag(b'NEWTAG')
+    self.assertEqual(
+      Transaction.from_tryte_string(txn.as_tryte_string()).tag,
+      Tag(b'NEWTAG'),
+    )
+
+  def test_error_wrong_length(self):
+    """
+    Attempting to create a LazyTransaction from too many trytes.
+    """
+    with self.assertRaises(ValueError):
+      LazyTransaction(self.trytes + b'A')
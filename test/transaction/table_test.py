@@ -0,0 +1,226 @@
+from unittest import TestCase, skipIf
+
+from iota import Address, Bundle, BundleHash, Fragment, LazyTransaction, \
+    Nonce, Tag, Transaction, TransactionHash, TransactionTable
+from iota.transaction.table import np
+
+
+def make_trytes(bundle, current_index, last_index, value, timestamp):
+    return Transaction(
+        hash_=None,
+        signature_message_fragment=Fragment(b''),
+        address=Address(b'TESTVALUE9DONTUSEINPRODUCTION'),
+        value=value,
+        timestamp=timestamp,
+        current_index=current_index,
+        last_index=last_index,
+        bundle_hash=BundleHash(bundle),
+        trunk_transaction_hash=TransactionHash(b''),
+        branch_transaction_hash=TransactionHash(b''),
+        tag=Tag(b'TAG'),
+        attachment_timestamp=timestamp * 1000,
+        attachment_timestamp_lower_bound=0,
+        attachment_timestamp_upper_bound=-1,
+        nonce=Nonce(b''),
+    ).as_tryte_string()
+
+
+@skipIf(np is None, 'NumPy is not installed.')
+class TransactionTableTestCase(TestCase):
+    def setUp(self):
+        super(TransactionTableTestCase, self).setUp()
+
+        # Two bundles, deliberately out of order.
+        self.trytes = [
+            make_trytes(b'BUNDLEB', 1, 1, 42, 1500000003),
+            make_trytes(b'BUNDLEA', 0, 2, -100, 1500000001),
+            make_trytes(b'BUNDLEB', 0, 1, -42, 1500000003),
+            make_trytes(b'BUNDLEA', 2, 2, 0, 1500000001),
+            make_trytes(b'BUNDLEA', 1, 2, 100, 1500000001),
+        ]
+
+        self.table = TransactionTable.from_tryte_strings(self.trytes)
+
+    def test_columns(self):
+        """
+        Decoding columns from transaction trytes.
+        """
+        transactions = [Transaction.from_tryte_string(t) for t in self.trytes]
+
+        self.assertEqual(len(self.table), 5)
+
+        for name in (
+                'value',
+                'timestamp',
+                'current_index',
+                'last_index',
+                'attachment_timestamp',
+                'attachment_timestamp_lower_bound',
+                'attachment_timestamp_upper_bound',
+        ):
+            with self.subTest(column=name):
+                self.assertEqual(getattr(self.table, name).dtype, np.int64)
+
+                self.assertListEqual(
+                    getattr(self.table, name).tolist(),
+                    [getattr(txn, name) for txn in transactions],
+                )
+
+        for name in ('address', 'bundle_hash', 'tag'):
+            with self.subTest(column=name):
+                self.assertListEqual(
+                    getattr(self.table, name).tolist(),
+                    [bytes(getattr(txn, name)) for txn in transactions],
+                )
+
+        self.assertListEqual(
+            self.table.is_tail.tolist(),
+            [False, True, True, False, False],
+        )
+
+    def test_from_get_trytes_response(self):
+        """
+        Creating a table from the (unfiltered) strings in a ``getTrytes``
+        response, with the hashes that were requested.
+        """
+        hashes = [bytes(TransactionHash(b'HASH' + b'9' * i)) for i in range(5)]
+
+        table = TransactionTable.from_tryte_strings(
+            [str(t) for t in self.trytes],
+            [h.decode('ascii') for h in hashes],
+        )
+
+        self.assertListEqual(table.hash.tolist(), hashes)
+        self.assertListEqual(table.value.tolist(), self.table.value.tolist())
+
+    def test_hash_computed(self):
+        """
+        Hashes are computed if they were not provided.
+        """
+        self.assertListEqual(
+            self.table.hash.tolist(),
+
+            [
+                bytes(Transaction.from_tryte_string(t).hash)
+                for t in self.trytes
+            ],
+        )
+
+    def test_getitem(self):
+        """
+        Accessing a single transaction.
+        """
+        txn = self.table[1]
+
+        self.assertIsInstance(txn, LazyTransaction)
+        self.assertEqual(txn.as_tryte_string(), self.trytes[1])
+        self.assertEqual(txn.value, -100)
+
+    def test_filter(self):
+        """
+        Selecting rows with a boolean mask.
+        """
+        filtered = self.table.filter(self.table.value > 0)
+
+        self.assertListEqual(filtered.value.tolist(), [42, 100])
+        self.assertListEqual(filtered.current_index.tolist(), [1, 1])
+
+        self.assertListEqual(
+            [txn.as_tryte_string() for txn in filtered],
+            [self.trytes[0], self.trytes[4]],
+        )
+
+    def test_filter_error_wrong_shape(self):
+        """
+        The mask must have one entry per transaction.
+        """
+        with self.assertRaises(ValueError):
+            self.table.filter([True, False])
+
+    def test_sort(self):
+        """
+        Sorting by one or more columns.
+        """
+        self.assertListEqual(
+            self.table.sort('timestamp', 'current_index').value.tolist(),
+            [-100, 100, 0, -42, 42],
+        )
+
+        # Stable descending sort: equal rows keep their original order.
+        self.assertListEqual(
+            self.table.sort('timestamp', reverse=True).value.tolist(),
+            [42, -42, -100, 0, 100],
+        )
+
+    def test_sort_error_no_columns(self):
+        """
+        At least one column is required.
+        """
+        with self.assertRaises(ValueError):
+            self.table.sort()
+
+    def test_group_by_bundle(self):
+        """
+        Grouping transactions by bundle hash.
+        """
+        groups = list(self.table.group_by_bundle())
+
+        self.assertEqual(len(groups), 2)
+
+        # Groups are in order of first appearance, and sorted by
+        # ``current_index``.
+        self.assertEqual(
+            set(groups[0].bundle_hash.tolist()),
+            {bytes(BundleHash(b'BUNDLEB'))},
+        )
+        self.assertListEqual(groups[0].current_index.tolist(), [0, 1])
+        self.assertListEqual(groups[1].current_index.tolist(), [0, 1, 2])
+
+    def test_iter_bundles(self):
+        """
+        Converting groups into Bundle objects.
+        """
+        bundles = list(self.table.iter_bundles())
+
+        self.assertEqual(len(bundles), 2)
+
+        for bundle in bundles:
+            self.assertIsInstance(bundle, Bundle)
+
+        self.assertEqual(bundles[0].hash, BundleHash(b'BUNDLEB'))
+        self.assertEqual(bundles[0].tail_transaction.value, -42)
+        self.assertListEqual(
+            [txn.value for txn in bundles[1]],
+            [-100, 100, 0],
+        )
+
+    def test_empty(self):
+        """
+        Creating an empty table.
+        """
+        table = TransactionTable([])
+
+        self.assertEqual(len(table), 0)
+        self.assertListEqual(table.value.tolist(), [])
+        self.assertListEqual(list(table.group_by_bundle()), [])
+
+    def test_error_invalid_trytes(self):
+        """
+        Attempting to create a table from invalid trytes.
+        """
+        with self.assertRaises(ValueError):
+            TransactionTable([self.trytes[0], 'not valid'])
+
+    def test_error_too_long(self):
+        """
+        Attempting to create a table from values that are too long.
+        """
+        with self.assertRaises(ValueError):
+            TransactionTable([bytes(self.trytes[0]) + b'9'])
+
+    def test_error_hashes_mismatch(self):
+        """
+        The number of hashes must match the number of transactions.
+        """
+        with self.assertRaises(ValueError):
+            TransactionTable(self.trytes, [TransactionHash(b'')])
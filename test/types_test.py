@@ -2,7 +2,7 @@ from unittest import TestCase
 from warnings import catch_warnings, simplefilter as simple_filter
 
 from iota import Address, AddressChecksum, AsciiTrytesCodec, Hash, Tag, \
-  TryteString, TrytesDecodeError
+  TransactionTrytes, TryteString, TrytesDecodeError
 
 
 class TryteStringTestCase(TestCase):
@@ -214,6 +214,18 @@ class TryteStringTestCase(TestCase):
     # There's nothing in it, of course, but you can access it.
     self.assertEqual(ts[42:43], TryteString(b''))
 
+  def test_slice_accessor_copy(self):
+    """
+    Slices of a TryteString do not share data with the original.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+
+    sliced = ts[:4]
+    sliced[0] = TryteString(b'9')
+
+    self.assertEqual(sliced, TryteString(b'9BTC'))
+    self.assertEqual(ts, TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA'))
+
   def test_slice_mutator(self):
     """
     Modifying slices of a TryteString.
@@ -882,6 +894,91 @@ class TryteStringTestCase(TestCase):
       b'RBTC',
     )
 
+  def test_from_trits_round_trip(self):
+    """
+    Converting every tryte into trits and back again.
+    """
+    alphabet = b'9ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    trytes = TryteString(alphabet)
+
+    self.assertListEqual(
+      trytes.as_integers(),
+      list(range(14)) + list(range(-13, 0)),
+    )
+    self.assertEqual(bytes(TryteString.from_trits(trytes.as_trits())), alphabet)
+
+    hash_ = Hash.from_trits(Hash(alphabet).as_trits())
+    self.assertIsInstance(hash_, Hash)
+    self.assertEqual(hash_, Hash(alphabet))
+
+  def test_from_trytes_non_canonical(self):
+    """
+    Converting trytes that are not represented as exactly 3 trits.
+    """
+    self.assertEqual(
+      bytes(TryteString.from_trytes([[1, 1], [0, 0, 0, 0], [-1]])),
+      b'D9Z',
+    )
+
+  def test_packed_round_trip(self):
+    """
+    Packing a TryteString into bytes and back again.
+    """
+    trytes = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+
+    packed = trytes.to_packed()
+
+    self.assertIsInstance(packed, bytes)
+    # 24 trytes = 72 trits = 15 bytes (last byte padded).
+    self.assertEqual(len(packed), 15)
+    self.assertEqual(TryteString.from_packed(packed, len(trytes)), trytes)
+
+  def test_from_packed_length(self):
+    """
+    Removing the extra tryte that was created by padding.
+    """
+    for trytes in (b'AB', b'ABCD', b'ABC9', b'ABCDE'):
+      with self.subTest(trytes=trytes):
+        self.assertEqual(
+          bytes(TryteString.from_packed(
+            TryteString(trytes).to_packed(),
+            len(trytes),
+          )),
+
+          trytes,
+        )
+
+  def test_from_packed_error_no_length(self):
+    """
+    The length is required for types that don't define one.
+    """
+    with self.assertRaises(TypeError):
+      TryteString.from_packed(TryteString(b'AB').to_packed())
+
+  def test_from_packed_subclass(self):
+    """
+    Unpacking into a subclass uses its length.
+    """
+    txn_trytes = TransactionTrytes(b'RBTC9D9DCDQAEASBYBCCKBFA' * 100)
+
+    packed = txn_trytes.to_packed()
+    self.assertEqual(len(packed), 1604)
+
+    unpacked = TransactionTrytes.from_packed(packed)
+    self.assertIsInstance(unpacked, TransactionTrytes)
+    self.assertEqual(unpacked, txn_trytes)
+
+    tag = Tag.from_packed(Tag(b'TAG').to_packed())
+    self.assertIsInstance(tag, Tag)
+    self.assertEqual(tag, Tag(b'TAG'))
+
+  def test_from_packed_error_invalid_byte(self):
+    """
+    Attempting to unpack a byte that does not represent 5 trits.
+    """
+    with self.assertRaises(ValueError):
+      TryteString.from_packed(b'\x7a', 1)
+
 class HashTestCase(TestCase):
   def test_random(self):
     """